@@ -0,0 +1,70 @@
+"""
+Benchmark of loading members into Bans.
+
+Compares the old one-by-one insertion (linear duplicate scan plus a full sort after
+every append) with the bisect insertion of Bans.add_member and the bulk
+Bans.add_members path.
+
+Run from the src directory: python -m benchmarks.bench_bans
+"""
+import random
+import time
+
+from utils.Bans import Bans
+from utils.MemberData import MemberData
+
+SIZES = [1_000, 10_000, 100_000]
+# The old insertion is quadratic, above this size it would run for minutes
+LEGACY_LIMIT = 10_000
+
+
+def make_members(count, seed=0):
+    """Creates random members spread over all bans, with some duplicate names."""
+    rng = random.Random(seed)
+    bans = list(Bans().bans)
+    return [
+        MemberData(
+            voornaam=f"Voornaam{rng.randrange(count)}",
+            naam=f"Naam{rng.randrange(count)}",
+            ban=rng.choice(bans),
+        )
+        for _ in range(count)
+    ]
+
+
+def legacy_add_members(members):
+    """The insertion Bans used before the bulk path: scan, append and re-sort a plain list per member."""
+    bans = {ban: [] for ban in Bans().bans}
+    for member in members:
+        if member not in bans[member.ban]:
+            bans[member.ban].append(member)
+            bans[member.ban].sort(key=lambda m: (m.voornaam, m.naam))
+    return bans
+
+
+def incremental_add_members(members):
+    """Adds the members one at a time through Bans.add_member."""
+    bans = Bans()
+    for member in members:
+        bans.add_member(member)
+    return bans
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    print(f"{'members':>10} {'legacy (s)':>12} {'add_member (s)':>16} {'add_members (s)':>17}")
+    for size in SIZES:
+        members = make_members(size)
+        legacy = f"{timed(legacy_add_members, members):.3f}" if size <= LEGACY_LIMIT else "-"
+        incremental = timed(incremental_add_members, members)
+        bulk = timed(Bans().add_members, members)
+        print(f"{size:>10} {legacy:>12} {incremental:>16.3f} {bulk:>17.3f}")
+
+
+if __name__ == "__main__":
+    main()
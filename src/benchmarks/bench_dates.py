@@ -0,0 +1,63 @@
+"""
+Benchmark of the birthdate normalization.
+
+Compares the old strptime based format_date with the table-driven parser in
+utils.normalize, on 'yyyy-mm-dd' strings where many members share a birthdate.
+
+Run from the src directory: python -m benchmarks.bench_dates
+"""
+import random
+import time
+from datetime import date, datetime, timedelta
+
+from utils.normalize import format_date, parse_date
+
+COUNT = 100_000
+# Roughly the number of distinct birthdates in a large group
+DISTINCT_DATES = 4_000
+
+
+def legacy_format_date(date_input):
+    """format_date as it was before the parser: a single strptime format."""
+    if isinstance(date_input, datetime):
+        return date_input.strftime("%d/%m/%Y")
+    if not date_input:
+        return ""
+    try:
+        return datetime.strptime(date_input, "%Y-%m-%d").strftime("%d/%m/%Y")
+    except ValueError:
+        return date_input
+
+
+def make_dates(count, seed=0):
+    """Creates 'yyyy-mm-dd' birthdates drawn from a limited set of days."""
+    rng = random.Random(seed)
+    first = date(2000, 1, 1)
+    days = [(first + timedelta(days=rng.randrange(8000))).isoformat() for _ in range(DISTINCT_DATES)]
+    return [rng.choice(days) for _ in range(count)]
+
+
+def timed(func, values):
+    start = time.perf_counter()
+    for value in values:
+        func(value)
+    return time.perf_counter() - start
+
+
+def main():
+    dates = make_dates(COUNT)
+    legacy = timed(legacy_format_date, dates)
+    parse_date.cache_clear()
+    cached = timed(format_date, dates)
+    # Distinct dates only, so every call is a cache miss
+    distinct = list(dict.fromkeys(dates))
+    parse_date.cache_clear()
+    uncached = timed(format_date, distinct) * len(dates) / len(distinct)
+    print(f"{COUNT} dates, {len(distinct)} distinct")
+    print(f"{'strptime':>22} {legacy:>8.3f}s")
+    print(f"{'parser, no cache hits':>22} {uncached:>8.3f}s (extrapolated)")
+    print(f"{'parser with cache':>22} {cached:>8.3f}s ({legacy / cached:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark of the Excel export of a single ban.
+
+Compares export_bans_to_excel building the whole worksheet in memory with its
+write-only streaming mode, in rows per second and peak memory of the export.
+
+Run from the src directory: python -m benchmarks.bench_export
+"""
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from functools import partial
+
+from main import export_bans_to_excel
+from utils.Bans import Bans
+from utils.MemberData import MemberData
+
+SIZES = [1_000, 5_000, 20_000]
+BAN = "Knapen"
+
+
+def make_bans(count, seed=0):
+    """Creates a Bans object with count members in a single ban, every field filled in."""
+    rng = random.Random(seed)
+    members = [
+        MemberData(
+            voornaam=f"Voornaam{index}",
+            naam=f"Naam{rng.randrange(count)}",
+            emailadres=f"lid{index}@example.be",
+            telefoon=f"04{rng.randrange(10**8):08d}",
+            straat=f"Kerkstraat {rng.randrange(1, 200)}",
+            huisnummer=rng.randrange(1, 200),
+            gemeente=rng.choice(["9000", "2000", "Lokeren", "Sint-Niklaas"]),
+            geboortedatum=f"20{rng.randrange(5, 20):02d}-0{rng.randrange(1, 10)}-1{rng.randrange(10)}",
+            ban=BAN,
+        )
+        for index in range(count)
+    ]
+    return Bans(members)
+
+
+# The streaming mode of the export
+export_bans_streaming = partial(export_bans_to_excel, streaming=True)
+
+
+def timed(export, bans):
+    start = time.perf_counter()
+    export(bans, [BAN])
+    return time.perf_counter() - start
+
+
+def peak_memory(export, bans):
+    """Returns the peak memory allocated during the export, in MB."""
+    tracemalloc.start()
+    export(bans, [BAN])
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 2**20
+
+
+def main():
+    print(
+        f"{'rows':>8} {'in memory (rows/s)':>20} {'streaming (rows/s)':>20}"
+        f" {'in memory (MB)':>16} {'streaming (MB)':>16}"
+    )
+    # The exports write their files to the working directory
+    with tempfile.TemporaryDirectory() as directory:
+        cwd = os.getcwd()
+        os.chdir(directory)
+        try:
+            for size in SIZES:
+                bans = make_bans(size)
+                in_memory = size / timed(export_bans_to_excel, bans)
+                streaming = size / timed(export_bans_streaming, bans)
+                in_memory_peak = peak_memory(export_bans_to_excel, bans)
+                streaming_peak = peak_memory(export_bans_streaming, bans)
+                print(
+                    f"{size:>8} {in_memory:>20,.0f} {streaming:>20,.0f}"
+                    f" {in_memory_peak:>16.1f} {streaming_peak:>16.1f}"
+                )
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    main()
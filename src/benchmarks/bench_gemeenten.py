@@ -0,0 +1,89 @@
+"""
+Benchmark of typo-tolerant town matching.
+
+Matches noisy town names (typos, other casing) with utils.zipcodes.match_gemeente,
+which only compares the towns found through the trigram index, and with a brute-force
+difflib comparison against every town.
+
+Run from the src directory: python -m benchmarks.bench_gemeenten
+"""
+import random
+import time
+from difflib import SequenceMatcher
+
+from utils.zipcodes import gemeente_key, gemeenteIndex, match_gemeente
+
+COUNT = 50_000
+# Brute force compares every name with every town, it is timed on a sample and extrapolated
+BRUTE_FORCE_SAMPLE = 200
+
+
+def add_typo(name, rng):
+    """Returns the name with one typo and random casing."""
+    position = rng.randrange(len(name))
+    typo = rng.randrange(3)
+    if typo == 0:
+        # Letter left out
+        name = name[:position] + name[position + 1 :]
+    elif typo == 1:
+        # Letter typed twice
+        name = name[:position] + name[position] + name[position:]
+    elif position + 1 < len(name):
+        # Two letters swapped
+        name = name[:position] + name[position + 1] + name[position] + name[position + 2 :]
+    return rng.choice([name, name.upper(), name.lower()])
+
+
+def make_names(count, seed=0):
+    """Creates (noisy name, key of the intended town) pairs."""
+    rng = random.Random(seed)
+    towns = [(town, key) for key, (town, _) in gemeenteIndex.items() if len(key) >= 5]
+    pairs = []
+    for _ in range(count):
+        town, key = rng.choice(towns)
+        pairs.append((add_typo(town, rng), key))
+    return pairs
+
+
+def brute_force_match(name, keys, min_score=0.8):
+    """Compares the name to every town key and returns the most similar one."""
+    matcher = SequenceMatcher(b=gemeente_key(name), autojunk=False)
+    best, best_score = None, min_score
+    for key in keys:
+        matcher.set_seq1(key)
+        if matcher.real_quick_ratio() >= best_score and matcher.quick_ratio() >= best_score:
+            score = matcher.ratio()
+            if score >= best_score:
+                best, best_score = key, score
+    return best
+
+
+def main():
+    pairs = make_names(COUNT)
+    match_gemeente("")  # Nothing to match, but makes sure the module is loaded
+
+    start = time.perf_counter()
+    matches = [match_gemeente(name) for name, _ in pairs]
+    indexed = time.perf_counter() - start
+    correct = sum(
+        1 for (_, key), match in zip(pairs, matches) if match and gemeente_key(match[0][0]) == key
+    )
+
+    keys = list(gemeenteIndex)
+    sample = pairs[:BRUTE_FORCE_SAMPLE]
+    start = time.perf_counter()
+    brute_matches = [brute_force_match(name, keys) for name, _ in sample]
+    brute_force = (time.perf_counter() - start) * COUNT / len(sample)
+    brute_correct = sum(1 for (_, key), match in zip(sample, brute_matches) if match == key)
+
+    print(f"{COUNT} noisy names, {len(keys)} towns")
+    print(f"{'trigram index':>14} {indexed:>8.2f}s  {correct / COUNT:.1%} matched the intended town")
+    print(
+        f"{'brute force':>14} {brute_force:>8.2f}s  {brute_correct / len(sample):.1%} matched the intended town"
+        f" (extrapolated from {len(sample)} names)"
+    )
+    print(f"speedup {brute_force / indexed:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Memory benchmark of MemberData.
+
+Compares the bytes per member of the __slots__ based MemberData with the same
+class backed by a per-instance __dict__ (how MemberData used to be stored).
+
+Run from the src directory: python -m benchmarks.bench_memberdata
+"""
+import tracemalloc
+
+from utils.MemberData import MemberData
+
+COUNT = 50_000
+
+
+def dict_copy(cls):
+    """
+    Returns a copy of a slotted class without __slots__, so its instances store every field in a __dict__.
+
+    A subclass won't do: it inherits the slot descriptors, which keep storing the fields
+    in the slots and leave the subclass' __dict__ empty.
+    """
+    slots = set(cls.__slots__)
+    namespace = {
+        name: value
+        for name, value in vars(cls).items()
+        if name not in slots and name not in ("__slots__", "__dict__", "__weakref__")
+    }
+    return type(f"Dict{cls.__name__}", (), namespace)
+
+
+# MemberData as it was stored before __slots__, with the same methods and fields
+DictMemberData = dict_copy(MemberData)
+
+
+def make_rows(count):
+    """Creates spreadsheet rows with distinct names and addresses."""
+    return [
+        (
+            f"Voornaam{i}",
+            f"Naam{i}",
+            f"lid{i}@example.be",
+            "+32 470 12 34 56",
+            None,
+            f"Kerkstraat {i % 100}",
+            str(i % 200),
+            "9000",
+            "2012-05-03",
+            "Knapen (10-12 jaar)",
+        )
+        for i in range(count)
+    ]
+
+
+def measure(cls, rows):
+    """Returns the bytes allocated per member while constructing cls from every row."""
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    members = [cls(row=row) for row in rows]
+    allocated = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    del members
+    return allocated / len(rows)
+
+
+def main():
+    rows = make_rows(COUNT)
+    # Make sure the copy really stores its fields in the instance dictionary
+    assert "voornaam" in vars(DictMemberData(row=rows[0]))
+    with_dict = measure(DictMemberData, rows)
+    with_slots = measure(MemberData, rows)
+    print(f"{'class':>16} {'bytes/member':>14}")
+    print(f"{'__dict__':>16} {with_dict:>14.0f}")
+    print(f"{'__slots__':>16} {with_slots:>14.0f}")
+    print(f"saved {with_dict - with_slots:.0f} bytes per member ({1 - with_slots / with_dict:.0%})")
+
+
+if __name__ == "__main__":
+    main()
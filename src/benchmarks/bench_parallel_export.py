@@ -0,0 +1,65 @@
+"""
+Benchmark of exporting every ban to its own workbook with a growing number of worker processes.
+
+The speedup is bounded by the number of cores, which is printed with the results.
+
+Run from the src directory: python -m benchmarks.bench_parallel_export
+"""
+import os
+import random
+import tempfile
+import time
+
+from main import export_bans_to_excel
+from utils.Bans import Bans
+from utils.MemberData import MemberData
+
+MEMBERS_PER_BAN = 5_000
+JOBS = [1, 2, 4, 8]
+
+
+def make_bans(members_per_ban, seed=0):
+    """Creates a Bans object with members_per_ban members in every ban."""
+    rng = random.Random(seed)
+    bans = Bans()
+    bans.add_members(
+        MemberData(
+            voornaam=f"Voornaam{index}",
+            naam=f"Naam{rng.randrange(members_per_ban)}",
+            telefoon=f"04{rng.randrange(10**8):08d}",
+            straat=f"Kerkstraat {rng.randrange(1, 200)}",
+            huisnummer=rng.randrange(1, 200),
+            gemeente=rng.choice(["9000", "2000", "Lokeren", "Sint-Niklaas"]),
+            geboortedatum=f"20{rng.randrange(5, 20):02d}-0{rng.randrange(1, 10)}-1{rng.randrange(10)}",
+            ban=ban,
+        )
+        for ban in list(bans.bans)
+        for index in range(members_per_ban)
+    )
+    return bans
+
+
+def main():
+    bans = make_bans(MEMBERS_PER_BAN)
+    export_bans = list(bans.bans)
+    print(f"{len(export_bans)} bans of {MEMBERS_PER_BAN} members, {os.cpu_count()} cores")
+    print(f"{'jobs':>6} {'wall clock (s)':>16} {'speedup':>9}")
+
+    # The exports write their files to the working directory
+    with tempfile.TemporaryDirectory() as directory:
+        cwd = os.getcwd()
+        os.chdir(directory)
+        try:
+            baseline = None
+            for jobs in JOBS:
+                start = time.perf_counter()
+                export_bans_to_excel(bans, export_bans, jobs=jobs)
+                elapsed = time.perf_counter() - start
+                baseline = baseline or elapsed
+                print(f"{jobs:>6} {elapsed:>16.2f} {baseline / elapsed:>8.2f}x")
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    main()
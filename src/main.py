@@ -1,296 +1,307 @@
 import argparse
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from utils.MemberData import MemberData
 from utils.Bans import Bans
+from utils.SortedBan import SORT_ORDERS
+from utils.Households import Households
+from utils.Duplicates import Duplicates
+from utils.normalize import cache_stats
+from utils.SheetTemplate import SheetTemplate
+from utils.export_styles import DATA_STYLE, HEADER_STYLE, register_styles
 from openpyxl import Workbook, load_workbook
-from openpyxl.styles import Border, Side, Alignment, PatternFill, Font
-
-
-def export_bans_to_excel(bans, export_bans):
-    """Exports specified bans to an Excel file, creating separate sheets for each if no specific bans are given."""
-
-    # Define shorthand names for bans
-    ban_name_mapping = {
-        "Speelvogels": "SP",
-        "Piepedollen": "PP",
-        "Knapen": "KN",
-        "Krabbekoningen": "KR",
-        "Jonghernieuwers": "JH",
-        "Hernieuwers": "HN",
-        "Leiding" : "LD",
-        "Ondersteunend lid" : "OD"
-    }
-
-    # Check if any specific bans are given
+from openpyxl.utils import get_column_letter
+from tabulate import tabulate
+
+# Number of rows read from the Excel file before their columns are normalized together
+BATCH_SIZE = 1000
+
+# Define shorthand names for bans
+BAN_NAME_MAPPING = {
+    "Speelvogels": "SP",
+    "Piepedollen": "PP",
+    "Knapen": "KN",
+    "Krabbekoningen": "KR",
+    "Jonghernieuwers": "JH",
+    "Hernieuwers": "HN",
+    "Leiding" : "LD",
+    "Ondersteunend lid" : "OD"
+}
+
+# Member fields written to the exported sheets, one per column, with their table headers
+EXPORT_FIELDS = [
+    "voornaam",
+    "naam",
+    "telefoon",
+    "extra_telefoon",
+    "straat",
+    "huisnummer",
+    "gemeente",
+    "geboortedatum",
+]
+EXPORT_HEADERS = [
+    "Voornaam",
+    "Naam",
+    "Tel 1",
+    "Tel 2",
+    "Straat",
+    "HuisN°",
+    "Gemeente",
+    "Dob",
+]
+# Right-aligned fields, and extra width for Tel 2 to leave some space after Tel 1
+EXPORT_NUMBER_FIELDS = ("huisnummer",)
+EXPORT_EXTRA_WIDTHS = {"extra_telefoon": 5}
+
+# Workbooks handed to every worker process at most at once, the next one is ready when a worker finishes
+# without the rows of all workbooks waiting in the parent
+WORKBOOKS_PER_WORKER = 2
+
+
+def export_template(with_provincie=False):
+    """Returns the template of the exported sheets, with the optional columns after the member data."""
+    export_fields = list(EXPORT_FIELDS)
+    table_headers = list(EXPORT_HEADERS)
+    if with_provincie:
+        export_fields.append("provincie")
+        table_headers.append("Provincie")
+    return SheetTemplate(export_fields, table_headers, EXPORT_NUMBER_FIELDS, EXPORT_EXTRA_WIDTHS)
+
+
+def export_workbooks(bans, export_bans):
+    """
+    Returns the workbooks to export with the bans in each of them.
+
+    :return: list: (filename, ban names) tuples, a single workbook with all bans if no specific bans are given.
+    """
     if not len(export_bans):
-        # If no specific bans are provided, create a single workbook for all bans
-        workbook = Workbook()
-
-        for ban in bans.bans:
+        return [("bans_export.xlsx", list(bans.bans))]
+    # A separate workbook for each ban, named after the lowercase ban name
+    return [(f"{ban.lower()}.xlsx", [ban]) for ban in export_bans if ban in bans.bans]
+
+
+def workbook_sheets(bans, ban_names, template, streaming=False, materialize=False, progress=False):
+    """
+    Prepares the sheets of a workbook: (sheet name, title, rows, max lengths) per ban.
+
+    :param streaming: bool: Whether the workbook is write-only, its column widths are then measured here,
+        with a full pass over the members of every ban before the pass that writes them.
+    :param materialize: bool: Whether to turn the rows into lists, to send them to another process.
+    :param progress: bool: Whether to print every ban as it is prepared.
+    """
+    sheets = []
+    for ban in ban_names:
+        if progress:
             print(ban)
-            # Create a new sheet with the shorthand name
-            sheet = workbook.create_sheet(title=ban_name_mapping.get(ban, ban))
-            # Set default font for the entire sheet
-            default_font = Font(name="Verdana")  # Set the default font to Verdana
-            for row in sheet.iter_rows():
-                for cell in row:
-                    cell.font = default_font
-
-            # Create header
-            header = sheet.cell(
-                row=1, column=1, value=f"{ban.upper()} (   /{len(bans.bans[ban])})"
-            )
-            header.alignment = Alignment(horizontal="center", vertical="center")
-
-            # Set font for the header
-            header.font = Font(
-                name="Verdana", size=14, bold=True
-            )  # Font set to Verdana, 14pt
-
-            # Create border style for header
-            thin_border = Border(
-                left=Side(style="thin"),
-                right=Side(style="thin"),
-                top=Side(style="thin"),
-                bottom=Side(style="thin"),
-            )
-
-            # Apply border to the header
-            header.border = thin_border
-
-            # Merge header cells to take the entire width
-            number_of_columns = 8  # Number of columns for the member data
-            sheet.merge_cells(
-                start_row=1, start_column=1, end_row=1, end_column=number_of_columns
-            )
-
-            # Leave an empty row between the header and the table
-            empty_row = 3  # Set row 3 as the first row for the table headers
-
-            # Write the table headers with gray fill
-            table_headers = [
-                "Voornaam",
-                "Naam",
-                "Tel 1",
-                "Tel 2",
-                "Straat",
-                "HuisN°",
-                "Gemeente",
-                "Dob",
-            ]
-            gray_fill = PatternFill(
-                start_color="bfbfbf", end_color="bfbfbf", fill_type="solid"
-            )
-
-            for col_num, header in enumerate(table_headers, start=1):
-                cell = sheet.cell(row=empty_row, column=col_num, value=header)
-                cell.font = Font(name="Verdana", size=11, bold=False)
-                cell.fill = gray_fill  # Set background color to gray
-                # No border added to the table headers as per request
-
-            # Write the member data without borders
-            for row_num, member in enumerate(bans.bans[ban], start=empty_row + 1):
-                voornaam = sheet.cell(row=row_num, column=1, value=member.voornaam)
-                naam = sheet.cell(row=row_num, column=2, value=member.naam)
-                telefoon = sheet.cell(row=row_num, column=3, value=member.telefoon)
-                extra_telefoon = sheet.cell(
-                    row=row_num, column=4, value=member.extra_telefoon
-                )
-                straat = sheet.cell(row=row_num, column=5, value=member.straat)
-
-                # Store huisnummer as a number and right-align
-                huisnummer_cell = sheet.cell(
-                    row=row_num, column=6, value=member.huisnummer
-                )
-                huisnummer_cell.alignment = Alignment(
-                    horizontal="right"
-                )  # Right-align the cell
-
-                gemeente = sheet.cell(row=row_num, column=7, value=member.gemeente)
-                geboortedatum = sheet.cell(
-                    row=row_num, column=8, value=member.geboortedatum
-                )
-
-                # Set font for all member data
-                voornaam.font = Font(name="Verdana", size=11, bold=False)
-                naam.font = Font(name="Verdana", size=11, bold=False)
-                telefoon.font = Font(name="Verdana", size=11, bold=False)
-                extra_telefoon.font = Font(name="Verdana", size=11, bold=False)
-                straat.font = Font(name="Verdana", size=11, bold=False)
-                huisnummer_cell.font = Font(name="Verdana", size=11, bold=False)
-                gemeente.font = Font(name="Verdana", size=11, bold=False)
-                geboortedatum.font = Font(name="Verdana", size=11, bold=False)
-
-            # Adjust column widths based on the max length of content
-            for col_num in range(1, number_of_columns + 1):
-                max_length = 0
-                for row in range(1, row_num + 1):  # Check each row in the column
-                    cell_value = sheet.cell(row=row, column=col_num).value
-                    if cell_value:
-                        max_length = max(
-                            max_length, len(str(cell_value))
-                        )  # Get the maximum length
-                # Set column width with a little extra space
-                adjusted_width = max_length + 2  # Add some padding
-                # Use the column index to get the correct column letter
-                column_letter = chr(
-                    64 + col_num
-                )  # Convert number to letter (1 -> A, 2 -> B, ...)
-                sheet.column_dimensions[column_letter].width = adjusted_width
-
-            # Add additional space between "Tel 1" and "Tel 2" columns
-            extra_space = 5  # Adjust this value to increase or decrease the space
-            sheet.column_dimensions[
-                "D"
-            ].width += extra_space  # Increase width of "Tel 2"
-
+        title = template.title(ban, len(bans.bans[ban]))
+        rows = bans.iter_rows(ban, template.fields)
+        if materialize:
+            rows = list(rows)
+        max_lengths = None
+        if streaming:
+            # Write-only sheets need their column widths before the first row, so the members of the ban
+            # are read twice: once here for the lengths (only those are kept) and once more to write them
+            # Materialized rows are measured from the list instead
+            measured_rows = rows if materialize else bans.iter_rows(ban, template.fields)
+            max_lengths = template.measure(title, measured_rows)
+        # Create the sheet with the shorthand name
+        sheets.append((BAN_NAME_MAPPING.get(ban, ban), title, rows, max_lengths))
+    return sheets
+
+
+def render_workbook(filename, sheets, template, streaming=False):
+    """
+    Renders the sheets from workbook_sheets with the template and saves the workbook.
+
+    Only needs the row tuples, not the members, so it can run in a worker process.
+
+    :param streaming: bool: Whether to stream the rows to a write-only workbook, so no worksheet is built in memory.
+        The rows are then read a second time, after workbook_sheets measured the column widths over them.
+    :return: str: The filename of the saved workbook.
+    """
+    workbook = Workbook(write_only=streaming)
+    if not streaming:
         # Remove the default sheet created with the workbook
-        if "Sheet" in workbook.sheetnames:
-            std = workbook["Sheet"]
-            workbook.remove(std)
-
-        # Save the workbook with the name indicating it contains all bans
-        workbook.save("bans_export.xlsx")
-
+        workbook.remove(workbook.active)
+    register_styles(workbook)
+
+    for sheet_name, title, rows, max_lengths in sheets:
+        sheet = workbook.create_sheet(title=sheet_name)
+        if streaming:
+            template.render_streaming(sheet, title, rows, max_lengths)
+        else:
+            template.render(sheet, title, rows)
+
+    workbook.save(filename)
+    return filename
+
+
+def export_bans_to_excel(bans, export_bans, with_provincie=False, streaming=False, jobs=1):
+    """
+    Exports specified bans to separate Excel files, or all bans to a single file with a sheet each if no specific bans are given.
+
+    :param jobs: int: Number of worker processes rendering the separate files in parallel.
+    """
+    template = export_template(with_provincie)
+    workbooks = export_workbooks(bans, export_bans)
+
+    if jobs > 1 and len(workbooks) > 1:
+        # Every workbook is rendered and saved in a worker, which only gets the rows of its bans
+        workers = min(jobs, len(workbooks))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = set()
+            for filename, ban_names in workbooks:
+                # Only prepare the rows of the next workbook when a worker can take it soon
+                if len(pending) >= workers * WORKBOOKS_PER_WORKER:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    # Raise the first error of a worker, if any
+                    for future in done:
+                        future.result()
+                sheets = workbook_sheets(bans, ban_names, template, streaming, materialize=True)
+                pending.add(executor.submit(render_workbook, filename, sheets, template, streaming))
+            for future in pending:
+                future.result()
     else:
-        # If specific bans are given, create a separate workbook for each ban
-        for ban in export_bans:
-            if ban in bans.bans:
-                # Create a new workbook for the export
-                workbook = Workbook()
-                sheet = workbook.active
-                sheet.title = ban_name_mapping.get(ban,ban)
-                # Set default font for the entire workbook
-                default_font = Font(name="Verdana")  # Set the default font to Verdana
-                for row in sheet.iter_rows():
-                    for cell in row:
-                        cell.font = default_font
-
-                # Create header
-                header = sheet.cell(
-                    row=1, column=1, value=f"{ban.upper()} (   /{len(bans.bans[ban])})"
-                )
-                header.alignment = Alignment(horizontal="center", vertical="center")
-
-                # Set font for the header
-                header.font = Font(
-                    name="Verdana", size=14, bold=True
-                )  # Font set to Verdana, 14pt
-
-                # Create border style for header
-                thin_border = Border(
-                    left=Side(style="thin"),
-                    right=Side(style="thin"),
-                    top=Side(style="thin"),
-                    bottom=Side(style="thin"),
-                )
-
-                # Apply border to the header
-                header.border = thin_border
-
-                # Merge header cells to take the entire width
-                number_of_columns = 8  # Number of columns for the member data
-                sheet.merge_cells(
-                    start_row=1, start_column=1, end_row=1, end_column=number_of_columns
-                )
-
-                # Leave an empty row between the header and the table
-                empty_row = 3  # Set row 3 as the first row for the table headers
-
-                # Write the table headers with gray fill
-                table_headers = [
-                    "Voornaam",
-                    "Naam",
-                    "Tel 1",
-                    "Tel 2",
-                    "Straat",
-                    "HuisN°",
-                    "Gemeente",
-                    "Dob",
-                ]
-                gray_fill = PatternFill(
-                    start_color="bfbfbf", end_color="bfbfbf", fill_type="solid"
-                )
-
-                for col_num, header in enumerate(table_headers, start=1):
-                    cell = sheet.cell(row=empty_row, column=col_num, value=header)
-                    cell.font = Font(name="Verdana", size=11, bold=False)
-                    cell.fill = gray_fill  # Set background color to gray
-                    # No border added to the table headers as per request
-
-                # Write the member data without borders
-                for row_num, member in enumerate(bans.bans[ban], start=empty_row + 1):
-                    voornaam = sheet.cell(row=row_num, column=1, value=member.voornaam)
-                    naam = sheet.cell(row=row_num, column=2, value=member.naam)
-                    telefoon = sheet.cell(row=row_num, column=3, value=member.telefoon)
-                    extra_telefoon = sheet.cell(
-                        row=row_num, column=4, value=member.extra_telefoon
-                    )
-                    straat = sheet.cell(row=row_num, column=5, value=member.straat)
-
-                    # Store huisnummer as a number and right-align
-                    huisnummer_cell = sheet.cell(
-                        row=row_num, column=6, value=member.huisnummer
-                    )
-                    huisnummer_cell.alignment = Alignment(
-                        horizontal="right"
-                    )  # Right-align the cell
-
-                    gemeente = sheet.cell(row=row_num, column=7, value=member.gemeente)
-                    geboortedatum = sheet.cell(
-                        row=row_num, column=8, value=member.geboortedatum
-                    )
-
-                    # Set font for all member data
-                    voornaam.font = Font(name="Verdana", size=11, bold=False)
-                    naam.font = Font(name="Verdana", size=11, bold=False)
-                    telefoon.font = Font(name="Verdana", size=11, bold=False)
-                    extra_telefoon.font = Font(name="Verdana", size=11, bold=False)
-                    straat.font = Font(name="Verdana", size=11, bold=False)
-                    huisnummer_cell.font = Font(name="Verdana", size=11, bold=False)
-                    gemeente.font = Font(name="Verdana", size=11, bold=False)
-                    geboortedatum.font = Font(name="Verdana", size=11, bold=False)
-
-                # Adjust column widths based on the max length of content
-                for col_num in range(1, number_of_columns + 1):
-                    max_length = 0
-                    for row in range(1, row_num + 1):  # Check each row in the column
-                        cell_value = sheet.cell(row=row, column=col_num).value
-                        if cell_value:
-                            max_length = max(
-                                max_length, len(str(cell_value))
-                            )  # Get the maximum length
-                    # Set column width with a little extra space
-                    adjusted_width = max_length + 2  # Add some padding
-                    # Use the column index to get the correct column letter
-                    column_letter = chr(
-                        64 + col_num
-                    )  # Convert number to letter (1 -> A, 2 -> B, ...)
-                    sheet.column_dimensions[column_letter].width = adjusted_width 
-
-                # Add additional space between "Tel 1" and "Tel 2" columns
-                extra_space = 5  # Adjust this value to increase or decrease the space
-                sheet.column_dimensions[
-                    "D"
-                ].width += extra_space  # Increase width of "Tel 2"
-
-                # Save the workbook with the name corresponding to the ban
-
-                workbook.save(f"{ban.lower()}.xlsx")  # Save as lowercase ban name
-
-
-def main(filepath, bans_to_dump, export_bans):
-    # Load the Excel file
-    workbook = load_workbook(filename=filepath)
-    sheet = workbook.active
+        for filename, ban_names in workbooks:
+            sheets = workbook_sheets(bans, ban_names, template, streaming, progress=not len(export_bans))
+            render_workbook(filename, sheets, template, streaming)
 
-    # Assuming the data starts from the second row, with the first row as headers
-    members_list = []
-    for row in sheet.iter_rows(min_row=2, values_only=True):
-        member = MemberData(row=row)
-        members_list.append(member)
 
-    # Create a Bans object from the list of members
-    bans = Bans(members=members_list)
+def export_households_to_excel(households, filename="households.xlsx"):
+    """Exports one row per household, to send a single letter to members living together."""
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "Gezinnen"
+
+    # Write the table headers with gray fill
+    table_headers = ["Namen", "Straat", "HuisN°", "Gemeente", "Tel"]
+    register_styles(workbook)
+    for col_num, header in enumerate(table_headers, start=1):
+        cell = sheet.cell(row=1, column=col_num, value=header)
+        cell.style = HEADER_STYLE
+
+    # Write a row per household and keep the max length of every column
+    max_lengths = [len(header) for header in table_headers]
+    for row_num, row in enumerate(households.mailing_rows(), start=2):
+        for col_num, value in enumerate(row, start=1):
+            cell = sheet.cell(row=row_num, column=col_num, value=value)
+            cell.style = DATA_STYLE
+            if value:
+                max_lengths[col_num - 1] = max(max_lengths[col_num - 1], len(str(value)))
+
+    # Set column width with a little extra space
+    for col_num, max_length in enumerate(max_lengths, start=1):
+        sheet.column_dimensions[get_column_letter(col_num)].width = max_length + 2
+
+    workbook.save(filename)
+
+
+def iter_members(filepath, batch_hits=None, corrections=None):
+    """
+    Yields a MemberData object for every row of the Excel file, streaming the rows instead of loading the whole workbook.
+
+    :param batch_hits: Counter: Optional counter of the values reused within a batch, per cache (see cache_stats).
+    :param corrections: dict: Fixes mistyped gemeenten when given, recording every typed name -> town fixed in it.
+    """
+    # Open the Excel file read-only so rows are parsed lazily from the file
+    workbook = load_workbook(filename=filepath, read_only=True)
+    try:
+        sheet = workbook.active
+
+        # Assuming the data starts from the second row, with the first row as headers
+        rows = []
+        for row in sheet.iter_rows(min_row=2, values_only=True):
+            # Read-only sheets can report trailing rows without any values
+            if not any(row):
+                continue
+            rows.append(row)
+
+            # Normalize the rows in batches, keeping only one batch in memory
+            if len(rows) == BATCH_SIZE:
+                yield from MemberData.from_rows(rows, batch_hits, corrections)
+                rows = []
+        yield from MemberData.from_rows(rows, batch_hits, corrections)
+    finally:
+        # Read-only workbooks keep the file open until closed explicitly
+        workbook.close()
+
+
+def positive_int(value):
+    """Argument type for counts that must be at least 1, like --jobs."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def print_duplicates(duplicates):
+    """Prints the members that are likely registered twice."""
+    if not len(duplicates):
+        print("No duplicate members found.")
+        return
+
+    table_data = [
+        [
+            duplicate.first.voornaam,
+            duplicate.first.naam,
+            duplicate.first.ban,
+            duplicate.second.voornaam,
+            duplicate.second.naam,
+            duplicate.second.ban,
+            duplicate.reason,
+            f"{duplicate.score:.2f}",
+        ]
+        for duplicate in duplicates
+    ]
+    headers = ['Voornaam', 'Naam', 'Ban', 'Voornaam', 'Naam', 'Ban', 'Reden', 'Score']
+    print(f"\n=== Possible duplicates ({len(duplicates)}) ===")
+    print(tabulate(table_data, headers=headers, tablefmt='pretty'))
+
+
+def print_corrections(corrections):
+    """Prints the mistyped gemeenten that were replaced by a known town."""
+    if not corrections:
+        print("No gemeenten corrected.")
+        return
+
+    table_data = sorted(corrections.items())
+    print(f"\n=== Corrected gemeenten ({len(corrections)}) ===")
+    print(tabulate(table_data, headers=['Ingegeven', 'Gemeente'], tablefmt='pretty'))
+
+
+def print_cache_stats(batch_hits):
+    """Prints the hit rate of the normalization caches used while reading the members."""
+    for name, stats in cache_stats(batch_hits).items():
+        print(
+            f"{name} cache: {stats['hits']} hits ({stats['batch_hits']} within a batch), "
+            f"{stats['misses']} misses, {stats['size']} cached ({stats['hit_rate']:.1%} hit rate)"
+        )
+
+
+def main(
+    filepath,
+    bans_to_dump,
+    export_bans,
+    show_stats=False,
+    with_provincie=False,
+    export_households=False,
+    show_duplicates=False,
+    ignore_particles=False,
+    order="voornaam",
+    streaming=False,
+    jobs=1,
+    fix_gemeenten=False,
+):
+    # Values reused within a batch per cache, for the statistics
+    batch_hits = Counter()
+    # Mistyped gemeenten are only replaced by the most similar town when asked for, and listed afterwards
+    corrections = {} if fix_gemeenten else None
+    # Create a Bans object from the members streamed out of the Excel file
+    bans = Bans(
+        members=iter_members(filepath, batch_hits, corrections), ignore_particles=ignore_particles, order=order
+    )
+    if fix_gemeenten:
+        print_corrections(corrections)
 
     # Print the specified bans
     if bans_to_dump != None and len(bans_to_dump) != 0:
@@ -303,7 +314,16 @@ def main(filepath, bans_to_dump, export_bans):
     elif bans_to_dump != None and len(bans_to_dump) == 0:
         bans.print_table()
     if export_bans != None:
-        export_bans_to_excel(bans, export_bans)
+        export_bans_to_excel(bans, export_bans, with_provincie, streaming, jobs)
+    if export_households:
+        # Group the members of all bans into households and write one mailing row each
+        households = Households.from_bans(bans)
+        print(f"{len(households)} households")
+        export_households_to_excel(households)
+    if show_duplicates:
+        print_duplicates(Duplicates.from_bans(bans))
+    if show_stats:
+        print_cache_stats(batch_hits)
 
 
 if __name__ == "__main__":
@@ -319,5 +339,59 @@ if __name__ == "__main__":
     parser.add_argument(
         "--export", "-e", nargs="*", help="List of bans to export to separate Excel files.", default=None
     )
+    parser.add_argument(
+        "--stats", action="store_true", help="Print the hit rate of the normalization caches."
+    )
+    parser.add_argument(
+        "--provincie", action="store_true", help="Add a Provincie column to the exported Excel files."
+    )
+    parser.add_argument(
+        "--households", action="store_true", help="Export one mailing row per household to households.xlsx."
+    )
+    parser.add_argument(
+        "--duplicates", action="store_true", help="Print members that are likely registered twice."
+    )
+    parser.add_argument(
+        "--ignore-particles",
+        action="store_true",
+        help="Sort surnames on the part after 'van', 'de', ... ('Van den Berg' under B).",
+    )
+    parser.add_argument(
+        "--sort",
+        choices=SORT_ORDERS,
+        default="voornaam",
+        help="Order of the members in the printed and exported bans.",
+    )
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Stream the exported rows to write-only workbooks, for large bans "
+        "(every ban is read twice, to measure the column widths first).",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=positive_int,
+        default=1,
+        help="Number of processes exporting the separate ban files in parallel.",
+    )
+    parser.add_argument(
+        "--fix-gemeenten",
+        action="store_true",
+        help="Replace mistyped gemeenten by the most similar known town, and list the replacements.",
+    )
     args = parser.parse_args()
-    main(args.filepath, args.dump,  args.export)
+    main(
+        args.filepath,
+        args.dump,
+        args.export,
+        args.stats,
+        args.provincie,
+        args.households,
+        args.duplicates,
+        args.ignore_particles,
+        args.sort,
+        args.streaming,
+        args.jobs,
+        args.fix_gemeenten,
+    )
@@ -0,0 +1,63 @@
+import pytest
+
+from utils.Bans import Bans
+from utils.MemberData import MemberData
+from utils.SortedBan import SortedBan
+
+
+def members():
+    return [
+        MemberData(voornaam="Zoë", naam="Van den Berg", gemeente="9000", geboortedatum="2012-05-03", ban="Knapen"),
+        MemberData(voornaam="An", naam="Peeters", gemeente="Antwerpen", geboortedatum="03/05/2010", ban="Knapen"),
+        MemberData(voornaam="Émile", naam="Claes", gemeente="Brugge", ban="Knapen"),
+        MemberData(voornaam="Lien", naam="de Smet", gemeente="9000", geboortedatum="2011-01-01", ban="Leiding (+18)"),
+    ]
+
+
+def voornamen(members):
+    return [member.voornaam for member in members]
+
+
+@pytest.mark.parametrize(
+    "order, expected",
+    [
+        ("voornaam", ["An", "Émile", "Zoë"]),
+        ("naam", ["Émile", "An", "Zoë"]),
+        # Members without a birthdate come last
+        ("geboortedatum", ["An", "Zoë", "Émile"]),
+        ("gemeente", ["An", "Émile", "Zoë"]),
+    ],
+)
+def test_bans_are_sorted_in_the_given_order(order, expected):
+    bans = Bans(members(), order=order)
+    assert voornamen(bans.bans["Knapen"]) == expected
+    assert voornamen(bans.bans["Leiding"]) == ["Lien"]
+
+
+def test_sort_matches_sorting_on_creation():
+    bans = Bans(members())
+    for order in ("naam", "geboortedatum", "gemeente", "voornaam"):
+        bans.sort(order)
+        assert voornamen(bans.bans["Knapen"]) == voornamen(Bans(members(), order=order).bans["Knapen"])
+
+
+def test_particles_are_ignored_when_asked():
+    assert voornamen(Bans(members(), order="naam").bans["Knapen"]) == ["Émile", "An", "Zoë"]
+    assert voornamen(Bans(members(), order="naam", ignore_particles=True).bans["Knapen"]) == ["Zoë", "Émile", "An"]
+
+
+def test_added_members_keep_the_order():
+    ban = SortedBan(members()[:2], order="naam")
+    ban.add(members()[2])
+    assert voornamen(ban) == ["Émile", "An", "Zoë"]
+
+
+def test_unknown_order_is_refused():
+    with pytest.raises(ValueError):
+        SortedBan(order="ban")
+
+
+def test_iter_rows_follows_the_sorted_order():
+    bans = Bans(members())
+    assert list(bans.iter_rows("Knapen", ["voornaam"])) == [("An",), ("Émile",), ("Zoë",)]
+    assert list(bans.iter_rows("Knapen", ["voornaam", "provincie"]))[0] == ("An", "Antwerpen")
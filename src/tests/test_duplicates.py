@@ -0,0 +1,45 @@
+from utils.Duplicates import Duplicates
+from utils.MemberData import MemberData
+
+
+def pairs(duplicates):
+    return {(duplicate.first.voornaam, duplicate.second.voornaam, duplicate.reason) for duplicate in duplicates}
+
+
+def test_same_name_in_two_bans_is_a_duplicate():
+    duplicates = Duplicates(
+        [
+            MemberData(voornaam="Zoë", naam="De Smet", ban="Knapen"),
+            MemberData(voornaam="zoe", naam="de smet", ban="Leiding"),
+        ]
+    )
+    assert pairs(duplicates) == {("Zoë", "zoe", "naam")}
+
+
+def test_similar_names_sharing_a_birthdate_are_duplicates():
+    duplicates = Duplicates(
+        [
+            MemberData(voornaam="Jan", naam="Peeters", geboortedatum="2012-05-03", ban="Knapen"),
+            MemberData(voornaam="Jan", naam="Peters", geboortedatum="2012-05-03", ban="Leiding"),
+            # Not compared, no shared birthdate or phone number
+            MemberData(voornaam="Jan", naam="Peetres", geboortedatum="2013-05-03", ban="Leiding"),
+        ]
+    )
+    [duplicate] = duplicates
+    assert (duplicate.first.naam, duplicate.second.naam, duplicate.reason) == ("Peeters", "Peters", "geboortedatum")
+    assert duplicate.score >= 0.85
+
+
+def test_siblings_and_twins_are_not_duplicates():
+    duplicates = Duplicates(
+        [
+            MemberData(voornaam="Lien", naam="Peeters", telefoon="0470 11 22 33", ban="Knapen"),
+            MemberData(voornaam="Lies", naam="Peeters", telefoon="0470 11 22 33", ban="Knapen"),
+            MemberData(voornaam="Anna", naam="Claes", geboortedatum="2012-05-03", ban="Knapen"),
+            MemberData(voornaam="Hanna", naam="Claes", geboortedatum="2012-05-03", ban="Knapen"),
+            # Similar names, but another voornaam altogether
+            MemberData(voornaam="Bart", naam="Janssens", geboortedatum="2014-01-01", ban="Knapen"),
+            MemberData(voornaam="Bert", naam="Janssen", geboortedatum="2014-01-01", ban="Knapen"),
+        ]
+    )
+    assert len(duplicates) == 0
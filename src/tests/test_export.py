@@ -0,0 +1,68 @@
+import pytest
+from openpyxl import load_workbook
+
+from main import export_bans_to_excel
+from utils.Bans import Bans
+from utils.MemberData import MemberData
+
+
+@pytest.fixture
+def bans():
+    return Bans(
+        [
+            MemberData(
+                voornaam=f"Voornaam{index}",
+                naam=f"Naam{index % 7}",
+                telefoon=f"04701234{index:02d}",
+                straat=f"Kerkstraat {index}",
+                huisnummer=index,
+                gemeente=["9000", "2000", "Lokeren"][index % 3],
+                geboortedatum=f"2012-05-{index % 28 + 1:02d}",
+                ban=["Knapen", "Leiding"][index % 2],
+            )
+            for index in range(40)
+        ]
+    )
+
+
+def sheet_contents(path):
+    """Returns per sheet its cell values and styles, merged ranges and column widths."""
+    workbook = load_workbook(path)
+    contents = {}
+    for sheet in workbook.worksheets:
+        cells = [
+            (cell.coordinate, cell.value, cell.font.b, cell.font.sz, cell.fill.fgColor.rgb, cell.alignment.horizontal)
+            for row in sheet.iter_rows()
+            for cell in row
+            if cell.value is not None
+        ]
+        widths = {letter: dimension.width for letter, dimension in sheet.column_dimensions.items()}
+        contents[sheet.title] = (cells, sorted(map(str, sheet.merged_cells.ranges)), widths)
+    return contents
+
+
+@pytest.mark.parametrize("export_bans", [[], ["Knapen", "Leiding"]])
+@pytest.mark.parametrize("with_provincie", [False, True])
+def test_streaming_export_matches_regular_export(tmp_path, monkeypatch, bans, export_bans, with_provincie):
+    for mode in ("regular", "streaming"):
+        (tmp_path / mode).mkdir()
+        monkeypatch.chdir(tmp_path / mode)
+        export_bans_to_excel(bans, export_bans, with_provincie, streaming=mode == "streaming")
+
+    filenames = sorted(path.name for path in (tmp_path / "regular").iterdir())
+    assert filenames == sorted(path.name for path in (tmp_path / "streaming").iterdir())
+    assert filenames == (["knapen.xlsx", "leiding.xlsx"] if export_bans else ["bans_export.xlsx"])
+    for filename in filenames:
+        regular = sheet_contents(tmp_path / "regular" / filename)
+        assert regular == sheet_contents(tmp_path / "streaming" / filename)
+        assert regular
+
+
+def test_parallel_export_matches_sequential_export(tmp_path, monkeypatch, bans):
+    for jobs in (1, 2):
+        (tmp_path / str(jobs)).mkdir()
+        monkeypatch.chdir(tmp_path / str(jobs))
+        export_bans_to_excel(bans, ["Knapen", "Leiding"], jobs=jobs)
+
+    for filename in ("knapen.xlsx", "leiding.xlsx"):
+        assert sheet_contents(tmp_path / "1" / filename) == sheet_contents(tmp_path / "2" / filename)
@@ -0,0 +1,57 @@
+from utils.Households import Households
+from utils.MemberData import MemberData
+
+
+def member(voornaam, naam, straat=None, huisnummer=None, telefoon=None, extra_telefoon=None):
+    return MemberData(
+        voornaam=voornaam,
+        naam=naam,
+        telefoon=telefoon,
+        extra_telefoon=extra_telefoon,
+        straat=straat,
+        huisnummer=huisnummer,
+        gemeente="9000",
+        ban="Knapen",
+    )
+
+
+def test_members_sharing_an_address_or_phone_are_one_household():
+    households = Households(
+        [
+            member("An", "Claes", "Kerkstraat", "1"),
+            member("Wout", "Claes", "KERKSTRAAT", "1", telefoon="0470 11 22 33"),
+            # Shares a phone number with Wout only, but ends up in the same household
+            member("Lien", "Peeters", extra_telefoon="0470 11 22 33"),
+            member("Jan", "Jacobs", "Kerkstraat", "2"),
+        ]
+    )
+    assert sorted(len(household) for household in households) == [1, 3]
+
+
+def test_overly_shared_keys_are_ignored():
+    members = [member(f"Kind{index}", f"Naam{index}", telefoon="0470 11 22 33") for index in range(4)]
+    assert len(Households(members, max_size=3)) == 4
+    assert len(Households(members, max_size=4)) == 1
+
+
+def test_mailing_row_takes_address_and_phone_from_the_same_member():
+    households = Households(
+        [
+            member("An", "Claes", "Kerkstraat", "1", extra_telefoon="0470 11 22 33"),
+            member("Wout", "Claes", telefoon="0470 99 88 77", extra_telefoon="0470 11 22 33"),
+            member("Lien", "Claes", "Dorpsstraat", "5", telefoon="0470 11 22 33"),
+        ]
+    )
+    [row] = households.mailing_rows()
+    assert row == ["An Claes, Wout Claes, Lien Claes", "Dorpsstraat", "5", "Gent", "0470 11 22 33"]
+
+
+def test_mailing_row_falls_back_to_separate_picks():
+    households = Households(
+        [
+            member("An", "Claes", "Kerkstraat", "1", extra_telefoon="0470 11 22 33"),
+            member("Wout", "Claes", telefoon="0470 99 88 77", extra_telefoon="0470 11 22 33"),
+        ]
+    )
+    [row] = households.mailing_rows()
+    assert row == ["An Claes, Wout Claes", "Kerkstraat", "1", "Gent", "0470 99 88 77"]
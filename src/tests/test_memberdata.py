@@ -0,0 +1,56 @@
+from datetime import datetime
+
+from utils.MemberData import MemberData
+from utils.SortedBan import SortedBan
+
+ROW = (
+    "Jan",
+    "Peeters",
+    "jan@example.be",
+    "+32 470 12 34 56",
+    None,
+    "Kerkstraat 1",
+    "3",
+    "9300",
+    datetime(2012, 5, 3),
+    "Knapen (6-8)",
+)
+
+
+def test_names_equal_ignoring_case_and_accents():
+    first = MemberData(voornaam="Zoë", naam="De Smet", ban="Knapen")
+    second = MemberData(voornaam="ZOE", naam="de  smet", ban="Leiding")
+    assert first == second
+    assert hash(first) == hash(second)
+    assert first != MemberData(voornaam="Zoë", naam="Desmet", ban="Knapen")
+
+
+def test_sorted_ban_keeps_one_member_per_identity():
+    ban = SortedBan(
+        [
+            MemberData(voornaam="Zoë", naam="De Smet"),
+            MemberData(voornaam="zoe", naam="DE SMET"),
+            MemberData(voornaam="An", naam="Claes"),
+        ]
+    )
+    assert [member.voornaam for member in ban] == ["An", "Zoë"]
+    assert MemberData(voornaam="ZOË", naam="de smet") in ban
+
+
+def test_row_and_batch_are_normalized_the_same():
+    single = MemberData(row=ROW)
+    batch = MemberData.from_rows([ROW])[0]
+    for field in MemberData.__slots__:
+        assert getattr(single, field) == getattr(batch, field), field
+    assert single.telefoon == "0470 12 34 56"
+    assert single.geboortedatum == "03/05/2012"
+    assert single.geboortedag == datetime(2012, 5, 3).toordinal()
+    assert single.ban == "Knapen"
+    assert single.provincie == "Oost-Vlaanderen"
+
+
+def test_keyword_members_parse_their_date_once():
+    member = MemberData(voornaam="Jan", naam="Peeters", geboortedatum="3-5-12")
+    assert member.geboortedatum == "03/05/2012"
+    assert member.geboortedag == datetime(2012, 5, 3).toordinal()
+    assert MemberData(voornaam="Jan", geboortedatum="onbekend").geboortedag is None
@@ -0,0 +1,81 @@
+import doctest
+from collections import Counter
+
+import pytest
+
+import utils.normalize
+from utils.normalize import (
+    cache_stats,
+    excel_serial_to_date,
+    normalize_column,
+    normalize_phones,
+    parse_date,
+    pick_postcode,
+    resolve_gemeente,
+    resolve_gemeenten,
+)
+
+
+def test_parse_date_examples():
+    failed, attempted = doctest.testmod(utils.normalize)
+    assert attempted and not failed
+
+
+@pytest.mark.parametrize("serial", [10000, 41032, 99999])
+def test_five_digit_serials_are_dates(serial):
+    assert excel_serial_to_date(serial) is not None
+    assert parse_date(str(serial)) is not None
+
+
+@pytest.mark.parametrize("value", [9999, 100000, 2012, "2012", 1, 0, 1.5, True])
+def test_other_numbers_are_not_dates(value):
+    assert parse_date(value) is None
+
+
+def test_normalize_column_keeps_types_apart():
+    normalized, reused = normalize_column(repr, [1, 1.0, True, 1, "1"])
+    assert normalized == ["1", "1.0", "True", "1", "'1'"]
+    assert reused == 1
+
+
+def test_batch_hits_are_counted_per_cache():
+    batch_hits = Counter()
+    normalize_phones(["0470123456", "0470123456", "0470654321"], batch_hits)
+    assert batch_hits == {"phone": 1}
+    assert cache_stats(batch_hits)["phone"]["batch_hits"] == 1
+
+
+def test_postcode_of_town_in_several_provinces_is_unknown():
+    # Aalst is 3800 in Limburg and 9300 in Oost-Vlaanderen
+    assert resolve_gemeente("Aalst") == ("Aalst", None)
+    assert resolve_gemeente("Hamme") == ("Hamme", None)
+    assert resolve_gemeente("Sint Niklaas") == ("Sint-Niklaas", 9100)
+
+
+@pytest.mark.parametrize(
+    "straat, postcode",
+    [
+        ("Kerkstraat 1, 9300", 9300),
+        ("Kerkstraat 1,9300 Aalst", 9300),
+        ("Kerkstraat 3800", None),
+        ("Kerkstraat 9300, bus 3800", None),
+        ("Kerkstraat 1", None),
+        (None, None),
+    ],
+)
+def test_postcode_is_only_read_after_a_comma(straat, postcode):
+    assert pick_postcode((3800, 9300), straat) == postcode
+
+
+def test_ambiguous_towns_use_the_street():
+    resolved = resolve_gemeenten(
+        ["Aalst", "Aalst", "Nergensdorp"], ["Kerkstraat 1, 3800", "Kerkstraat 2", "Kerkstraat 3"]
+    )
+    assert resolved == [("Aalst", 3800), ("Aalst", None), ("Nergensdorp", None)]
+
+
+def test_mistyped_gemeenten_are_only_fixed_when_asked():
+    assert resolve_gemeenten(["Gentt"]) == [("Gentt", None)]
+    corrections = {}
+    assert resolve_gemeenten(["Gentt", "Gent"], corrections=corrections) == [("Gent", 9000), ("Gent", 9000)]
+    assert corrections == {"Gentt": "Gent"}
@@ -0,0 +1,29 @@
+import pytest
+
+from utils.provinces import lookup_province, lookup_provinces, lookup_region
+
+
+@pytest.mark.parametrize(
+    "postcode, province",
+    [
+        (1000, "Brussel"),
+        (1299, "Brussel"),
+        (1300, "Waals-Brabant"),
+        (2999, "Antwerpen"),
+        (3000, "Vlaams-Brabant"),
+        ("3800", "Limburg"),
+        (9999, "Oost-Vlaanderen"),
+        (999, ""),
+        (10000, ""),
+        (None, ""),
+        ("onbekend", ""),
+    ],
+)
+def test_province_of_postcode_range(postcode, province):
+    assert lookup_province(postcode) == province
+
+
+def test_regions_and_batches():
+    assert lookup_region(1000) == "Brussels Hoofdstedelijk Gewest"
+    assert lookup_region(4000) == "Wallonië"
+    assert lookup_provinces([3000, "9300", None]) == ["Vlaams-Brabant", "Oost-Vlaanderen", ""]
@@ -0,0 +1,32 @@
+import pytest
+
+from utils.zipcodes import gemeente_key, lookup_gemeente, lookup_postcode, towns_in_street
+
+
+@pytest.mark.parametrize(
+    "postcode, street, town",
+    [
+        # Street words that only contain a deelgemeente give the default town
+        (3960, "Beekstraat 3", "Tongerlo"),
+        (3700, "Kerkberg 2", "Widooie"),
+        (3945, "Hamelendreef 1", "Oostham"),
+        # Deelgemeenten named as whole words are picked
+        (3960, "Beek Dorp 3", "Beek"),
+        (3945, "Ham-Centrum 1", "Ham"),
+        (1300, "Rue de Limal 1", "Limal"),
+        (1300, None, "Wavre"),
+    ],
+)
+def test_deelgemeente_is_named_in_whole_words(postcode, street, town):
+    assert lookup_postcode(postcode, street) == town
+
+
+def test_towns_in_street_ignores_case_and_punctuation():
+    assert towns_in_street(("Beek", "Bree"), "BEEK-dorp 3") == ["Beek"]
+    assert towns_in_street(("Beek", "Bree"), 12) == []
+
+
+def test_lookup_gemeente_normalizes_spelling():
+    assert gemeente_key("St.-Niklaas") == gemeente_key("SINT NIKLAAS") == "sint niklaas"
+    assert lookup_gemeente("st niklaas") == ("Sint-Niklaas", (9100,))
+    assert lookup_gemeente("Nergensdorp") is None
@@ -1,19 +1,23 @@
+from operator import attrgetter
 from .MemberData import MemberData
+from .SortedBan import SortedBan
 from tabulate import tabulate  # Import the tabulate library
 
 
 class Bans:
-    def __init__(self, members=None):
-        # Dictionary to store bans with lists of MemberData objects
+    def __init__(self, members=None, ignore_particles=False, order="voornaam"):
+        # Dictionary to store bans with sorted collections of MemberData objects
+        # With ignore_particles surnames sort on the part after 'van', 'de', ...
+        # The members are sorted on order, one of SortedBan.SORT_ORDERS
         self.bans = {
-            "Piepedollen": [],
-            "Speelvogels": [],
-            "Krabbekoningen": [],
-            "Knapen": [],
-            "Jonghernieuwers": [],
-            "Hernieuwers": [],
-            "Leiding": [],
-            "Ondersteunend lid": []
+            "Piepedollen": SortedBan(ignore_particles=ignore_particles, order=order),
+            "Speelvogels": SortedBan(ignore_particles=ignore_particles, order=order),
+            "Krabbekoningen": SortedBan(ignore_particles=ignore_particles, order=order),
+            "Knapen": SortedBan(ignore_particles=ignore_particles, order=order),
+            "Jonghernieuwers": SortedBan(ignore_particles=ignore_particles, order=order),
+            "Hernieuwers": SortedBan(ignore_particles=ignore_particles, order=order),
+            "Leiding": SortedBan(ignore_particles=ignore_particles, order=order),
+            "Ondersteunend lid": SortedBan(ignore_particles=ignore_particles, order=order)
         }
 
         # If a list of members is provided, add them to the respective bans
@@ -21,46 +25,53 @@ class Bans:
             self.add_members(members)
 
     def add_member(self, member: MemberData):
-        """Adds a MemberData object to the appropriate ban category and maintains internal sorting."""
+        """Adds a MemberData object to the appropriate ban category at its sorted position."""
         if member.ban in self.bans:
-            if member not in self.bans[member.ban]:
-                self.bans[member.ban].append(member)
-                # Sort members by Voornaam and then by Naam after adding
-                self.bans[member.ban].sort(key=lambda m: (m.voornaam, m.naam))
+            self.bans[member.ban].add(member)
         else:
             print(f"Warning: {member.ban} is not a recognized ban category!")
 
-    def add_members(self, members: list):
-        """Adds a list of MemberData objects to the appropriate ban categories."""
+    def add_members(self, members):
+        """Adds an iterable of MemberData objects (a list or a generator) to the appropriate ban categories, sorting each ban once at the end."""
+        # Collect the new members per ban first, so every ban is only sorted once
+        new_members = {ban: [] for ban in self.bans}
+
         for member in members:
-            self.add_member(member)
+            if member.ban in self.bans:
+                new_members[member.ban].append(member)
+            else:
+                print(f"Warning: {member.ban} is not a recognized ban category!")
+
+        for ban, members_in_ban in new_members.items():
+            if members_in_ban:
+                self.bans[ban].update(members_in_ban)
+
+    def sort(self, order):
+        """
+        Sorts every ban in another order: voornaam, naam, geboortedatum or gemeente.
+
+        The bans are kept in the order given to the constructor, this re-sorts them for another view
+        with one keyed sort per ban, on keys computed when the members were created.
+        """
+        for members in self.bans.values():
+            members.sort(order)
+
+    def iter_rows(self, ban, fields=MemberData.FIELDS):
+        """Yields the members of a ban one row tuple at a time, in sorted order, without building a table."""
+        # attrgetter with several fields returns the tuple in one call, with a single field only the value
+        getter = attrgetter(*fields)
+        for member in self.bans.get(ban, []):
+            yield getter(member) if len(fields) > 1 else (getter(member),)
 
     def print_table(self):
         """Prints all members in a formatted table for each ban category."""
         for ban, members in self.bans.items():
             print(f"\nBan: {ban} ({len(members)} members)\n")
             if members:  # Check if there are members in the current ban
-                # Create a table from member data
-                table = [
-                    [
-                        member.voornaam,
-                        member.naam,
-                        member.emailadres,
-                        member.telefoon,
-                        member.extra_telefoon,
-                        member.straat,
-                        member.huisnummer,
-                        member.gemeente,
-                        member.geboortedatum,
-                        member.ban,
-                    ]
-                    for member in members
-                ]
-
-                # Print the table with headers
+                # Print the member data row by row with headers
                 print(
                     tabulate(
-                        table,
+                        list(self.iter_rows(ban)),
                         headers=[
                             "Voornaam",
                             "Naam",
@@ -88,23 +99,21 @@ class Bans:
             return
 
         # Prepare data for tabulate
-        table_data = []
-        for member in members:
-            table_data.append([
-                    member.voornaam,
-                    member.naam,
-                    member.emailadres,
-                    member.telefoon,
-                    member.straat,
-                    member.huisnummer,
-                    member.gemeente,
-                    member.geboortedatum
-                ])
+        rows = self.iter_rows(ban, [
+            "voornaam",
+            "naam",
+            "emailadres",
+            "telefoon",
+            "straat",
+            "huisnummer",
+            "gemeente",
+            "geboortedatum",
+        ])
 
         # Print header and table using tabulate
         headers = ['Voornaam', 'Naam', 'Emailadres', 'Telefoon', 'Straat', 'Huisnummer', 'Gemeente', 'Geboortedatum']
         print(f"\n=== Members in Ban: {ban} ===")
-        print(tabulate(table_data, headers=headers, tablefmt='pretty'))
+        print(tabulate(list(rows), headers=headers, tablefmt='pretty'))
 
     def __repr__(self):
         result = ""
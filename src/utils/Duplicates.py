@@ -0,0 +1,109 @@
+from collections import namedtuple
+from difflib import SequenceMatcher
+from .MemberData import MemberData
+
+# Two members registered twice, why they were matched and how similar their names are
+Duplicate = namedtuple("Duplicate", ["first", "second", "reason", "score"])
+
+# Lowest similarity of the names, and of the voornamen on their own, for members in the same block to be reported
+NAME_MATCH_SCORE = 0.85
+# Blocks larger than this (a leader's phone number on every child, say) are not compared pairwise
+MAX_BLOCK_SIZE = 50
+
+
+class Duplicates:
+    """Finds members that are likely registered twice, also across bans."""
+
+    def __init__(self, members=None, min_score=NAME_MATCH_SCORE, max_block_size=MAX_BLOCK_SIZE):
+        self.min_score = min_score
+        self.max_block_size = max_block_size
+        # List of Duplicate tuples, exact name matches first
+        self.duplicates = []
+
+        if members:
+            self.find(members)
+
+    @classmethod
+    def from_bans(cls, bans, **kwargs):
+        """Looks for duplicates among the members of all bans of a Bans object."""
+        return cls([member for members in bans.bans.values() for member in members], **kwargs)
+
+    @staticmethod
+    def name_key(member: MemberData):
+        """Returns the canonical name of a member: casefolded, without accents and with single spaces."""
+        return member.identity
+
+    @staticmethod
+    def blocking_keys(member: MemberData):
+        """Returns the keys of the blocks a member is compared in: its birthdate and phone numbers."""
+        keys = []
+        if member.geboortedatum:
+            keys.append(("geboortedatum", member.geboortedatum))
+        for phone in (member.telefoon, member.extra_telefoon):
+            if phone:
+                keys.append(("telefoon", phone))
+        return keys
+
+    def similar(self, first, second):
+        """Returns whether two canonical voornamen are similar enough to belong to the same member."""
+        return first == second or SequenceMatcher(a=first, b=second, autojunk=False).ratio() >= self.min_score
+
+    def find(self, members):
+        """
+        Finds the duplicates among members in expected linear time.
+
+        Members with the same canonical name are duplicates. Members with different names are
+        only compared when they share a birthdate or phone number, and reported when their names
+        are similar, so "Jan Peeters" and "Jan Peters" born on the same day are found too.
+
+        The voornamen must be similar on their own as well, and members with the same naam but
+        another voornaam are never reported: "Lien Peeters" and "Lies Peeters" sharing a phone
+        number or a birthdate are siblings or twins, not one member registered twice.
+        """
+        members = list(members)
+        names = [self.name_key(member) for member in members]
+        reported = set()
+        self.duplicates = []
+
+        # Exact matches on the canonical name, grouped with a single dictionary pass
+        by_name = {}
+        for index, name in enumerate(names):
+            by_name.setdefault(name, []).append(index)
+        for indices in by_name.values():
+            for other in indices[1:]:
+                reported.add((indices[0], other))
+                self.duplicates.append(Duplicate(members[indices[0]], members[other], "naam", 1.0))
+
+        # Fuzzy matches, only compared within the small blocks of a birthdate or phone number
+        blocks = {}
+        for index, member in enumerate(members):
+            for key in self.blocking_keys(member):
+                blocks.setdefault(key, []).append(index)
+
+        for (reason, _), indices in blocks.items():
+            if len(indices) < 2 or len(indices) > self.max_block_size:
+                continue
+            for position, first in enumerate(indices):
+                matcher = SequenceMatcher(b=" ".join(names[first]), autojunk=False)
+                for second in indices[position + 1 :]:
+                    if names[first] == names[second] or (first, second) in reported:
+                        continue
+                    # Same naam and another voornaam: siblings or twins
+                    if names[first][1] == names[second][1]:
+                        continue
+                    matcher.set_seq1(" ".join(names[second]))
+                    if matcher.quick_ratio() < self.min_score:
+                        continue
+                    score = matcher.ratio()
+                    if score >= self.min_score and self.similar(names[first][0], names[second][0]):
+                        reported.add((first, second))
+                        self.duplicates.append(Duplicate(members[first], members[second], reason, score))
+
+    def __len__(self):
+        return len(self.duplicates)
+
+    def __iter__(self):
+        return iter(self.duplicates)
+
+    def __repr__(self):
+        return f"Duplicates({len(self.duplicates)} duplicates)"
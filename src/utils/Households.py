@@ -0,0 +1,106 @@
+from .MemberData import MemberData
+from .text import fold
+
+# A key shared by more members than this (a leader's number given for every child, say)
+# doesn't identify a household and is ignored
+MAX_HOUSEHOLD_SIZE = 10
+
+
+class Households:
+    """Groups of members living together, found through a shared address or phone number."""
+
+    def __init__(self, members=None, max_size=MAX_HOUSEHOLD_SIZE):
+        self.max_size = max_size
+        # List of households, each a list of MemberData objects in the order they were given
+        self.households = []
+
+        if members:
+            self.group(members)
+
+    @classmethod
+    def from_bans(cls, bans, max_size=MAX_HOUSEHOLD_SIZE):
+        """Groups the members of all bans of a Bans object."""
+        return cls((member for members in bans.bans.values() for member in members), max_size)
+
+    @staticmethod
+    def keys(member: MemberData):
+        """Returns the keys that put members in the same household: their address and phone numbers."""
+        keys = []
+        if member.straat:
+            keys.append(("adres", fold(member.straat), fold(member.huisnummer), fold(member.gemeente)))
+        for phone in (member.telefoon, member.extra_telefoon):
+            if phone:
+                keys.append(("telefoon", phone))
+        return keys
+
+    def group(self, members):
+        """
+        Groups members into households with hash joins on their keys, no member is compared to another.
+
+        Members sharing a key are joined with a union-find, so a child sharing the address
+        with one sibling and a phone number with another ends up in the same household.
+        """
+        members = list(members)
+        member_keys = [self.keys(member) for member in members]
+
+        # Count the members per key first, so overly shared keys can be skipped
+        counts = {}
+        for keys in member_keys:
+            for key in keys:
+                counts[key] = counts.get(key, 0) + 1
+
+        # Union-find over the member positions
+        parent = list(range(len(members)))
+
+        def find(index):
+            while parent[index] != index:
+                # Path halving keeps the trees flat
+                parent[index] = parent[parent[index]]
+                index = parent[index]
+            return index
+
+        # Join every member with the first member seen with the same key
+        first_with_key = {}
+        for index, keys in enumerate(member_keys):
+            for key in keys:
+                if counts[key] > self.max_size:
+                    continue
+                first = first_with_key.setdefault(key, index)
+                if first != index:
+                    parent[find(index)] = find(first)
+
+        groups = {}
+        for index, member in enumerate(members):
+            groups.setdefault(find(index), []).append(member)
+        self.households = list(groups.values())
+
+    def mailing_rows(self):
+        """
+        Returns one row per household for a mailing: names, straat, huisnummer, gemeente and telefoon.
+
+        Members present in several bans are only named once.
+        """
+        rows = []
+        for household in self.households:
+            names = list(dict.fromkeys(f"{member.voornaam} {member.naam}" for member in household))
+            # Use the first member that has both an address and a phone number, so they belong together
+            contact = next((member for member in household if member.straat and member.telefoon), None)
+            if contact:
+                address, phone = contact, contact.telefoon
+            else:
+                # Nobody has both, take the first address and the first phone number separately
+                address = next((member for member in household if member.straat), household[0])
+                phone = next((member.telefoon for member in household if member.telefoon), "")
+            rows.append(
+                [", ".join(names), address.straat, address.huisnummer, address.gemeente, phone]
+            )
+        return rows
+
+    def __len__(self):
+        return len(self.households)
+
+    def __iter__(self):
+        return iter(self.households)
+
+    def __repr__(self):
+        return f"Households({len(self.households)} households)"
@@ -1,8 +1,41 @@
-import re
-from datetime import datetime
-from .zipcodes import lookup_postcode
+from .normalize import (
+    clean_ban,
+    clean_bans,
+    date_ordinals,
+    format_date,
+    format_parsed_date,
+    format_phone_number,
+    get_gemeente_name,
+    normalize_phones,
+    parse_date,
+    parse_dates,
+    resolve_gemeente,
+    resolve_gemeenten,
+)
+from .provinces import lookup_province, lookup_provinces
+from .text import identity_key, name_collation
 
 class MemberData:
+    # The fields of a member, in the order of the registration spreadsheet
+    FIELDS = (
+        "voornaam",
+        "naam",
+        "emailadres",
+        "telefoon",
+        "extra_telefoon",
+        "straat",
+        "huisnummer",
+        "gemeente",
+        "geboortedatum",
+        "ban",
+    )
+
+    # Fixed set of attributes, so instances don't carry a per-instance __dict__
+    # The postcode and provincie are derived from the gemeente, the identity and collations from the names
+    # (particle_collation sorts 'Van den Berg' under B) and the geboortedag (the birthdate as an ordinal,
+    # for sorting) from the geboortedatum
+    __slots__ = FIELDS + ("postcode", "provincie", "identity", "collation", "particle_collation", "geboortedag")
+
     # Constructor that handles initialization from both a row or individual arguments
     def __init__(
         self,
@@ -19,91 +52,134 @@ class MemberData:
         row=None,
     ):
         if row:
-            # If a row is provided, initialize from the row list
-            self.voornaam = row[0]
-            self.naam = row[1]
-            self.emailadres = row[2]
-            self.telefoon = self.format_phone_number(row[3])
-            self.extra_telefoon = self.format_phone_number(row[4])
-            self.straat = row[5]
-            self.huisnummer = row[6]
-            self.gemeente = self.get_gemeente_name(row[7])
-            self.geboortedatum = self.format_date(row[8])
-            self.ban = self.clean_ban(row[9])
+            # A single row is normalized exactly like a batch of rows
+            self.assign(next(self.normalize_rows([row])))
 
         else:
             # Otherwise, initialize from individual arguments
-            self.voornaam = voornaam
-            self.naam = naam
-            self.emailadres = emailadres
-            self.telefoon = telefoon
-            self.extra_telefoon = extra_telefoon
-            self.straat = straat
-            self.huisnummer = huisnummer
-            self.gemeente = self.get_gemeente_name(gemeente)
-            self.geboortedatum = self.format_date(geboortedatum)
-            self.ban = self.clean_ban(ban) if ban else None
-
-    def get_gemeente_name(self, gemeente):
+            gemeente, postcode = resolve_gemeente(gemeente, straat)
+            parsed_date = parse_date(geboortedatum)
+            self.assign(
+                (
+                    voornaam,
+                    naam,
+                    emailadres,
+                    telefoon,
+                    extra_telefoon,
+                    straat,
+                    huisnummer,
+                    gemeente,
+                    format_parsed_date(parsed_date, geboortedatum),
+                    self.clean_ban(ban) if ban else None,
+                    postcode,
+                    # The province only depends on the postcode, lookup_province caches it per postcode
+                    lookup_province(postcode),
+                    parsed_date.toordinal() if parsed_date else None,
+                )
+            )
+
+    def assign(self, values):
         """
-        Replace postcode with corresponding gemeente name using lookup_postcode.
+        Sets the normalized values of a member and derives its identity and collations from the names.
+
+        :param values: tuple: The FIELDS followed by the postcode, provincie and geboortedag, as given by normalize_rows.
+        """
+        (
+            self.voornaam,
+            self.naam,
+            self.emailadres,
+            self.telefoon,
+            self.extra_telefoon,
+            self.straat,
+            self.huisnummer,
+            self.gemeente,
+            self.geboortedatum,
+            self.ban,
+            self.postcode,
+            self.provincie,
+            self.geboortedag,
+        ) = values
+        # Computed once, equality, hashing and sorting all use it
+        # (so set the names before constructing, not afterwards)
+        self.identity = identity_key(self.voornaam, self.naam)
+        self.collation = name_collation(self.voornaam, self.naam)
+        self.particle_collation = name_collation(self.voornaam, self.naam, ignore_particles=True)
+
+    @staticmethod
+    def normalize_rows(rows, batch_hits=None, corrections=None):
+        """
+        Normalizes a batch of rows, one column at a time.
+
+        :param rows: list: Rows of the registration spreadsheet.
+        :param batch_hits: Counter: Optional counter of the values reused within the batch, per cache (see cache_stats).
+        :param corrections: dict: Fixes mistyped gemeenten when given, recording every typed name -> town fixed in it.
+        :return: iterator: The values for assign, one tuple per row.
+        """
+        columns = list(zip(*rows))
+        gemeenten, postcodes = zip(*resolve_gemeenten(columns[7], columns[5], corrections))
+        # Every distinct date is parsed once, for both the geboortedatum and the geboortedag
+        dates = parse_dates(columns[8], batch_hits)
+
+        # Normalize the columns as a whole, so values shared by many rows are only computed once
+        return zip(
+            columns[0],
+            columns[1],
+            columns[2],
+            normalize_phones(columns[3], batch_hits),
+            normalize_phones(columns[4], batch_hits),
+            columns[5],
+            columns[6],
+            gemeenten,
+            map(format_parsed_date, dates, columns[8]),
+            clean_bans(columns[9]),
+            postcodes,
+            lookup_provinces(postcodes),
+            date_ordinals(dates),
+        )
+
+    @classmethod
+    def from_rows(cls, rows, batch_hits=None, corrections=None):
+        """
+        Creates MemberData objects from a batch of rows, normalizing each column at once.
+
+        :param rows: iterable: Rows of the registration spreadsheet.
+        :param batch_hits: Counter: Optional counter of the values reused within the batch, per cache (see cache_stats).
+        :param corrections: dict: Fixes mistyped gemeenten when given, recording every typed name -> town fixed in it.
+        :return: list: A MemberData object per row.
+        """
+        rows = list(rows)
+        if not rows:
+            return []
+
+        members = []
+        for values in cls.normalize_rows(rows, batch_hits, corrections):
+            # The values are already normalized, so skip __init__
+            member = cls.__new__(cls)
+            member.assign(values)
+            members.append(member)
+        return members
+
+    def get_gemeente_name(self, gemeente, straat=None):
+        """
+        Replace postcode with corresponding gemeente name using lookup_postcode, and give known town names the spelling of the postcode table.
 
         :param gemeente: str: The postcode or name of the gemeente.
+        :param straat: str: Optional street, used to pick the deelgemeente when several share the postcode.
         :return: str: The corresponding gemeente name or the original if not found.
         """
-        # Check if gemeente is a string and not a postcode (assuming postcodes are numeric)
-        if isinstance(gemeente, str) and gemeente.isnumeric() and len(gemeente) > 0:
-            gemeente_name = lookup_postcode(
-                gemeente
-            )  # Use the imported lookup_postcode function
-        else:
-            gemeente_name = gemeente  # Use the provided string directly
-
-        # Capitalize the first letter and make the rest lowercase
-        return gemeente_name.capitalize() if gemeente_name else ""  # Ensure not None
+        return get_gemeente_name(gemeente, straat)
 
     def format_phone_number(self, phone):
         """Formats the phone number to '0000 00 00 00'."""
-        if not phone:
-            return ""
-        match = re.match(r"^\+(\d{1,3})\s*", phone)
-        if match:
-            # Remove the country code and add a leading zero
-            phone = re.sub(r"^\+(\d{1,3})\s*", "0", phone).strip()
-        # Remove any non-digit characters
-        digits = re.sub(r"\D", "", phone)
-        # If the length is less than 10, prepend a leading zero
-        if len(digits) < 10:
-            digits = "0" + digits
-
-        # Format the number to '0000 00 00 00'
-        if len(digits) >= 10:  # Ensure there are enough digits
-            return f"{digits[:-6]} {digits[-6:-4]} {digits[-4:-2]} {digits[-2:]}"
-
-        return phone  # Return original if less than 10 digits
+        return format_phone_number(phone)
 
     def format_date(self, date_input):
         """Converts a date string or datetime to the format 'dd/mm/yyyy'."""
-        if isinstance(date_input, datetime):
-            # If it's already a datetime object, format it directly
-            return date_input.strftime("%d/%m/%Y")
-
-        if not date_input:
-            return ""
-
-        # Try parsing and formatting the date string
-        try:
-            # Assuming the input date could be in 'yyyy-mm-dd' or other common formats
-            parsed_date = datetime.strptime(
-                date_input, "%Y-%m-%d"
-            )  # Adjust format if necessary
-            return parsed_date.strftime("%d/%m/%Y")
-        except ValueError:
-            return date_input  # Return original if parsing fails
+        return format_date(date_input)
 
     def clean_ban(self, ban):
         """Cleans the ban name by removing unwanted characters."""
-        return re.sub(r"\s*\(.*?\)", "", ban).strip()
+        return clean_ban(ban)
 
     def __repr__(self):
         return (
@@ -113,14 +189,11 @@ class MemberData:
         )
 
     def __eq__(self, other):
-        """Define equality based on name and email."""
+        """Define equality based on the names, ignoring case and accents."""
         if not isinstance(other, MemberData):
             return NotImplemented
-        return (self.voornaam.lower(), self.naam.lower()) == (
-            other.voornaam.lower(),
-            other.naam.lower(),
-        )
+        return self.identity == other.identity
 
     def __hash__(self):
-        """Define a hash function for the MemberData class."""
-        return hash((self.voornaam, self.naam))
+        """Define a hash function for the MemberData class, consistent with __eq__."""
+        return hash(self.identity)
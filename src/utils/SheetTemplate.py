@@ -0,0 +1,151 @@
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Border
+from openpyxl.utils import get_column_letter
+from .export_styles import DATA_STYLE, HEADER_STYLE, NUMBER_STYLE, THIN_SIDE, TITLE_STYLE
+
+
+class SheetTemplate:
+    """
+    Layout of an exported ban sheet: a merged title, the table headers and one column per member field.
+
+    Everything that doesn't depend on the ban (styles, column letters, header widths, merged range)
+    is worked out once when the template is created, so rendering a ban only writes its rows.
+    """
+
+    # Row of the merged title, and of the table headers after an empty row
+    TITLE_ROW = 1
+    HEADER_ROW = 3
+    # Padding added to the longest value of every column
+    WIDTH_PADDING = 2
+
+    def __init__(self, fields, headers, number_fields=(), extra_widths=None):
+        """
+        :param fields: list: The MemberData fields written to the sheet, one per column.
+        :param headers: list: The table header of every column.
+        :param number_fields: iterable: Fields whose values are right-aligned, like the huisnummer.
+        :param extra_widths: dict: Extra width for some fields, on top of their longest value.
+        """
+        if len(fields) != len(headers):
+            raise ValueError(f"Got {len(fields)} fields but {len(headers)} headers")
+        extra_widths = extra_widths or {}
+
+        self.fields = list(fields)
+        self.headers = list(headers)
+        # Named style and letter of every column
+        self.styles = [NUMBER_STYLE if field in number_fields else DATA_STYLE for field in self.fields]
+        self.letters = [get_column_letter(col_num) for col_num in range(1, len(self.fields) + 1)]
+        # Widths start from the table headers, the rows can only make them wider
+        self.header_lengths = [len(header) for header in self.headers]
+        self.extra_widths = [extra_widths.get(field, 0) for field in self.fields]
+        # The title is merged over the entire width
+        self.title_range = f"A{self.TITLE_ROW}:{self.letters[-1]}{self.TITLE_ROW}"
+
+    @staticmethod
+    def title(ban, count):
+        """Returns the title of a ban's sheet, with room to fill in the members present by hand."""
+        return f"{ban.upper()} (   /{count})"
+
+    def start_lengths(self, title):
+        """Returns the lengths the columns start from: their headers, and the title in the first column."""
+        max_lengths = list(self.header_lengths)
+        max_lengths[0] = max(max_lengths[0], len(title))
+        return max_lengths
+
+    def measure(self, title, rows):
+        """
+        Returns the max length of every column over the headers, the title and the rows.
+
+        :param title: str: The title, counted in the first column where the merged title starts.
+        :param rows: iterable: The row tuples of the ban.
+        :return: list: The max length of every column.
+        """
+        max_lengths = self.start_lengths(title)
+        for row in rows:
+            self.update_lengths(max_lengths, row)
+        return max_lengths
+
+    @staticmethod
+    def update_lengths(max_lengths, row):
+        """Updates the running max length of every column with a row."""
+        for index, value in enumerate(row):
+            if value:
+                length = len(str(value))
+                if length > max_lengths[index]:
+                    max_lengths[index] = length
+
+    def set_widths(self, sheet, max_lengths):
+        """Sets the column widths of a sheet from the max lengths of its columns."""
+        for letter, max_length, extra_width in zip(self.letters, max_lengths, self.extra_widths):
+            sheet.column_dimensions[letter].width = max_length + self.WIDTH_PADDING + extra_width
+
+    def render(self, sheet, title, rows):
+        """
+        Writes a ban to a regular worksheet, measuring the column widths while the rows are written.
+
+        :param sheet: Worksheet: An empty sheet of a workbook the named styles are registered in.
+        :param title: str: The title of the sheet.
+        :param rows: iterable: The row tuples of the ban, in the order of the fields.
+        """
+        header = sheet.cell(row=self.TITLE_ROW, column=1, value=title)
+        header.style = TITLE_STYLE
+        sheet.merge_cells(self.title_range)
+
+        for col_num, header_text in enumerate(self.headers, start=1):
+            sheet.cell(row=self.HEADER_ROW, column=col_num, value=header_text).style = HEADER_STYLE
+
+        max_lengths = self.start_lengths(title)
+        columns = list(enumerate(self.styles, start=1))
+        for row_num, row in enumerate(rows, start=self.HEADER_ROW + 1):
+            for (col_num, style), value in zip(columns, row):
+                sheet.cell(row=row_num, column=col_num, value=value).style = style
+            self.update_lengths(max_lengths, row)
+
+        self.set_widths(sheet, max_lengths)
+
+    def render_streaming(self, sheet, title, rows, max_lengths):
+        """
+        Appends a ban to a write-only worksheet.
+
+        Write-only sheets write the column widths before the first row, so they are measured
+        up front with measure, and the cells at the edges of the merged title get its border by hand.
+
+        :param sheet: WriteOnlyWorksheet: An empty sheet of a workbook the named styles are registered in.
+        :param title: str: The title of the sheet.
+        :param rows: iterable: The row tuples of the ban, in the order of the fields.
+        :param max_lengths: list: The max length of every column, from measure.
+        """
+        self.set_widths(sheet, max_lengths)
+
+        header = WriteOnlyCell(sheet, value=title)
+        header.style = TITLE_STYLE
+        title_row = [header]
+        for col_num in range(2, len(self.fields) + 1):
+            cell = WriteOnlyCell(sheet)
+            cell.border = Border(
+                right=THIN_SIDE if col_num == len(self.fields) else None, top=THIN_SIDE, bottom=THIN_SIDE
+            )
+            title_row.append(cell)
+        sheet.append(title_row)
+        sheet.merged_cells.add(self.title_range)
+
+        # Leave an empty row between the title and the table
+        for _ in range(self.HEADER_ROW - self.TITLE_ROW - 1):
+            sheet.append([])
+
+        header_row = []
+        for header_text in self.headers:
+            cell = WriteOnlyCell(sheet, value=header_text)
+            cell.style = HEADER_STYLE
+            header_row.append(cell)
+        sheet.append(header_row)
+
+        for row in rows:
+            cells = []
+            for style, value in zip(self.styles, row):
+                cell = WriteOnlyCell(sheet, value=value)
+                cell.style = style
+                cells.append(cell)
+            sheet.append(cells)
+
+    def __repr__(self):
+        return f"SheetTemplate(fields={self.fields})"
@@ -0,0 +1,105 @@
+from bisect import bisect_right
+from datetime import date
+from .MemberData import MemberData
+from .text import collation_key
+
+# The orders a ban can be sorted in, ties are always broken on the names
+SORT_ORDERS = ("voornaam", "naam", "geboortedatum", "gemeente")
+# Members without a valid birthdate sort after everyone else
+MISSING_GEBOORTEDAG = date.max.toordinal() + 1
+
+
+class SortedBan:
+    """The members of a single ban, always kept sorted, by Voornaam and then by Naam ignoring case and accents by default."""
+
+    def __init__(self, members=None, ignore_particles=False, order="voornaam"):
+        if order not in SORT_ORDERS:
+            raise ValueError(f"Unknown sort order '{order}', expected one of {', '.join(SORT_ORDERS)}")
+        # One of SORT_ORDERS
+        self.order = order
+        # Whether surnames sort on the part after 'van', 'de', ... ('Van den Berg' under B instead of V)
+        self.ignore_particles = ignore_particles
+        # Members in sorted order, with their sort keys in a parallel list for bisect
+        self._members = []
+        self._keys = []
+        # Identity keys of the members, used to skip duplicates in constant time
+        self._names = set()
+
+        if members:
+            self.update(members)
+
+    def sort_key(self, member: MemberData):
+        """
+        Returns the key the members are sorted on, built from keys computed when the member was created.
+
+        Birthdates are compared as ordinals and gemeenten by their collation key, never as text.
+        """
+        collation = member.particle_collation if self.ignore_particles else member.collation
+
+        if self.order == "naam":
+            return (collation[1], collation[0])
+        if self.order == "geboortedatum":
+            geboortedag = member.geboortedag
+            return (MISSING_GEBOORTEDAG if geboortedag is None else geboortedag, collation)
+        if self.order == "gemeente":
+            return (collation_key(member.gemeente), collation)
+        return collation
+
+    @staticmethod
+    def name_key(member: MemberData):
+        """Returns the key used to recognise the same member twice."""
+        return member.identity
+
+    def add(self, member: MemberData):
+        """Inserts a member at its sorted position, returns False if the member was already present."""
+        name = self.name_key(member)
+        if name in self._names:
+            return False
+        self._names.add(name)
+
+        # Insert after members with an equal key, so members keep the order they were added in
+        key = self.sort_key(member)
+        index = bisect_right(self._keys, key)
+        self._keys.insert(index, key)
+        self._members.insert(index, member)
+        return True
+
+    def update(self, members):
+        """Adds an iterable of members and sorts the ban once at the end."""
+        for member in members:
+            name = self.name_key(member)
+            if name not in self._names:
+                self._names.add(name)
+                self._keys.append(self.sort_key(member))
+                self._members.append(member)
+
+        # Sort the positions on the keys computed above, so no key is computed twice
+        # The sort is stable, so the result matches adding the members one by one
+        order = sorted(range(len(self._members)), key=self._keys.__getitem__)
+        self._members = [self._members[index] for index in order]
+        self._keys = [self._keys[index] for index in order]
+
+    def sort(self, order):
+        """Sorts the ban in another order, one of SORT_ORDERS, with a single keyed sort."""
+        if order not in SORT_ORDERS:
+            raise ValueError(f"Unknown sort order '{order}', expected one of {', '.join(SORT_ORDERS)}")
+        self.order = order
+        keys = [self.sort_key(member) for member in self._members]
+        positions = sorted(range(len(self._members)), key=keys.__getitem__)
+        self._members = [self._members[index] for index in positions]
+        self._keys = [keys[index] for index in positions]
+
+    def __contains__(self, member):
+        return isinstance(member, MemberData) and self.name_key(member) in self._names
+
+    def __len__(self):
+        return len(self._members)
+
+    def __iter__(self):
+        return iter(self._members)
+
+    def __getitem__(self, index):
+        return self._members[index]
+
+    def __repr__(self):
+        return f"SortedBan({self._members!r})"
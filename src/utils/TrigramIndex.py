@@ -0,0 +1,97 @@
+from collections import Counter
+from difflib import SequenceMatcher
+from heapq import nlargest
+from itertools import chain
+
+
+class TrigramIndex:
+    """Inverted index of the three-letter pieces of strings, to find the closest string without comparing to all of them."""
+
+    def __init__(self, keys=None):
+        # The indexed strings and the number of distinct trigrams of each
+        self.keys = []
+        self.sizes = []
+        # Dictionary mapping every trigram to the positions of the keys containing it
+        self.postings = {}
+
+        if keys:
+            for key in keys:
+                self.add(key)
+
+    @staticmethod
+    def trigrams(text):
+        """Returns the set of trigrams of a string, padded so the start and end of the word count too."""
+        padded = f"  {text} "
+        return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+    def add(self, key):
+        """Adds a string to the index."""
+        position = len(self.keys)
+        grams = self.trigrams(key)
+        self.keys.append(key)
+        self.sizes.append(len(grams))
+        for gram in grams:
+            self.postings.setdefault(gram, []).append(position)
+
+    def candidates(self, text, min_score=0.5, limit=10):
+        """
+        Finds the indexed strings sharing the most trigrams with text.
+
+        The score is the Dice coefficient of the trigram sets, 1.0 for identical sets.
+        Only strings sharing a trigram with text are looked at, and of those only the ones
+        whose trigram count still allows min_score are scored.
+
+        :param text: str: The string to match.
+        :param min_score: float: The lowest Dice coefficient kept.
+        :param limit: int: The maximum number of candidates returned.
+        :return: list: (key, score) tuples, best first.
+        """
+        grams = self.trigrams(text)
+        size = len(grams)
+
+        # Count the shared trigrams per key, walking only the posting lists of these trigrams
+        shared = Counter(chain.from_iterable(self.postings.get(gram, ()) for gram in grams))
+
+        # Even sharing all trigrams, keys much shorter or longer than text stay below min_score
+        smallest = size * min_score / (2 - min_score)
+        largest = size * (2 - min_score) / min_score if min_score else float("inf")
+
+        # Whatever its size, a key sharing fewer trigrams than this can't reach min_score
+        needed = min_score * (size + smallest) / 2
+
+        sizes = self.sizes
+        scored = [
+            (2 * count / (size + sizes[position]), position)
+            for position, count in shared.items()
+            if count >= needed and smallest <= sizes[position] <= largest
+        ]
+        scored = [item for item in scored if item[0] >= min_score]
+        return [(self.keys[position], score) for score, position in nlargest(limit, scored)]
+
+    def best_match(self, text, min_score=0.8, candidate_score=0.5, limit=10):
+        """
+        Finds the indexed string most similar to text.
+
+        The trigram candidates are compared to text with difflib's ratio, which handles
+        swapped letters better than trigrams, so only a handful of strings are compared.
+
+        :param text: str: The string to match.
+        :param min_score: float: The lowest similarity ratio (0 to 1) accepted.
+        :param candidate_score: float: The lowest Dice coefficient of the candidates.
+        :param limit: int: The maximum number of candidates compared.
+        :return: tuple: (key, score), or None if nothing reaches min_score.
+        """
+        matcher = SequenceMatcher(b=text, autojunk=False)
+        best = None
+        best_score = min_score
+        for key, _ in self.candidates(text, candidate_score, limit):
+            matcher.set_seq1(key)
+            score = matcher.ratio()
+            if score >= best_score:
+                best, best_score = key, score
+        if best is None:
+            return None
+        return best, best_score
+
+    def __len__(self):
+        return len(self.keys)
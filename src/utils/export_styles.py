@@ -0,0 +1,56 @@
+from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+
+# Names of the cell styles of the exported sheets, assigned by name so cells share them
+TITLE_STYLE = "Ban titel"
+HEADER_STYLE = "Ban kolomtitel"
+DATA_STYLE = "Ban gegevens"
+NUMBER_STYLE = "Ban getal"
+
+THIN_SIDE = Side(style="thin")
+# Same as the default border of a workbook, so cells without a border share it
+NO_BORDER = Border(left=Side(), right=Side(), top=Side(), bottom=Side(), diagonal=Side())
+
+
+def build_styles():
+    """
+    Creates the named styles of the exported sheets.
+
+    :return: list: The NamedStyle objects, to register in a workbook.
+    """
+    return [
+        # Ban name and count above the table, merged over the entire width
+        NamedStyle(
+            name=TITLE_STYLE,
+            font=Font(name="Verdana", size=14, bold=True),
+            alignment=Alignment(horizontal="center", vertical="center"),
+            border=Border(left=THIN_SIDE, right=THIN_SIDE, top=THIN_SIDE, bottom=THIN_SIDE),
+        ),
+        # Table headers with gray fill, no border
+        NamedStyle(
+            name=HEADER_STYLE,
+            font=Font(name="Verdana", size=11, bold=False),
+            fill=PatternFill(start_color="bfbfbf", end_color="bfbfbf", fill_type="solid"),
+            border=NO_BORDER,
+        ),
+        NamedStyle(name=DATA_STYLE, font=Font(name="Verdana", size=11, bold=False), border=NO_BORDER),
+        # Numbers like the huisnummer are right-aligned
+        NamedStyle(
+            name=NUMBER_STYLE,
+            font=Font(name="Verdana", size=11, bold=False),
+            alignment=Alignment(horizontal="right"),
+            border=NO_BORDER,
+        ),
+    ]
+
+
+def register_styles(workbook):
+    """
+    Adds the named styles to a workbook once, after which cells use them with cell.style = DATA_STYLE.
+
+    Assigning a registered style by name only copies its style ids, no Font or Fill is created per cell.
+
+    :param workbook: Workbook: The workbook to export to, regular or write-only.
+    """
+    for style in build_styles():
+        if style.name not in workbook.named_styles:
+            workbook.add_named_style(style)
@@ -0,0 +1,390 @@
+import re
+from datetime import date, datetime, timedelta
+from functools import lru_cache, partial
+from .text import fold
+from .provinces import lookup_province
+from .zipcodes import lookup_gemeente, lookup_postcode, lookup_towns, match_gemeente
+
+# Patterns are compiled once at import instead of being looked up on every call
+COUNTRY_CODE_PATTERN = re.compile(r"^\+(\d{1,3})\s*")
+NON_DIGIT_PATTERN = re.compile(r"\D")
+# A postcode written after the street, behind a comma: 'Kerkstraat 1, 9300' or 'Kerkstraat 1, 9300 Aalst'
+# Numbers elsewhere in the street are house or bus numbers, 'Kerkstraat 3800' doesn't name a postcode
+STREET_POSTCODE_PATTERN = re.compile(r",\s*(\d{4})\b")
+BAN_SUFFIX_PATTERN = re.compile(r"\s*\(.*?\)")
+
+# Number of distinct raw phone numbers remembered, families share their numbers so hits are common
+PHONE_CACHE_SIZE = 8192
+# Number of distinct raw dates remembered, siblings and twins share birthdates
+DATE_CACHE_SIZE = 8192
+
+# Excel numbers days from 30/12/1899, so serial 1 is 01/01/1900
+EXCEL_EPOCH = date(1899, 12, 30)
+# Serials read as birthdates: five digits, 18/05/1927 up to 2173
+# Smaller numbers are more likely a year ('2012') or a typo than a date, and are left unparsed
+MIN_BIRTHDATE_SERIAL = 10000
+MAX_BIRTHDATE_SERIAL = 99999
+# Two-digit years up to this value are read as 20yy, the others as 19yy
+TWO_DIGIT_YEAR_PIVOT = date.today().year % 100
+# Separators used in day-month-year dates, like 03/05/2012, 3-5-12 or 3.5.2012
+DATE_SEPARATOR_PATTERN = re.compile(r"[/.-]")
+
+
+@lru_cache(maxsize=PHONE_CACHE_SIZE)
+def format_phone_number(phone):
+    """Formats the phone number to '0000 00 00 00'."""
+    if not phone:
+        return ""
+    if COUNTRY_CODE_PATTERN.match(phone):
+        # Remove the country code and add a leading zero
+        phone = COUNTRY_CODE_PATTERN.sub("0", phone).strip()
+    # Remove any non-digit characters
+    digits = NON_DIGIT_PATTERN.sub("", phone)
+    # If the length is less than 10, prepend a leading zero
+    if len(digits) < 10:
+        digits = "0" + digits
+
+    # Format the number to '0000 00 00 00'
+    if len(digits) >= 10:  # Ensure there are enough digits
+        return f"{digits[:-6]} {digits[-6:-4]} {digits[-4:-2]} {digits[-2:]}"
+
+    return phone  # Return original if less than 10 digits
+
+
+def resolve_gemeente(gemeente, straat=None, fuzzy=False):
+    """
+    Finds the name and postcode of a gemeente given as postcode or as name.
+
+    :param gemeente: str: The postcode or name of the gemeente.
+    :param straat: str: Optional street, used to pick the deelgemeente when several share the postcode.
+    :param fuzzy: bool: Whether to fix mistyped names to the most similar town, see find_town.
+    :return: tuple: (name, postcode), the postcode is None when the gemeente isn't known.
+    """
+    # Check if gemeente is a string and not a postcode (assuming postcodes are numeric)
+    if isinstance(gemeente, str) and gemeente.isnumeric() and len(gemeente) > 0:
+        # Names from the postcode table are already display-ready
+        postcode = int(gemeente)
+        return lookup_postcode(postcode, straat), postcode if lookup_towns(postcode) else None
+
+    # Use the spelling of the postcode table for known towns
+    town = find_town(gemeente, fuzzy)
+    if town:
+        name, postcodes = town
+        return name, pick_postcode(postcodes, straat)
+
+    # Otherwise use the provided string, capitalize the first letter and make the rest lowercase
+    return gemeente.capitalize() if gemeente else "", None  # Ensure not None
+
+
+def find_town(gemeente, fuzzy=False):
+    """
+    Finds a town by name, ignoring case, accents, punctuation and "St."/"Sint" spelling.
+
+    :param gemeente: str: The town name as typed.
+    :param fuzzy: bool: Whether to also accept the most similar town for mistyped names, like "Gentt".
+        Off by default, a fix can pick the wrong town so it is only made when asked for.
+    :return: tuple: (town, postcodes) or None if the town is not found.
+    """
+    if fuzzy:
+        match = match_gemeente(gemeente)
+        return match[0] if match else None
+    return lookup_gemeente(gemeente)
+
+
+def pick_postcode(postcodes, straat=None):
+    """
+    Picks the postcode of a town known by name, only when its province is certain.
+
+    Towns sharing a name can be far apart, Aalst is both 3800 in Limburg and 9300 in Oost-Vlaanderen.
+    Their postcode is only known when the street names one of them after a comma, like 'Kerkstraat 1, 9300'.
+
+    :param postcodes: tuple: The postcodes of the town.
+    :param straat: str: Optional street of the address.
+    :return: int: The first postcode if all of them are in one province, else the one in the street or None.
+    """
+    if len({lookup_province(postcode) for postcode in postcodes}) == 1:
+        return postcodes[0]
+    if isinstance(straat, str):
+        numbers = set(STREET_POSTCODE_PATTERN.findall(straat))
+        named = [postcode for postcode in postcodes if str(postcode) in numbers]
+        if len(named) == 1:
+            return named[0]
+    return None
+
+
+def get_gemeente_name(gemeente, straat=None):
+    """
+    Replace postcode with corresponding gemeente name using lookup_postcode, and give known town names the spelling of the postcode table.
+
+    :param gemeente: str: The postcode or name of the gemeente.
+    :param straat: str: Optional street, used to pick the deelgemeente when several share the postcode.
+    :return: str: The corresponding gemeente name or the original if not found.
+    """
+    return resolve_gemeente(gemeente, straat)[0]
+
+
+def excel_serial_to_date(serial):
+    """Converts an Excel serial day number to a date, or None if it isn't a plausible birthdate serial."""
+    if MIN_BIRTHDATE_SERIAL <= serial <= MAX_BIRTHDATE_SERIAL:
+        return EXCEL_EPOCH + timedelta(days=int(serial))
+    return None
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE, typed=True)
+def parse_date(date_input):
+    """
+    Parses a date in any of the formats the groups send us.
+
+    Supported are datetime and date objects, 'yyyy-mm-dd' (with or without a time),
+    'dd/mm/yyyy', 'd-m-yy', 'd.m.yyyy', 'yyyy/mm/dd' and five-digit Excel serial day numbers.
+    Check the examples from the src directory with:
+    python -c "import doctest, utils.normalize as m; print(doctest.testmod(m))"
+
+    >>> parse_date(datetime(2012, 5, 3, 14, 30)), parse_date(date(2012, 5, 3))
+    (datetime.date(2012, 5, 3), datetime.date(2012, 5, 3))
+    >>> parse_date("2012-05-03"), parse_date("2012-05-03 00:00:00"), parse_date("2012-05-03T08:15")
+    (datetime.date(2012, 5, 3), datetime.date(2012, 5, 3), datetime.date(2012, 5, 3))
+    >>> parse_date("03/05/2012"), parse_date("3-5-12"), parse_date("3.5.2012"), parse_date("2012/05/03")
+    (datetime.date(2012, 5, 3), datetime.date(2012, 5, 3), datetime.date(2012, 5, 3), datetime.date(2012, 5, 3))
+    >>> parse_date(" 3/5/1998 "), parse_date("3-5-98")
+    (datetime.date(1998, 5, 3), datetime.date(1998, 5, 3))
+    >>> parse_date(41032), parse_date(41032.0), parse_date("41032")
+    (datetime.date(2012, 5, 3), datetime.date(2012, 5, 3), datetime.date(2012, 5, 3))
+
+    Years, small numbers, invalid days and other text are not dates:
+
+    >>> [parse_date(value) for value in ("2012", 2012, 1.5, 0, True, "31/02/2012", "13/13/2012", "onbekend", "", None)]
+    [None, None, None, None, None, None, None, None, None, None]
+
+    :param date_input: The raw value of the date cell.
+    :return: date: The parsed date, or None if the value isn't a recognised date.
+    """
+    if isinstance(date_input, datetime):
+        return date_input.date()
+    if isinstance(date_input, date):
+        return date_input
+    if isinstance(date_input, (int, float)) and not isinstance(date_input, bool):
+        return excel_serial_to_date(date_input)
+    if not isinstance(date_input, str):
+        return None
+
+    text = date_input.strip()
+    try:
+        # Fast path for 'yyyy-mm-dd', the format of the registration export
+        if len(text) == 10 and text[4] == "-":
+            return date.fromisoformat(text)
+        if len(text) > 10 and text[4] == "-":
+            return datetime.fromisoformat(text).date()
+
+        # Day first formats, split by hand instead of trying strptime patterns
+        parts = DATE_SEPARATOR_PATTERN.split(text)
+        if len(parts) == 3 and all(part.isdigit() for part in parts):
+            day, month, year = (int(part) for part in parts)
+            if len(parts[0]) == 4:
+                # 'yyyy/mm/dd' written with another separator
+                year, day = day, year
+            elif len(parts[2]) <= 2:
+                year += 2000 if year <= TWO_DIGIT_YEAR_PIVOT else 1900
+            return date(year, month, day)
+
+        # Excel serial numbers that ended up as text
+        if text.isdigit():
+            return excel_serial_to_date(int(text))
+    except ValueError:
+        # Invalid day or month, like 31/02/2012
+        return None
+    return None
+
+
+def format_date(date_input):
+    """Converts a date string, datetime or Excel serial to the format 'dd/mm/yyyy'."""
+    return format_parsed_date(parse_date(date_input), date_input)
+
+
+def format_parsed_date(parsed_date, date_input):
+    """
+    Formats a date from parse_date as 'dd/mm/yyyy'.
+
+    :param parsed_date: date: The parsed date, None if it couldn't be parsed.
+    :param date_input: The raw value the date was parsed from, returned as is when it couldn't be parsed.
+    :return: str: The formatted date, the raw value or "" when there is none.
+    """
+    if parsed_date:
+        return f"{parsed_date.day:02d}/{parsed_date.month:02d}/{parsed_date.year:04d}"
+
+    if not date_input:
+        return ""
+    return date_input  # Return original if parsing fails
+
+
+def date_ordinal(date_input):
+    """
+    Converts a date string, datetime or Excel serial to its ordinal, to sort dates as numbers.
+
+    :param date_input: str, datetime or int: The date.
+    :return: int: The proleptic Gregorian ordinal, None if the date can't be parsed.
+    """
+    parsed_date = parse_date(date_input)
+    return parsed_date.toordinal() if parsed_date else None
+
+
+def clean_ban(ban):
+    """Cleans the ban name by removing unwanted characters."""
+    return BAN_SUFFIX_PATTERN.sub("", ban).strip()
+
+
+def normalize_column(normalize, values):
+    """
+    Normalizes a whole column, computing every distinct value only once.
+
+    Values are told apart by type as well, so 1, 1.0 and True (equal as dictionary keys)
+    are each normalized on their own, like the typed caches do.
+
+    :param normalize: callable: The function normalizing a single value.
+    :param values: iterable: The raw values of the column.
+    :return: tuple: The normalized values, in the same order as the input,
+        and the number of rows reusing a value already normalized in this column.
+    """
+    keys = [(type(value), value) for value in values]
+    # Deduplicate first, the keys keep the raw values and get their normalized value as dict value
+    normalized = dict.fromkeys(keys)
+    for key in normalized:
+        normalized[key] = normalize(key[1])
+    # Scatter the results back to every row
+    return [normalized[key] for key in keys], len(keys) - len(normalized)
+
+
+def normalize_phones(phones, batch_hits=None):
+    """
+    Formats a column of phone numbers to '0000 00 00 00'.
+
+    :param batch_hits: Counter: Optional counter of the rows that reused a value within the column, per cache (see cache_stats).
+    """
+    formatted, reused = normalize_column(format_phone_number, phones)
+    if batch_hits is not None:
+        batch_hits["phone"] += reused
+    return formatted
+
+
+def parse_dates(dates, batch_hits=None):
+    """
+    Parses a column of dates, None where the date can't be parsed.
+
+    The dates are parsed once, both their formatted text and their ordinal are derived from the result.
+
+    :param batch_hits: Counter: Optional counter of the rows that reused a value within the column, per cache (see cache_stats).
+    """
+    parsed_dates, reused = normalize_column(parse_date, dates)
+    if batch_hits is not None:
+        batch_hits["date"] += reused
+    return parsed_dates
+
+
+def normalize_dates(dates, batch_hits=None):
+    """Converts a column of date strings or datetimes to the format 'dd/mm/yyyy'."""
+    dates = list(dates)
+    return list(map(format_parsed_date, parse_dates(dates, batch_hits), dates))
+
+
+def date_ordinals(parsed_dates):
+    """Converts a column of dates from parse_dates to their ordinals, None where the date couldn't be parsed."""
+    return [parsed_date.toordinal() if parsed_date else None for parsed_date in parsed_dates]
+
+
+def resolve_gemeenten(gemeenten, straten=None, corrections=None):
+    """
+    Finds the (name, postcode) of every gemeente in a column, using the straten column to pick deelgemeenten.
+
+    :param gemeenten: iterable: The postcodes or names of the gemeenten.
+    :param straten: iterable: Optional streets of the addresses, in the same order.
+    :param corrections: dict: Fixes mistyped town names when given, recording every typed name -> town fixed in it.
+    :return: list: (name, postcode) for every gemeente, in the same order.
+    """
+    gemeenten = list(gemeenten)
+    fuzzy = corrections is not None
+    resolved, _ = normalize_column(partial(resolve_gemeente, fuzzy=fuzzy), gemeenten)
+    distinct = dict(zip(gemeenten, resolved))
+
+    if fuzzy:
+        # Names that aren't a known town as typed but were matched to one
+        for gemeente, (name, _) in distinct.items():
+            if (
+                isinstance(gemeente, str)
+                and not gemeente.isnumeric()
+                and not lookup_gemeente(gemeente)
+                and lookup_gemeente(name)
+            ):
+                corrections[gemeente] = name
+
+    if straten is None:
+        return resolved
+
+    # Only rows whose postcode is shared by several deelgemeenten, or whose town
+    # has postcodes in several provinces, need their street
+    shared_postcodes = set()
+    split_towns = {}
+    for gemeente, (_, postcode) in distinct.items():
+        if not isinstance(gemeente, str):
+            continue
+        if gemeente.isnumeric():
+            if len(lookup_towns(gemeente)) > 1:
+                shared_postcodes.add(gemeente)
+        elif postcode is None:
+            # Unknown names have no postcode either, only towns found once here are looked at per street
+            town = find_town(gemeente, fuzzy)
+            if town:
+                split_towns[gemeente] = town[1]
+
+    if shared_postcodes or split_towns:
+        for index, (gemeente, straat) in enumerate(zip(gemeenten, straten)):
+            if not straat:
+                continue
+            if gemeente in shared_postcodes:
+                resolved[index] = lookup_postcode(gemeente, straat), resolved[index][1]
+            elif gemeente in split_towns:
+                resolved[index] = resolved[index][0], pick_postcode(split_towns[gemeente], straat)
+    return resolved
+
+
+def normalize_gemeenten(gemeenten, straten=None):
+    """Replaces the postcodes in a column of gemeenten by their names, using the straten column to pick deelgemeenten."""
+    return [name for name, _ in resolve_gemeenten(gemeenten, straten)]
+
+
+def clean_bans(bans):
+    """Cleans a column of ban names by removing unwanted characters."""
+    return normalize_column(clean_ban, bans)[0]
+
+
+def cache_stats(batch_hits=None):
+    """
+    Returns the hit counters of the normalization caches.
+
+    Values repeated within a batch are deduplicated by normalize_column before they reach
+    the caches, those rows are counted as hits too, so the hit rate covers every row.
+
+    :param batch_hits: Counter: The rows that reused a value within a batch per cache,
+        as counted by normalize_phones and normalize_dates.
+    :return: dict: Per cache the hits (of which batch_hits within a batch), misses, current size and hit rate.
+    """
+    batch_hits = batch_hits or {}
+    # The cache behind every kind of value
+    caches = (
+        ("phone", format_phone_number),
+        ("date", parse_date),
+        ("name", fold),
+    )
+    stats = {}
+    for name, func in caches:
+        info = func.cache_info()
+        reused = batch_hits.get(name, 0)
+        hits = info.hits + reused
+        lookups = hits + info.misses
+        stats[name] = {
+            "hits": hits,
+            "batch_hits": reused,
+            "misses": info.misses,
+            "size": info.currsize,
+            "hit_rate": hits / lookups if lookups else 0.0,
+        }
+    return stats
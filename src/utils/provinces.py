@@ -0,0 +1,74 @@
+from bisect import bisect_right
+from functools import lru_cache
+
+# First postcode of every range with its province and region, in postcode order
+# Every range runs up to the first postcode of the next one, the last one up to 9999
+PROVINCE_RANGES = (
+    (1000, "Brussel", "Brussels Hoofdstedelijk Gewest"),
+    (1300, "Waals-Brabant", "Wallonië"),
+    (1500, "Vlaams-Brabant", "Vlaanderen"),
+    (2000, "Antwerpen", "Vlaanderen"),
+    (3000, "Vlaams-Brabant", "Vlaanderen"),
+    (3500, "Limburg", "Vlaanderen"),
+    (4000, "Luik", "Wallonië"),
+    (5000, "Namen", "Wallonië"),
+    (6000, "Henegouwen", "Wallonië"),
+    (6600, "Luxemburg", "Wallonië"),
+    (7000, "Henegouwen", "Wallonië"),
+    (8000, "West-Vlaanderen", "Vlaanderen"),
+    (9000, "Oost-Vlaanderen", "Vlaanderen"),
+)
+RANGE_STARTS = tuple(start for start, _, _ in PROVINCE_RANGES)
+LAST_POSTCODE = 9999
+
+
+def find_range(postcode):
+    """
+    Finds the range a postcode belongs to with a binary search on the range starts.
+
+    :param postcode: int or str: The postcode.
+    :return: tuple: (start, province, region) or None if the postcode is not Belgian.
+    """
+    try:
+        code = int(postcode)
+    except (TypeError, ValueError):
+        return None
+    if code < RANGE_STARTS[0] or code > LAST_POSTCODE:
+        return None
+    return PROVINCE_RANGES[bisect_right(RANGE_STARTS, code) - 1]
+
+
+@lru_cache(maxsize=None)
+def lookup_province(postcode):
+    """
+    Look up the province of a postcode.
+
+    :param postcode: int or str: The postcode.
+    :return: str: The province, Brussel for the Brussels region, empty if not found.
+    """
+    postcode_range = find_range(postcode)
+    return postcode_range[1] if postcode_range else ""
+
+
+@lru_cache(maxsize=None)
+def lookup_region(postcode):
+    """
+    Look up the region of a postcode.
+
+    :param postcode: int or str: The postcode.
+    :return: str: The region, empty if not found.
+    """
+    postcode_range = find_range(postcode)
+    return postcode_range[2] if postcode_range else ""
+
+
+def lookup_provinces(postcodes):
+    """
+    Look up the provinces of many postcodes at once, each distinct postcode only once.
+
+    :param postcodes: iterable: The postcodes.
+    :return: list: The province for every postcode, in the same order.
+    """
+    postcodes = list(postcodes)
+    provinces = {postcode: lookup_province(postcode) for postcode in set(postcodes)}
+    return [provinces[postcode] for postcode in postcodes]
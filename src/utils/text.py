@@ -0,0 +1,103 @@
+import re
+import unicodedata
+from functools import lru_cache
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# Number of distinct strings remembered by fold, first names and surnames repeat a lot
+FOLD_CACHE_SIZE = 16384
+
+# Apostrophes and periods are ignored when sorting names (D'Hondt sorts as Dhondt), hyphens separate words
+COLLATION_IGNORED_PATTERN = re.compile(r"['’.]")
+COLLATION_SEPARATOR_PATTERN = re.compile(r"[-\s]+")
+# Particles in front of Dutch and French surnames, only moved to the end when asked for
+NAME_PARTICLES = frozenset(
+    ("van", "vanden", "vander", "vande", "de", "den", "der", "des", "du", "di", "da",
+     "le", "la", "het", "t", "te", "ten", "ter", "op", "in")
+)
+
+
+def strip_accents(text):
+    """Removes the accents from a string, 'Liège' becomes 'Liege'."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+@lru_cache(maxsize=FOLD_CACHE_SIZE)
+def fold(text):
+    """
+    Folds a string to a form for comparing names: casefolded, without accents and with single spaces.
+
+    :param text: str: The text to fold.
+    :return: str: The folded text, empty for None.
+    """
+    if not text:
+        return ""
+    return strip_accents(WHITESPACE_PATTERN.sub(" ", str(text)).strip().casefold())
+
+
+@lru_cache(maxsize=FOLD_CACHE_SIZE)
+def collation_key(name, ignore_particles=False):
+    """
+    Returns the key a name is sorted on: folded like fold, without apostrophes or periods and with hyphens as spaces.
+
+    By default names sort the Belgian way, 'Van den Berg' under V. With ignore_particles the
+    leading particles are moved to the end, the way of the Netherlands, so it sorts under B.
+
+    :param name: str: The first name or surname.
+    :param ignore_particles: bool: Whether to sort surnames on the part after 'van', 'de', ...
+    :return: str: The collation key.
+    """
+    key = COLLATION_SEPARATOR_PATTERN.sub(" ", COLLATION_IGNORED_PATTERN.sub("", fold(name))).strip()
+    if ignore_particles:
+        words = key.split(" ")
+        position = 0
+        # Keep at least one word, a surname like 'De' is not only a particle
+        while position < len(words) - 1 and words[position] in NAME_PARTICLES:
+            position += 1
+        key = " ".join(words[position:] + words[:position])
+    return key
+
+
+def repair_mojibake(text):
+    """
+    Repairs UTF-8 text that was decoded as Windows-1252, 'PiÃ¨trebais' becomes 'Piètrebais'.
+
+    :param text: str: The possibly mis-decoded text.
+    :return: str: The repaired text, or the text itself if it wasn't mis-decoded.
+    """
+    if text.isascii():
+        return text
+    try:
+        return text.encode("cp1252").decode("utf-8")
+    except UnicodeError:
+        # Correctly decoded accents, like a lone 'é', are not valid UTF-8 once encoded
+        return text
+
+
+def display_name(text):
+    """Returns a name ready to be shown: mis-decoded characters repaired, NFC normalized and stripped."""
+    return unicodedata.normalize("NFC", repair_mojibake(text)).strip()
+
+
+def identity_key(voornaam, naam):
+    """
+    Returns the key identifying a person by name, the same for 'Émile Peeters' and 'emile  PEETERS'.
+
+    :param voornaam: str: The first name.
+    :param naam: str: The surname.
+    :return: tuple: The folded first name and surname.
+    """
+    return (fold(voornaam), fold(naam))
+
+
+def name_collation(voornaam, naam, ignore_particles=False):
+    """
+    Returns the key a person is sorted on by name, first name first.
+
+    :param voornaam: str: The first name.
+    :param naam: str: The surname.
+    :param ignore_particles: bool: Whether to sort surnames on the part after 'van', 'de', ...
+    :return: tuple: The collation keys of the first name and surname.
+    """
+    return (collation_key(voornaam), collation_key(naam, ignore_particles))
@@ -1,2768 +1,246 @@
-postcodeDict = {
-    1000:"Bruxelles",
-    1020:"Laeken",
-    1030:"Schaerbeek",
-    1040:"Etterbeek",
-    1050:"Ixelles",
-    1060:"Saint-Gilles",
-    1070:"Anderlecht",
-    1080:"Molenbeek-Saint-Jean",
-    1081:"Koekelberg",
-    1082:"Berchem-Sainte-Agathe",
-    1083:"Ganshoren",
-    1090:"Jette",
-    1120:"Neder-Over-Heembeek",
-    1130:"Haren",
-    1140:"Evere",
-    1150:"Woluwe-Saint-Pierre",
-    1160:"Auderghem",
-    1170:"Watermael-Boitsfort",
-    1180:"Uccle",
-    1190:"Forest",
-    1200:"Woluwe-Saint-Lambert",
-    1210:"Saint-Josse-Ten-Noode",
-    1300:"Limal",
-    1300:"Wavre",
-    1301:"Bierges",
-    1310:"La Hulpe",
-    1315:"Glimes",
-    1315:"Incourt",
-    1315:"Opprebais",
-    1315:"PiÃ¨trebais",
-    1315:"Roux-Miroir",
-    1320:"Beauvechain",
-    1320:"Hamme-Mille",
-    1320:"L'ecluse",
-    1320:"Nodebais",
-    1320:"Tourinnes-La-Grosse",
-    1325:"Bonlez",
-    1325:"Chaumont-Gistoux",
-    1325:"Corroy-Le-Grand",
-    1325:"Dion-Valmont",
-    1325:"Longueville",
-    1330:"Rixensart",
-    1331:"RosiÃ¨res",
-    1332:"Genval",
-    1340:"Ottignies",
-    1340:"Ottignies-Louvain-La-Neuve",
-    1341:"CÃ©roux-Mousty",
-    1342:"Limelette",
-    1348:"Louvain-La-Neuve",
-    1350:"Enines",
-    1350:"Folx-Les-Caves",
-    1350:"Jandrain-Jandrenouille",
-    1350:"Jauche",
-    1350:"Marilles",
-    1350:"Noduwez",
-    1350:"Orp-Jauche",
-    1350:"Orp-Le-Grand",
-    1357:"HÃ©lÃ©cine",
-    1357:"Linsmeau",
-    1357:"Neerheylissem",
-    1357:"Opheylissem",
-    1360:"MalÃ¨ves-Sainte-Marie-Wastines",
-    1360:"Orbais",
-    1360:"Perwez",
-    1360:"Thorembais-Les-BÃ©guines",
-    1360:"Thorembais-Saint-Trond",
-    1367:"Autre-Eglise",
-    1367:"Bomal",
-    1367:"GÃ©rompont",
-    1367:"Grand-RosiÃ¨re-Hottomont",
-    1367:"Huppaye",
-    1367:"Mont-Saint-AndrÃ©",
-    1367:"Ramillies",
-    1370:"Dongelberg",
-    1370:"Jauchelette",
-    1370:"Jodoigne",
-    1370:"Jodoigne-Souveraine",
-    1370:"Lathuy",
-    1370:"MÃ©lin",
-    1370:"PiÃ©train",
-    1370:"Saint-Jean-Geest",
-    1370:"Saint-Remy-Geest",
-    1370:"ZÃ©trud-Lumay",
-    1380:"Couture-Saint-Germain",
-    1380:"Lasne",
-    1380:"Lasne-Chapelle-Saint-Lambert",
-    1380:"Maransart",
-    1380:"Ohain",
-    1380:"Plancenoit",
-    1390:"Archennes",
-    1390:"Biez",
-    1390:"Bossut-Gottechain",
-    1390:"Grez-Doiceau",
-    1390:"Nethen",
-    1400:"Monstreux",
-    1400:"Nivelles",
-    1401:"Baulers",
-    1402:"Thines",
-    1404:"Bornival",
-    1410:"Waterloo",
-    1420:"Braine-L'alleud",
-    1421:"Ophain-Bois-Seigneur-Isaac",
-    1428:"Lillois-WitterzÃ©e",
-    1430:"Bierghes",
-    1430:"Quenast",
-    1430:"Rebecq",
-    1430:"Rebecq-Rognon",
-    1435:"Corbais",
-    1435:"HÃ©villers",
-    1435:"Mont-Saint-Guibert",
-    1440:"Braine-Le-ChÃ¢teau",
-    1440:"Wauthier-Braine",
-    1450:"Chastre",
-    1450:"Chastre-Villeroux-Blanmont",
-    1450:"Cortil-Noirmont",
-    1450:"Gentinnes",
-    1450:"Saint-GÃ©ry",
-    1457:"Nil-Saint-Vincent-Saint-Martin",
-    1457:"Tourinnes-Saint-Lambert",
-    1457:"Walhain",
-    1457:"Walhain-Saint-Paul",
-    1460:"Ittre",
-    1460:"Virginal-Samme",
-    1461:"Haut-Ittre",
-    1470:"Baisy-Thy",
-    1470:"Bousval",
-    1470:"Genappe",
-    1471:"Loupoigne",
-    1472:"Vieux-Genappe",
-    1473:"Glabais",
-    1474:"Ways",
-    1476:"Houtain-Le-Val",
-    1480:"Clabecq",
-    1480:"Oisquercq",
-    1480:"Saintes",
-    1480:"Tubize",
-    1490:"Court-Saint-Etienne",
-    1495:"Marbais",
-    1495:"Mellery",
-    1495:"Sart-Dames-Avelines",
-    1495:"Tilly",
-    1495:"Villers-La-Ville",
-    1500:"Halle",
-    1501:"Buizingen",
-    1502:"Lembeek",
-    1540:"Herfelingen",
-    1540:"Herne",
-    1541:"Sint-Pieters-Kapelle",
-    1547:"BiÃ©vÃ¨ne",
-    1560:"Hoeilaart",
-    1570:"Galmaarden",
-    1570:"Tollembeek",
-    1570:"Vollezele",
-    1600:"Oudenaken",
-    1600:"Sint-Laureins-Berchem",
-    1600:"Sint-Pieters-Leeuw",
-    1601:"Ruisbroek",
-    1602:"Vlezenbeek",
-    1620:"Drogenbos",
-    1630:"Linkebeek",
-    1640:"Rhode-Saint-GenÃ¨se",
-    1650:"Beersel",
-    1651:"Lot",
-    1652:"Alsemberg",
-    1653:"Dworp",
-    1654:"Huizingen",
-    1670:"Bogaarden",
-    1670:"Heikruis",
-    1670:"Pepingen",
-    1671:"Elingen",
-    1673:"Beert",
-    1674:"Bellingen",
-    1700:"Dilbeek",
-    1700:"Sint-Martens-Bodegem",
-    1700:"Sint-Ulriks-Kapelle",
-    1701:"Itterbeek",
-    1702:"Groot-Bijgaarden",
-    1703:"Schepdaal",
-    1730:"Asse",
-    1730:"Bekkerzeel",
-    1730:"Kobbegem",
-    1730:"Mollem",
-    1731:"Relegem",
-    1731:"Zellik",
-    1740:"Ternat",
-    1741:"Wambeek",
-    1742:"Sint-Katherina-Lombeek",
-    1745:"Mazenzele",
-    1745:"Opwijk",
-    1750:"Gaasbeek",
-    1750:"Lennik",
-    1750:"Sint-Kwintens-Lennik",
-    1750:"Sint-Martens-Lennik",
-    1755:"Gooik",
-    1755:"Kester",
-    1755:"Leerbeek",
-    1755:"Oetingen",
-    1760:"Onze-Lieve-Vrouw-Lombeek",
-    1760:"Pamel",
-    1760:"Roosdaal",
-    1760:"Strijtem",
-    1761:"Borchtlombeek",
-    1770:"Liedekerke",
-    1780:"Wemmel",
-    1785:"Brussegem",
-    1785:"Hamme",
-    1785:"Merchtem",
-    1790:"Affligem",
-    1790:"Essene",
-    1790:"Hekelgem",
-    1790:"Teralfene",
-    1800:"Peutie",
-    1800:"Vilvoorde",
-    1820:"Melsbroek",
-    1820:"Perk",
-    1820:"Steenokkerzeel",
-    1830:"Machelen",
-    1831:"Diegem",
-    1840:"Londerzeel",
-    1840:"Malderen",
-    1840:"Steenhuffel",
-    1850:"Grimbergen",
-    1851:"Humbeek",
-    1852:"Beigem",
-    1853:"Strombeek-Bever",
-    1860:"Meise",
-    1861:"Wolvertem",
-    1880:"Kapelle-Op-Den-Bos",
-    1880:"Nieuwenrode",
-    1880:"Ramsdonk",
-    1910:"Berg",
-    1910:"Buken",
-    1910:"Kampenhout",
-    1910:"Nederokkerzeel",
-    1930:"Nossegem",
-    1930:"Zaventem",
-    1932:"Sint-Stevens-Woluwe",
-    1933:"Sterrebeek",
-    1950:"Kraainem",
-    1970:"Wezembeek-Oppem",
-    1980:"Eppegem",
-    1980:"Zemst",
-    1981:"Hofstade",
-    1982:"Elewijt",
-    1982:"Weerde",
-    2000:"Antwerpen",
-    2018:"Antwerpen",
-    2020:"Antwerpen",
-    2030:"Antwerpen",
-    2040:"Antwerpen",
-    2040:"Berendrecht",
-    2040:"Lillo",
-    2040:"Zandvliet",
-    2050:"Antwerpen",
-    2060:"Antwerpen",
-    2070:"Burcht",
-    2070:"Zwijndrecht",
-    2100:"Deurne",
-    2110:"Wijnegem",
-    2140:"Borgerhout",
-    2150:"Borsbeek",
-    2160:"Wommelgem",
-    2170:"Merksem",
-    2180:"Ekeren",
-    2200:"Herentals",
-    2200:"Morkhoven",
-    2200:"Noorderwijk",
-    2220:"Hallaar",
-    2220:"Heist-Op-Den-Berg",
-    2221:"Booischot",
-    2222:"Itegem",
-    2222:"Wiekevorst",
-    2223:"Schriek",
-    2230:"Herselt",
-    2230:"Ramsel",
-    2235:"Houtvenne",
-    2235:"Hulshout",
-    2235:"Westmeerbeek",
-    2240:"Massenhoven",
-    2240:"Viersel",
-    2240:"Zandhoven",
-    2242:"Pulderbos",
-    2243:"Pulle",
-    2250:"Olen",
-    2260:"Oevel",
-    2260:"Tongerlo",
-    2260:"Westerlo",
-    2260:"Zoerle-Parwijs",
-    2270:"Herenthout",
-    2275:"Gierle",
-    2275:"Lille",
-    2275:"Poederlee",
-    2275:"Wechelderzande",
-    2280:"Grobbendonk",
-    2288:"Bouwel",
-    2290:"Vorselaar",
-    2300:"Turnhout",
-    2310:"Rijkevorsel",
-    2320:"Hoogstraten",
-    2321:"Meer",
-    2322:"Minderhout",
-    2323:"Wortel",
-    2328:"Meerle",
-    2330:"Merksplas",
-    2340:"Beerse",
-    2340:"Vlimmeren",
-    2350:"Vosselaar",
-    2360:"Oud-Turnhout",
-    2370:"Arendonk",
-    2380:"Ravels",
-    2381:"Weelde",
-    2382:"Poppel",
-    2387:"Baarle-Hertog",
-    2390:"Malle",
-    2390:"Oostmalle",
-    2390:"Westmalle",
-    2400:"Mol",
-    2430:"Eindhout",
-    2430:"Laakdal",
-    2430:"Vorst",
-    2431:"Varendonk",
-    2431:"Veerle",
-    2440:"Geel",
-    2450:"Meerhout",
-    2460:"Kasterlee",
-    2460:"Lichtaart",
-    2460:"Tielen",
-    2470:"Retie",
-    2480:"Dessel",
-    2490:"Balen",
-    2491:"Olmen",
-    2500:"Koningshooikt",
-    2500:"Lier",
-    2520:"Broechem",
-    2520:"Emblem",
-    2520:"Oelegem",
-    2520:"Ranst",
-    2530:"Boechout",
-    2531:"Vremde",
-    2540:"Hove",
-    2547:"Lint",
-    2550:"Kontich",
-    2550:"Waarloos",
-    2560:"Bevel",
-    2560:"Kessel",
-    2560:"Nijlen",
-    2570:"Duffel",
-    2580:"Beerzel",
-    2580:"Putte",
-    2590:"Berlaar",
-    2590:"Gestel",
-    2600:"Berchem",
-    2610:"Wilrijk",
-    2620:"Hemiksem",
-    2627:"Schelle",
-    2630:"Aartselaar",
-    2640:"Mortsel",
-    2650:"Edegem",
-    2660:"Hoboken",
-    2800:"Mechelen",
-    2800:"Walem",
-    2801:"Heffen",
-    2811:"Hombeek",
-    2811:"Leest",
-    2812:"Muizen",
-    2820:"Bonheiden",
-    2820:"Rijmenam",
-    2830:"Blaasveld",
-    2830:"Heindonk",
-    2830:"Tisselt",
-    2830:"Willebroek",
-    2840:"Reet",
-    2840:"Rumst",
-    2840:"Terhagen",
-    2845:"Niel",
-    2850:"Boom",
-    2860:"Sint-Katelijne-Waver",
-    2861:"Onze-Lieve-Vrouw-Waver",
-    2870:"Breendonk",
-    2870:"Liezele",
-    2870:"Puurs",
-    2870:"Ruisbroek",
-    2880:"Bornem",
-    2880:"Hingene",
-    2880:"Mariekerke",
-    2880:"Weert",
-    2890:"Lippelo",
-    2890:"Oppuurs",
-    2890:"Sint-Amands",
-    2900:"Schoten",
-    2910:"Essen",
-    2920:"Kalmthout",
-    2930:"Brasschaat",
-    2940:"Hoevenen",
-    2940:"Stabroek",
-    2950:"Kapellen",
-    2960:"Brecht",
-    2960:"Sint-Job-In-'t-Goor",
-    2960:"Sint-Lenaarts",
-    2970:"'s Gravenwezel",
-    2970:"Schilde",
-    2980:"Halle",
-    2980:"Zoersel",
-    2990:"Loenhout",
-    2990:"Wuustwezel",
-    3000:"Leuven",
-    3001:"Heverlee",
-    3010:"Kessel Lo",
-    3012:"Wilsele",
-    3018:"Wijgmaal",
-    3020:"Herent",
-    3020:"Veltem-Beisem",
-    3020:"Winksele",
-    3040:"Huldenberg",
-    3040:"Loonbeek",
-    3040:"Neerijse",
-    3040:"Ottenburg",
-    3040:"Sint-Agatha-Rode",
-    3050:"Oud-Heverlee",
-    3051:"Sint-Joris-Weert",
-    3052:"Blanden",
-    3053:"Haasrode",
-    3054:"Vaalbeek",
-    3060:"Bertem",
-    3060:"Korbeek-Dijle",
-    3061:"Leefdaal",
-    3070:"Kortenberg",
-    3071:"Erps-Kwerps",
-    3078:"Everberg",
-    3078:"Meerbeek",
-    3080:"Duisburg",
-    3080:"Tervuren",
-    3080:"Vossem",
-    3090:"Overijse",
-    3110:"Rotselaar",
-    3111:"Wezemaal",
-    3118:"Werchter",
-    3120:"Tremelo",
-    3128:"Baal",
-    3130:"Begijnendijk",
-    3130:"Betekom",
-    3140:"Keerbergen",
-    3150:"Haacht",
-    3150:"Tildonk",
-    3150:"Wespelaar",
-    3190:"Boortmeerbeek",
-    3191:"Hever",
-    3200:"Aarschot",
-    3200:"Gelrode",
-    3201:"Langdorp",
-    3202:"Rillaar",
-    3210:"Linden",
-    3210:"Lubbeek",
-    3211:"Binkom",
-    3212:"Pellenberg",
-    3220:"Holsbeek",
-    3220:"Kortrijk-Dutsel",
-    3220:"Sint-Pieters-Rode",
-    3221:"Nieuwrode",
-    3270:"Scherpenheuvel",
-    3270:"Scherpenheuvel-Zichem",
-    3271:"Averbode",
-    3271:"Zichem",
-    3272:"Messelbroek",
-    3272:"Testelt",
-    3290:"Deurne",
-    3290:"Diest",
-    3290:"Schaffen",
-    3290:"Webbekom",
-    3293:"Kaggevinne",
-    3294:"Molenstede",
-    3300:"Bost",
-    3300:"Goetsenhoven",
-    3300:"Hakendover",
-    3300:"Kumtich",
-    3300:"Oorbeek",
-    3300:"Oplinter",
-    3300:"Sint-Margriete-Houtem",
-    3300:"Tienen",
-    3300:"Vissenaken",
-    3320:"Hoegaarden",
-    3320:"Meldert",
-    3321:"Outgaarden",
-    3350:"Drieslinter",
-    3350:"Linter",
-    3350:"Melkwezer",
-    3350:"Neerhespen",
-    3350:"Neerlinter",
-    3350:"Orsmaal-Gussenhoven",
-    3350:"Overhespen",
-    3350:"Wommersom",
-    3360:"Bierbeek",
-    3360:"Korbeek-Lo",
-    3360:"Lovenjoel",
-    3360:"Opvelp",
-    3370:"Boutersem",
-    3370:"Kerkom",
-    3370:"Neervelp",
-    3370:"Roosbeek",
-    3370:"Vertrijk",
-    3370:"Willebringen",
-    3380:"Bunsbeek",
-    3380:"Glabbeek",
-    3381:"Kapellen",
-    3384:"Attenrode",
-    3390:"Houwaart",
-    3390:"Sint-Joris-Winge",
-    3390:"Tielt",
-    3390:"Tielt-Winge",
-    3391:"Meensel-Kiezegem",
-    3400:"Eliksem",
-    3400:"Ezemaal",
-    3400:"Laar",
-    3400:"Landen",
-    3400:"Neerwinden",
-    3400:"Overwinden",
-    3400:"Rumsdorp",
-    3400:"Wange",
-    3401:"Waasmont",
-    3401:"Walsbets",
-    3401:"Walshoutem",
-    3401:"Wezeren",
-    3404:"Attenhoven",
-    3404:"Neerlanden",
-    3440:"Budingen",
-    3440:"Dormaal",
-    3440:"Halle-Booienhoven",
-    3440:"Helen-Bos",
-    3440:"Zoutleeuw",
-    3450:"Geetbets",
-    3450:"Grazen",
-    3454:"Rummen",
-    3460:"Assent",
-    3460:"Bekkevoort",
-    3461:"Molenbeek-Wersbeek",
-    3470:"Kortenaken",
-    3470:"Ransberg",
-    3470:"Sint-Margriete-Houtem",
-    3471:"Hoeleden",
-    3472:"Kersbeek-Miskom",
-    3473:"Waanrode",
-    3500:"Hasselt",
-    3500:"Sint-Lambrechts-Herk",
-    3501:"Wimmertingen",
-    3510:"Kermt",
-    3510:"Spalbeek",
-    3511:"Kuringen",
-    3511:"Stokrooie",
-    3512:"Stevoort",
-    3520:"Zonhoven",
-    3530:"Helchteren",
-    3530:"Houthalen",
-    3530:"Houthalen-Helchteren",
-    3540:"Berbroek",
-    3540:"Donk",
-    3540:"Herk-De-Stad",
-    3540:"Schulen",
-    3545:"Halen",
-    3545:"Loksbergen",
-    3545:"Zelem",
-    3550:"Heusden",
-    3550:"Heusden-Zolder",
-    3550:"Zolder",
-    3560:"Linkhout",
-    3560:"Lummen",
-    3560:"Meldert",
-    3570:"Alken",
-    3580:"Beringen",
-    3581:"Beverlo",
-    3582:"Koersel",
-    3583:"Paal",
-    3590:"Diepenbeek",
-    3600:"Genk",
-    3620:"Gellik",
-    3620:"Lanaken",
-    3620:"Neerharen",
-    3620:"Veldwezelt",
-    3621:"Rekem",
-    3630:"Eisden",
-    3630:"Leut",
-    3630:"Maasmechelen",
-    3630:"Mechelen-Aan-De-Maas",
-    3630:"Meeswijk",
-    3630:"Opgrimbie",
-    3630:"Vucht",
-    3631:"Boorsem",
-    3631:"Uikhoven",
-    3640:"Kessenich",
-    3640:"Kinrooi",
-    3640:"Molenbeersel",
-    3640:"Ophoven",
-    3650:"Dilsen",
-    3650:"Dilsen-Stokkem",
-    3650:"Elen",
-    3650:"Lanklaar",
-    3650:"Rotem",
-    3650:"Stokkem",
-    3660:"Opglabbeek",
-    3665:"As",
-    3668:"Niel-Bij-As",
-    3670:"Ellikom",
-    3670:"Gruitrode",
-    3670:"Meeuwen",
-    3670:"Meeuwen-Gruitrode",
-    3670:"Neerglabbeek",
-    3670:"Wijshagen",
-    3680:"Maaseik",
-    3680:"Neeroeteren",
-    3680:"Opoeteren",
-    3690:"Zutendaal",
-    3700:"'s Herenelderen",
-    3700:"Berg",
-    3700:"Diets-Heur",
-    3700:"Haren",
-    3700:"Henis",
-    3700:"Kolmont",
-    3700:"Koninksem",
-    3700:"Lauw",
-    3700:"Mal",
-    3700:"Neerrepen",
-    3700:"Nerem",
-    3700:"Overrepen",
-    3700:"Piringen",
-    3700:"Riksingen",
-    3700:"Rutten",
-    3700:"Sluizen",
-    3700:"Tongeren",
-    3700:"Vreren",
-    3700:"Widooie",
-    3717:"Herstappe",
-    3720:"Kortessem",
-    3721:"Vliermaalroot",
-    3722:"Wintershoven",
-    3723:"Guigoven",
-    3724:"Vliermaal",
-    3730:"Hoeselt",
-    3730:"Romershoven",
-    3730:"Sint-Huibrechts-Hern",
-    3730:"Werm",
-    3732:"Schalkhoven",
-    3740:"Beverst",
-    3740:"Bilzen",
-    3740:"Eigenbilzen",
-    3740:"Grote-Spouwen",
-    3740:"Hees",
-    3740:"Kleine-Spouwen",
-    3740:"Mopertingen",
-    3740:"Munsterbilzen",
-    3740:"Rijkhoven",
-    3740:"Rosmeer",
-    3740:"Waltwilder",
-    3742:"Martenslinde",
-    3746:"Hoelbeek",
-    3770:"Genoelselderen",
-    3770:"Herderen",
-    3770:"Kanne",
-    3770:"Membruggen",
-    3770:"Millen",
-    3770:"Riemst",
-    3770:"Val-Meer",
-    3770:"Vlijtingen",
-    3770:"Vroenhoven",
-    3770:"Zichen-Zussen-Bolder",
-    3790:"Fouron-Saint-Martin",
-    3790:"Fourons",
-    3790:"Mouland",
-    3791:"Remersdaal",
-    3792:"Fouron-Saint-Pierre",
-    3793:"Teuven",
-    3798:"Fouron-Le-Comte",
-    3800:"Aalst",
-    3800:"Brustem",
-    3800:"Engelmanshoven",
-    3800:"Gelinden",
-    3800:"Groot-Gelmen",
-    3800:"Halmaal",
-    3800:"Kerkom-Bij-Sint-Truiden",
-    3800:"Ordingen",
-    3800:"Sint-Truiden",
-    3800:"Zepperen",
-    3803:"Duras",
-    3803:"Gorsem",
-    3803:"Runkelen",
-    3803:"Wilderen",
-    3806:"Velm",
-    3830:"Berlingen",
-    3830:"Wellen",
-    3831:"Herten",
-    3832:"Ulbeek",
-    3840:"Bommershoven",
-    3840:"Borgloon",
-    3840:"Broekom",
-    3840:"Gors-Opleeuw",
-    3840:"Gotem",
-    3840:"Groot-Loon",
-    3840:"Haren",
-    3840:"Hendrieken",
-    3840:"Hoepertingen",
-    3840:"Jesseren",
-    3840:"Kerniel",
-    3840:"Kolmont",
-    3840:"Kuttekoven",
-    3840:"Rijkel",
-    3840:"Voort",
-    3850:"Binderveld",
-    3850:"Kozen",
-    3850:"Nieuwerkerken",
-    3850:"Wijer",
-    3870:"Batsheers",
-    3870:"Bovelingen",
-    3870:"Heers",
-    3870:"Heks",
-    3870:"Horpmaal",
-    3870:"Klein-Gelmen",
-    3870:"Mechelen-Bovelingen",
-    3870:"Mettekoven",
-    3870:"Opheers",
-    3870:"Rukkelingen-Loon",
-    3870:"Vechmaal",
-    3870:"Veulen",
-    3890:"Boekhout",
-    3890:"Gingelom",
-    3890:"Jeuk",
-    3890:"Kortijs",
-    3890:"Montenaken",
-    3890:"Niel-Bij-Sint-Truiden",
-    3890:"Vorsen",
-    3891:"Borlo",
-    3891:"Buvingen",
-    3891:"Mielen-Boven-Aalst",
-    3891:"Muizen",
-    3900:"Overpelt",
-    3910:"Neerpelt",
-    3910:"Sint-Huibrechts-Lille",
-    3920:"Lommel",
-    3930:"Achel",
-    3930:"Hamont",
-    3930:"Hamont-Achel",
-    3940:"Hechtel",
-    3940:"Hechtel-Eksel",
-    3941:"Eksel",
-    3945:"Ham",
-    3945:"Kwaadmechelen",
-    3945:"Oostham",
-    3950:"Bocholt",
-    3950:"Kaulille",
-    3950:"Reppel",
-    3960:"Beek",
-    3960:"Bree",
-    3960:"Gerdingen",
-    3960:"Opitter",
-    3960:"Tongerlo",
-    3970:"Leopoldsburg",
-    3971:"Heppen",
-    3980:"Tessenderlo",
-    3990:"Grote-Brogel",
-    3990:"Kleine-Brogel",
-    3990:"Peer",
-    3990:"Wijchmaal",
-    4000:"Glain",
-    4000:"LiÃ¨ge",
-    4000:"Rocourt",
-    4020:"Bressoux",
-    4020:"Jupille-Sur-Meuse",
-    4020:"LiÃ¨ge",
-    4020:"Wandre",
-    4030:"Grivegnee",
-    4031:"Angleur",
-    4032:"ChÃªnee",
-    4040:"Herstal",
-    4041:"Milmort",
-    4041:"Vottem",
-    4042:"Liers",
-    4050:"Chaudfontaine",
-    4051:"Vaux-Sous-ChÃ¨vremont",
-    4052:"Beaufays",
-    4053:"Embourg",
-    4100:"Boncelles",
-    4100:"Seraing",
-    4101:"Jemeppe-Sur-Meuse",
-    4102:"OugrÃ©e",
-    4120:"Ehein",
-    4120:"NeuprÃ©",
-    4120:"Rotheux-RimiÃ¨re",
-    4121:"Neuville-En-Condroz",
-    4122:"Plainevaux",
-    4130:"Esneux",
-    4130:"Tilff",
-    4140:"Dolembreux",
-    4140:"GomzÃ©-Andoumont",
-    4140:"Rouvreux",
-    4140:"Sprimont",
-    4141:"LouveignÃ©",
-    4160:"Anthisnes",
-    4161:"Villers-Aux-Tours",
-    4162:"Hody",
-    4163:"Tavier",
-    4170:"Comblain-Au-Pont",
-    4171:"Poulseur",
-    4180:"Comblain-Fairon",
-    4180:"Comblain-La-Tour",
-    4180:"Hamoir",
-    4181:"Filot",
-    4190:"FerriÃ¨res",
-    4190:"My",
-    4190:"Vieuxville",
-    4190:"Werbomont",
-    4190:"Xhoris",
-    4210:"Burdinne",
-    4210:"HannÃªche",
-    4210:"LamontzÃ©e",
-    4210:"Marneffe",
-    4210:"Oteppe",
-    4217:"HÃ©ron",
-    4217:"Lavoir",
-    4217:"Waret-L'evÃªque",
-    4218:"Couthuin",
-    4219:"Acosse",
-    4219:"Ambresin",
-    4219:"Meeffe",
-    4219:"Wasseiges",
-    4250:"BoÃ«lhe",
-    4250:"Geer",
-    4250:"Hollogne-Sur-Geer",
-    4250:"Lens-Saint-Servais",
-    4252:"Omal",
-    4253:"Darion",
-    4254:"Ligney",
-    4257:"Berloz",
-    4257:"Corswarem",
-    4260:"Avennes",
-    4260:"Braives",
-    4260:"Ciplet",
-    4260:"Fallais",
-    4260:"Fumal",
-    4260:"Ville-En-Hesbaye",
-    4261:"Latinne",
-    4263:"Tourinne",
-    4280:"Abolens",
-    4280:"Avernas-Le-Bauduin",
-    4280:"Avin",
-    4280:"BertrÃ©e",
-    4280:"Blehen",
-    4280:"Cras-Avernas",
-    4280:"Crehen",
-    4280:"Grand-Hallet",
-    4280:"Hannut",
-    4280:"Lens-Saint-Remy",
-    4280:"Merdorp",
-    4280:"Moxhe",
-    4280:"Petit-Hallet",
-    4280:"Poucet",
-    4280:"Thisnes",
-    4280:"TrognÃ©e",
-    4280:"Villers-Le-Peuplier",
-    4280:"Wansin",
-    4287:"Lincent",
-    4287:"Pellaines",
-    4287:"Racour",
-    4300:"Bettincourt",
-    4300:"Bleret",
-    4300:"Bovenistier",
-    4300:"Grand-Axhe",
-    4300:"Lantremange",
-    4300:"Oleye",
-    4300:"Waremme",
-    4317:"Aineffe",
-    4317:"Borlez",
-    4317:"Celles",
-    4317:"Faimes",
-    4317:"Les Waleffes",
-    4317:"Viemme",
-    4340:"Awans",
-    4340:"Fooz",
-    4340:"OthÃ©e",
-    4340:"Villers-L'evÃªque",
-    4342:"Hognoul",
-    4347:"Fexhe-Le-Haut-Clocher",
-    4347:"Freloux",
-    4347:"Noville",
-    4347:"Roloux",
-    4347:"Voroux-Goreux",
-    4350:"Lamine",
-    4350:"Momalle",
-    4350:"Pousset",
-    4350:"Remicourt",
-    4351:"Hodeige",
-    4357:"Donceel",
-    4357:"Haneffe",
-    4357:"Jeneffe",
-    4357:"Limont",
-    4360:"Bergilers",
-    4360:"Grandville",
-    4360:"Lens-Sur-Geer",
-    4360:"Oreye",
-    4360:"Otrange",
-    4367:"CrisnÃ©e",
-    4367:"Fize-Le-Marsal",
-    4367:"Kemexhe",
-    4367:"Odeur",
-    4367:"Thys",
-    4400:"Awirs",
-    4400:"Chokier",
-    4400:"FlÃ©malle",
-    4400:"FlÃ©malle-Grande",
-    4400:"FlÃ©malle-Haute",
-    4400:"Ivoz-Ramet",
-    4400:"Mons-Lez-LiÃ¨ge",
-    4420:"MontegnÃ©e",
-    4420:"Saint-Nicolas",
-    4420:"Tilleur",
-    4430:"Ans",
-    4431:"Loncin",
-    4432:"Alleur",
-    4432:"Xhendremael",
-    4450:"Juprelle",
-    4450:"Lantin",
-    4450:"Slins",
-    4451:"Voroux-Lez-Liers",
-    4452:"Paifve",
-    4452:"Wihogne",
-    4453:"Villers-Saint-SimÃ©on",
-    4458:"Fexhe-Slins",
-    4460:"Bierset",
-    4460:"GrÃ¢ce-Berleur",
-    4460:"GrÃ¢ce-Hollogne",
-    4460:"Hollogne-Aux-Pierres",
-    4460:"Horion-HozÃ©mont",
-    4460:"Velroux",
-    4470:"Saint-Georges-Sur-Meuse",
-    4480:"Clermont-Sous-Huy",
-    4480:"Ehein",
-    4480:"Engis",
-    4480:"Hermalle-Sous-Huy",
-    4500:"Ben-Ahin",
-    4500:"Huy",
-    4500:"Tihange",
-    4520:"Antheit",
-    4520:"Bas-Oha",
-    4520:"Huccorgne",
-    4520:"Moha",
-    4520:"Vinalmont",
-    4520:"Wanze",
-    4530:"Fize-Fontaine",
-    4530:"Vaux-Et-Borset",
-    4530:"Vieux-Waleffe",
-    4530:"Villers-Le-Bouillet",
-    4530:"Warnant-Dreye",
-    4537:"BodegnÃ©e",
-    4537:"Chapon-Seraing",
-    4537:"Seraing-Le-ChÃ¢teau",
-    4537:"Verlaine",
-    4540:"Amay",
-    4540:"Ampsin",
-    4540:"FlÃ´ne",
-    4540:"Jehay",
-    4540:"Ombret",
-    4550:"Nandrin",
-    4550:"Saint-SÃ©verin",
-    4550:"Villers-Le-Temple",
-    4550:"YernÃ©e-Fraineux",
-    4557:"AbÃ©e",
-    4557:"Fraiture",
-    4557:"Ramelot",
-    4557:"Seny",
-    4557:"Soheit-Tinlot",
-    4557:"Tinlot",
-    4560:"Bois-Et-Borsu",
-    4560:"Clavier",
-    4560:"Les Avins",
-    4560:"Ocquier",
-    4560:"Pailhe",
-    4560:"Terwagne",
-    4570:"Marchin",
-    4570:"Vyle-Et-Tharoul",
-    4577:"Modave",
-    4577:"Outrelouxhe",
-    4577:"StrÃ©e-Lez-Huy",
-    4577:"Vierset-Barse",
-    4590:"Ellemelle",
-    4590:"Ouffet",
-    4590:"WarzÃ©e",
-    4600:"Lanaye",
-    4600:"Lixhe",
-    4600:"Richelle",
-    4600:"VisÃ©",
-    4601:"Argenteau",
-    4602:"Cheratte",
-    4606:"Saint-AndrÃ©",
-    4607:"Berneau",
-    4607:"Bombaye",
-    4607:"Dalhem",
-    4607:"Feneur",
-    4607:"Mortroux",
-    4608:"NeufchÃ¢teau",
-    4608:"Warsage",
-    4610:"Bellaire",
-    4610:"Beyne-Heusay",
-    4610:"Queue-Du-Bois",
-    4620:"FlÃ©ron",
-    4621:"Retinne",
-    4623:"MagnÃ©e",
-    4624:"RomsÃ©e",
-    4630:"Ayeneux",
-    4630:"Micheroux",
-    4630:"Soumagne",
-    4630:"TignÃ©e",
-    4631:"EvegnÃ©e",
-    4632:"CÃ©rexhe-Heuseux",
-    4633:"Melen",
-    4650:"Chaineux",
-    4650:"Grand-Rechain",
-    4650:"Herve",
-    4650:"JulÃ©mont",
-    4651:"Battice",
-    4652:"Xhendelesse",
-    4653:"Bolland",
-    4654:"Charneux",
-    4670:"BlÃ©gny",
-    4670:"Mortier",
-    4670:"Trembleur",
-    4671:"Barchon",
-    4671:"Housse",
-    4671:"Saive",
-    4672:"Saint-Remy",
-    4680:"HermÃ©e",
-    4680:"Oupeye",
-    4681:"Hermalle-Sous-Argenteau",
-    4682:"Heure-Le-Romain",
-    4682:"Houtain-Saint-SimÃ©on",
-    4683:"Vivegnis",
-    4684:"Haccourt",
-    4690:"Bassenge",
-    4690:"Boirs",
-    4690:"Eben-Emael",
-    4690:"Glons",
-    4690:"Roclenge-Sur-Geer",
-    4690:"Wonck",
-    4700:"Eupen",
-    4701:"Kettenis",
-    4710:"Lontzen",
-    4711:"Walhorn",
-    4720:"La Calamine",
-    4721:"Neu-Moresnet",
-    4728:"Hergenrath",
-    4730:"Hauset",
-    4730:"Raeren",
-    4731:"Eynatten",
-    4750:"Butgenbach",
-    4750:"Elsenborn",
-    4760:"Bullange",
-    4760:"Manderfeld",
-    4761:"Rocherath",
-    4770:"AmblÃ¨ve",
-    4770:"Meyerode",
-    4771:"Heppenbach",
-    4780:"Recht",
-    4780:"Saint-Vith",
-    4782:"Schoenberg",
-    4783:"Lommersweiler",
-    4784:"Crombach",
-    4790:"Burg-Reuland",
-    4790:"Reuland",
-    4791:"Thommen",
-    4800:"Ensival",
-    4800:"Lambermont",
-    4800:"Petit-Rechain",
-    4800:"Polleur",
-    4800:"Verviers",
-    4801:"Stembert",
-    4802:"Heusy",
-    4820:"Dison",
-    4821:"Andrimont",
-    4830:"Limbourg",
-    4831:"Bilstain",
-    4834:"GoÃ©",
-    4837:"Baelen",
-    4837:"Membach",
-    4840:"Welkenraedt",
-    4841:"Henri-Chapelle",
-    4845:"Jalhay",
-    4845:"Sart-Lez-Spa",
-    4850:"Montzen",
-    4850:"Moresnet",
-    4850:"PlombiÃ¨res",
-    4851:"Gemmenich",
-    4851:"Sippenaeken",
-    4852:"Hombourg",
-    4860:"Cornesse",
-    4860:"Pepinster",
-    4860:"Wegnez",
-    4861:"Soiron",
-    4870:"ForÃªt",
-    4870:"Fraipont",
-    4870:"Nessonvaux",
-    4870:"Trooz",
-    4877:"Olne",
-    4880:"Aubel",
-    4890:"Clermont",
-    4890:"Thimister",
-    4890:"Thimister-Clermont",
-    4900:"Spa",
-    4910:"La Reid",
-    4910:"Polleur",
-    4910:"Theux",
-    4920:"Aywaille",
-    4920:"Ernonheid",
-    4920:"HarzÃ©",
-    4920:"LouveignÃ©",
-    4950:"Faymonville",
-    4950:"Robertville",
-    4950:"Sourbrodt",
-    4950:"Waimes",
-    4960:"BevercÃ©",
-    4960:"Malmedy",
-    4970:"Francorchamps",
-    4970:"Stavelot",
-    4980:"Fosse",
-    4980:"Trois-Ponts",
-    4980:"Wanne",
-    4983:"Basse-Bodeux",
-    4987:"Chevron",
-    4987:"La Gleize",
-    4987:"LorcÃ©",
-    4987:"Rahier",
-    4987:"Stoumont",
-    4990:"Arbrefontaine",
-    4990:"Bra",
-    4990:"Lierneux",
-    5000:"Beez",
-    5000:"Namur",
-    5001:"Belgrade",
-    5002:"Saint-Servais",
-    5003:"Saint-Marc",
-    5004:"Bouge",
-    5020:"Champion",
-    5020:"Daussoulx",
-    5020:"Flawinne",
-    5020:"Malonne",
-    5020:"SuarlÃ©e",
-    5020:"Temploux",
-    5020:"Vedrin",
-    5021:"Boninne",
-    5022:"CognelÃ©e",
-    5024:"GelbressÃ©e",
-    5024:"Marche-Les-Dames",
-    5030:"Beuzet",
-    5030:"Ernage",
-    5030:"Gembloux",
-    5030:"Grand-Manil",
-    5030:"LonzÃ©e",
-    5030:"SauveniÃ¨re",
-    5031:"Grand-Leez",
-    5032:"BossiÃ¨re",
-    5032:"Bothey",
-    5032:"Corroy-Le-ChÃ¢teau",
-    5032:"Isnes",
-    5032:"Mazy",
-    5060:"Arsimont",
-    5060:"Auvelais",
-    5060:"Falisolle",
-    5060:"KeumiÃ©e",
-    5060:"MoignelÃ©e",
-    5060:"Sambreville",
-    5060:"Tamines",
-    5060:"Velaine-Sur-Sambre",
-    5070:"Aisemont",
-    5070:"Fosses-La-Ville",
-    5070:"Le Roux",
-    5070:"Sart-Eustache",
-    5070:"Sart-Saint-Laurent",
-    5070:"Vitrival",
-    5080:"Emines",
-    5080:"La BruyÃ¨re",
-    5080:"Rhisnes",
-    5080:"Villers-Lez-Heest",
-    5080:"Warisoulx",
-    5081:"Bovesse",
-    5081:"Meux",
-    5100:"Dave",
-    5100:"Jambes",
-    5100:"Naninne",
-    5100:"WÃ©pion",
-    5100:"Wierde",
-    5101:"Erpent",
-    5101:"Lives-Sur-Meuse",
-    5101:"Loyers",
-    5140:"BoignÃ©e",
-    5140:"Ligny",
-    5140:"Sombreffe",
-    5140:"Tongrinne",
-    5150:"Floreffe",
-    5150:"Floriffoux",
-    5150:"FraniÃ¨re",
-    5150:"Soye",
-    5170:"Arbre",
-    5170:"Bois-De-Villers",
-    5170:"Lesve",
-    5170:"Lustin",
-    5170:"Profondeville",
-    5170:"RiviÃ¨re",
-    5190:"BalÃ¢tre",
-    5190:"Ham-Sur-Sambre",
-    5190:"Jemeppe-Sur-Sambre",
-    5190:"Mornimont",
-    5190:"Moustier-Sur-Sambre",
-    5190:"Onoz",
-    5190:"Saint-Martin",
-    5190:"Spy",
-    5300:"Andenne",
-    5300:"Bonneville",
-    5300:"Coutisse",
-    5300:"Landenne",
-    5300:"Maizeret",
-    5300:"NamÃªche",
-    5300:"Sclayn",
-    5300:"Seilles",
-    5300:"Thon",
-    5300:"Vezin",
-    5310:"Aische-En-Refail",
-    5310:"Bolinne",
-    5310:"Boneffe",
-    5310:"Branchon",
-    5310:"Dhuy",
-    5310:"EghezÃ©e",
-    5310:"Hanret",
-    5310:"Leuze",
-    5310:"Liernu",
-    5310:"Longchamps",
-    5310:"Mehaigne",
-    5310:"Noville-Sur-MÃ©haigne",
-    5310:"Saint-Germain",
-    5310:"Taviers",
-    5310:"Upigny",
-    5310:"Waret-La-ChaussÃ©e",
-    5330:"Assesse",
-    5330:"Maillen",
-    5330:"Sart-Bernard",
-    5332:"Crupet",
-    5333:"Sorinne-La-Longue",
-    5334:"FlorÃ©e",
-    5336:"CourriÃ¨re",
-    5340:"Faulx-Les-Tombes",
-    5340:"Gesves",
-    5340:"Haltinne",
-    5340:"Mozet",
-    5340:"SorÃ©e",
-    5350:"Evelette",
-    5350:"Ohey",
-    5351:"Haillot",
-    5353:"Goesnes",
-    5354:"Jallet",
-    5360:"Hamois",
-    5360:"Natoye",
-    5361:"Mohiville",
-    5361:"Scy",
-    5362:"Achet",
-    5363:"Emptinne",
-    5364:"Schaltin",
-    5370:"Barvaux-Condroz",
-    5370:"Flostoy",
-    5370:"Havelange",
-    5370:"Jeneffe",
-    5370:"Porcheresse",
-    5370:"VerlÃ©e",
-    5372:"MÃ©an",
-    5374:"Maffe",
-    5376:"MiÃ©cret",
-    5377:"Baillonville",
-    5377:"Bonsin",
-    5377:"Heure",
-    5377:"Hogne",
-    5377:"Nettinne",
-    5377:"Noiseux",
-    5377:"Sinsin",
-    5377:"Somme-Leuze",
-    5377:"Waillet",
-    5380:"Bierwart",
-    5380:"Cortil-Wodon",
-    5380:"Fernelmont",
-    5380:"Forville",
-    5380:"Franc-Waret",
-    5380:"Hemptinne",
-    5380:"Hingeon",
-    5380:"Marchovelette",
-    5380:"Noville-Les-Bois",
-    5380:"Pontillas",
-    5380:"Tillier",
-    5500:"Anseremme",
-    5500:"Bouvignes-Sur-Meuse",
-    5500:"Dinant",
-    5500:"DrÃ©hance",
-    5500:"Falmagne",
-    5500:"Falmignoul",
-    5500:"Furfooz",
-    5501:"Lisogne",
-    5502:"Thynes",
-    5503:"Sorinnes",
-    5504:"Foy-Notre-Dame",
-    5520:"AnthÃ©e",
-    5520:"Onhaye",
-    5521:"Serville",
-    5522:"Falaen",
-    5523:"SommiÃ¨re",
-    5523:"Weillen",
-    5524:"Gerin",
-    5530:"Dorinne",
-    5530:"Durnal",
-    5530:"Evrehailles",
-    5530:"Godinne",
-    5530:"Houx",
-    5530:"Mont",
-    5530:"Purnode",
-    5530:"Spontin",
-    5530:"Yvoir",
-    5537:"AnhÃ©e",
-    5537:"Annevoie-Rouillon",
-    5537:"Bioul",
-    5537:"DenÃ©e",
-    5537:"Haut-Le-Wastia",
-    5537:"Sosoye",
-    5537:"Warnant",
-    5540:"HastiÃ¨re",
-    5540:"HastiÃ¨re-Lavaux",
-    5540:"Hermeton-Sur-Meuse",
-    5540:"Waulsort",
-    5541:"HastiÃ¨re-Par-DelÃ ",
-    5542:"Blaimont",
-    5543:"Heer",
-    5544:"Agimont",
-    5550:"Alle",
-    5550:"Bagimont",
-    5550:"Bohan",
-    5550:"ChairiÃ¨re",
-    5550:"Laforet",
-    5550:"Membre",
-    5550:"Mouzaive",
-    5550:"Nafraiture",
-    5550:"Orchimont",
-    5550:"Pussemange",
-    5550:"Sugny",
-    5550:"Vresse-Sur-Semois",
-    5555:"Baillamont",
-    5555:"Bellefontaine",
-    5555:"BiÃ¨vre",
-    5555:"Cornimont",
-    5555:"Graide",
-    5555:"Gros-Fays",
-    5555:"Monceau-En-Ardenne",
-    5555:"NaomÃ©",
-    5555:"Oizy",
-    5555:"Petit-Fays",
-    5560:"Ciergnon",
-    5560:"Finnevaux",
-    5560:"Houyet",
-    5560:"Hulsonniaux",
-    5560:"Mesnil-Eglise",
-    5560:"Mesnil-Saint-Blaise",
-    5561:"Celles",
-    5562:"Custinne",
-    5563:"Hour",
-    5564:"Wanlin",
-    5570:"Baronville",
-    5570:"Beauraing",
-    5570:"Dion",
-    5570:"Felenne",
-    5570:"Feschaux",
-    5570:"Honnay",
-    5570:"Javingue",
-    5570:"VonÃªche",
-    5570:"Wancennes",
-    5570:"Winenne",
-    5571:"Wiesme",
-    5572:"Focant",
-    5573:"Martouzin-Neuville",
-    5574:"PondrÃ´me",
-    5575:"Bourseigne-Neuve",
-    5575:"Bourseigne-Vieille",
-    5575:"Gedinne",
-    5575:"Houdremont",
-    5575:"Louette-Saint-Denis",
-    5575:"Louette-Saint-Pierre",
-    5575:"Malvoisin",
-    5575:"Patignies",
-    5575:"Rienne",
-    5575:"Sart-Custinne",
-    5575:"Vencimont",
-    5575:"Willerzie",
-    5576:"Froidfontaine",
-    5580:"Ave-Et-Auffe",
-    5580:"Buissonville",
-    5580:"Eprave",
-    5580:"Han-Sur-Lesse",
-    5580:"Jemelle",
-    5580:"Lessive",
-    5580:"Mont-Gauthier",
-    5580:"Rochefort",
-    5580:"Villers-Sur-Lesse",
-    5580:"Wavreille",
-    5590:"AchÃªne",
-    5590:"Braibant",
-    5590:"Chevetogne",
-    5590:"Ciney",
-    5590:"Conneux",
-    5590:"Haversin",
-    5590:"Leignon",
-    5590:"Pessoux",
-    5590:"Serinchamps",
-    5590:"Sovet",
-    5600:"Fagnolle",
-    5600:"Franchimont",
-    5600:"Jamagne",
-    5600:"Jamiolle",
-    5600:"Merlemont",
-    5600:"Neuville",
-    5600:"OmezÃ©e",
-    5600:"Philippeville",
-    5600:"Roly",
-    5600:"Romedenne",
-    5600:"Samart",
-    5600:"Sart-En-Fagne",
-    5600:"Sautour",
-    5600:"Surice",
-    5600:"Villers-En-Fagne",
-    5600:"Villers-Le-Gambon",
-    5600:"VodecÃ©e",
-    5620:"Corenne",
-    5620:"Flavion",
-    5620:"Florennes",
-    5620:"Hemptinne-Lez-Florennes",
-    5620:"Morville",
-    5620:"RosÃ©e",
-    5620:"Saint-Aubin",
-    5621:"Hanzinelle",
-    5621:"Hanzinne",
-    5621:"MorialmÃ©",
-    5630:"Cerfontaine",
-    5630:"Daussois",
-    5630:"Senzeille",
-    5630:"Silenrieux",
-    5630:"Soumoy",
-    5630:"Villers-Deux-Eglises",
-    5640:"Biesme",
-    5640:"BiesmerÃ©e",
-    5640:"Graux",
-    5640:"Mettet",
-    5640:"Oret",
-    5640:"Saint-GÃ©rard",
-    5641:"Furnaux",
-    5644:"Ermeton-Sur-Biert",
-    5646:"Stave",
-    5650:"Castillon",
-    5650:"ChastrÃ¨s",
-    5650:"Clermont",
-    5650:"Fontenelle",
-    5650:"Fraire",
-    5650:"Pry",
-    5650:"VogenÃ©e",
-    5650:"Walcourt",
-    5650:"Yves-GomezÃ©e",
-    5651:"BerzÃ©e",
-    5651:"Gourdinne",
-    5651:"Laneffe",
-    5651:"RognÃ©e",
-    5651:"SomzÃ©e",
-    5651:"Tarcienne",
-    5651:"Thy-Le-ChÃ¢teau",
-    5660:"Aublain",
-    5660:"Boussu-En-Fagne",
-    5660:"BrÃ»ly",
-    5660:"BrÃ»ly-De-Pesche",
-    5660:"Couvin",
-    5660:"Cul-Des-Sarts",
-    5660:"Dailly",
-    5660:"Frasnes",
-    5660:"Gonrieux",
-    5660:"Mariembourg",
-    5660:"Pesche",
-    5660:"Petigny",
-    5660:"Petite-Chapelle",
-    5660:"Presgaux",
-    5670:"Dourbes",
-    5670:"Le Mesnil",
-    5670:"MazÃ©e",
-    5670:"Nismes",
-    5670:"Oignies-En-ThiÃ©rache",
-    5670:"Olloy-Sur-Viroin",
-    5670:"Treignes",
-    5670:"Vierves-Sur-Viroin",
-    5670:"Viroinval",
-    5680:"Doische",
-    5680:"GimnÃ©e",
-    5680:"GochenÃ©e",
-    5680:"Matagne-La-Grande",
-    5680:"Matagne-La-Petite",
-    5680:"NiverlÃ©e",
-    5680:"RomerÃ©e",
-    5680:"Soulme",
-    5680:"Vaucelles",
-    5680:"VodelÃ©e",
-    6000:"Charleroi",
-    6001:"Marcinelle",
-    6010:"Couillet",
-    6020:"Dampremy",
-    6030:"Goutroux",
-    6030:"Marchienne-Au-Pont",
-    6031:"Monceau-Sur-Sambre",
-    6032:"Mont-Sur-Marchienne",
-    6040:"Jumet",
-    6041:"Gosselies",
-    6042:"Lodelinsart",
-    6043:"Ransart",
-    6044:"Roux",
-    6060:"Gilly",
-    6061:"Montignies-Sur-Sambre",
-    6110:"Montigny-Le-Tilleul",
-    6111:"Landelies",
-    6120:"Cour-Sur-Heure",
-    6120:"Ham-Sur-Heure",
-    6120:"Jamioulx",
-    6120:"Marbaix",
-    6120:"Nalinnes",
-    6140:"Fontaine-L'evÃªque",
-    6141:"Forchies-La-Marche",
-    6142:"Leernes",
-    6150:"Anderlues",
-    6180:"Courcelles",
-    6181:"Gouy-Lez-PiÃ©ton",
-    6182:"Souvret",
-    6183:"Trazegnies",
-    6200:"Bouffioulx",
-    6200:"ChÃ¢telet",
-    6200:"ChÃ¢telineau",
-    6210:"Frasnes-Lez-Gosselies",
-    6210:"Les Bons Villers",
-    6210:"RÃ¨ves",
-    6210:"Villers-Perwin",
-    6210:"Wayaux",
-    6211:"Mellet",
-    6220:"Fleurus",
-    6220:"Heppignies",
-    6220:"Lambusart",
-    6220:"Wangenies",
-    6221:"Saint-Amand",
-    6222:"Brye",
-    6223:"WagnelÃ©e",
-    6224:"WanfercÃ©e-Baulet",
-    6230:"Buzet",
-    6230:"Obaix",
-    6230:"Pont-Ã€-Celles",
-    6230:"ThimÃ©on",
-    6230:"Viesville",
-    6238:"Liberchies",
-    6238:"Luttre",
-    6240:"Farciennes",
-    6240:"Pironchamps",
-    6250:"Aiseau",
-    6250:"Aiseau-Presles",
-    6250:"Pont-De-Loup",
-    6250:"Presles",
-    6250:"Roselies",
-    6280:"Acoz",
-    6280:"Gerpinnes",
-    6280:"Gougnies",
-    6280:"Joncret",
-    6280:"Loverval",
-    6280:"Villers-Poterie",
-    6440:"Boussu-Lez-Walcourt",
-    6440:"Fourbechies",
-    6440:"Froidchapelle",
-    6440:"Vergnies",
-    6441:"Erpion",
-    6460:"BailiÃ¨vre",
-    6460:"Chimay",
-    6460:"Robechies",
-    6460:"Saint-Remy",
-    6460:"Salles",
-    6460:"Villers-La-Tour",
-    6461:"Virelles",
-    6462:"Vaulx-Lez-Chimay",
-    6463:"Lompret",
-    6464:"Baileux",
-    6464:"Bourlers",
-    6464:"Forges",
-    6464:"L'escaillÃ¨re",
-    6464:"RiÃ¨zes",
-    6470:"Grandrieu",
-    6470:"Montbliart",
-    6470:"Rance",
-    6470:"Sautin",
-    6470:"Sivry",
-    6470:"Sivry-Rance",
-    6500:"BarbenÃ§on",
-    6500:"Beaumont",
-    6500:"Leugnies",
-    6500:"Leval-Chaudeville",
-    6500:"Renlies",
-    6500:"Solre-Saint-GÃ©ry",
-    6500:"Thirimont",
-    6511:"StrÃ©e",
-    6530:"Leers-Et-Fosteau",
-    6530:"Thuin",
-    6531:"Biesme-Sous-Thuin",
-    6532:"Ragnies",
-    6533:"BiercÃ©e",
-    6534:"GozÃ©e",
-    6536:"Donstiennes",
-    6536:"Thuillies",
-    6540:"Lobbes",
-    6540:"Mont-Sainte-GeneviÃ¨ve",
-    6542:"Sars-La-BuissiÃ¨re",
-    6543:"Bienne-Lez-Happart",
-    6560:"Bersillies-L'abbaye",
-    6560:"Erquelinnes",
-    6560:"Grand-Reng",
-    6560:"Hantes-WihÃ©ries",
-    6560:"Montignies-Saint-Christophe",
-    6560:"Solre-Sur-Sambre",
-    6567:"Fontaine-Valmont",
-    6567:"LabuissiÃ¨re",
-    6567:"Merbes-Le-ChÃ¢teau",
-    6567:"Merbes-Sainte-Marie",
-    6590:"Momignies",
-    6591:"Macon",
-    6592:"Monceau-Imbrechies",
-    6593:"Macquenoise",
-    6594:"Beauwelz",
-    6596:"Forge-Philippe",
-    6596:"Seloignes",
-    6600:"Bastogne",
-    6600:"Longvilly",
-    6600:"Noville",
-    6600:"Villers-La-Bonne-Eau",
-    6600:"Wardin",
-    6630:"Martelange",
-    6637:"Fauvillers",
-    6637:"Hollange",
-    6637:"Tintange",
-    6640:"HomprÃ©",
-    6640:"Morhet",
-    6640:"Nives",
-    6640:"Sibret",
-    6640:"Vaux-Lez-RosiÃ¨res",
-    6640:"Vaux-Sur-SÃ»re",
-    6642:"Juseret",
-    6660:"Houffalize",
-    6660:"Nadrin",
-    6661:"Mont",
-    6661:"Tailles",
-    6662:"Tavigny",
-    6663:"MabomprÃ©",
-    6666:"Wibrin",
-    6670:"Gouvy",
-    6670:"LimerlÃ©",
-    6671:"Bovigny",
-    6672:"Beho",
-    6673:"Cherain",
-    6674:"Montleban",
-    6680:"Amberloup",
-    6680:"Sainte-Ode",
-    6680:"Tillet",
-    6681:"Lavacherie",
-    6686:"Flamierge",
-    6687:"Bertogne",
-    6688:"Longchamps",
-    6690:"Bihain",
-    6690:"Vielsalm",
-    6692:"Petit-Thier",
-    6698:"Grand-Halleux",
-    6700:"Arlon",
-    6700:"Bonnert",
-    6700:"Heinsch",
-    6700:"Toernich",
-    6704:"Guirsch",
-    6706:"Autelbas",
-    6717:"Attert",
-    6717:"Nobressart",
-    6717:"Nothomb",
-    6717:"Thiaumont",
-    6717:"Tontelange",
-    6720:"Habay",
-    6720:"Habay-La-Neuve",
-    6720:"Hachy",
-    6721:"Anlier",
-    6723:"Habay-La-Vieille",
-    6724:"Houdemont",
-    6724:"Rulles",
-    6730:"Bellefontaine",
-    6730:"Rossignol",
-    6730:"Saint-Vincent",
-    6730:"Tintigny",
-    6740:"Etalle",
-    6740:"Sainte-Marie-Sur-Semois",
-    6740:"Villers-Sur-Semois",
-    6741:"Vance",
-    6742:"Chantemelle",
-    6743:"Buzenol",
-    6747:"ChÃ¢tillon",
-    6747:"Meix-Le-Tige",
-    6747:"Saint-LÃ©ger",
-    6750:"Musson",
-    6750:"Mussy-La-Ville",
-    6750:"Signeulx",
-    6760:"Bleid",
-    6760:"Ethe",
-    6760:"Ruette",
-    6760:"Virton",
-    6761:"Latour",
-    6762:"Saint-Mard",
-    6767:"Dampicourt",
-    6767:"Harnoncourt",
-    6767:"Lamorteau",
-    6767:"Rouvroy",
-    6767:"Torgny",
-    6769:"GÃ©rouville",
-    6769:"Meix-Devant-Virton",
-    6769:"Robelmont",
-    6769:"Sommethonne",
-    6769:"Villers-La-Loue",
-    6780:"Hondelange",
-    6780:"Messancy",
-    6780:"Wolkrange",
-    6781:"SÃ©lange",
-    6782:"Habergy",
-    6790:"Aubange",
-    6791:"Athus",
-    6792:"Halanzy",
-    6792:"Rachecourt",
-    6800:"Bras",
-    6800:"Freux",
-    6800:"Libramont-Chevigny",
-    6800:"Moircy",
-    6800:"Recogne",
-    6800:"Remagne",
-    6800:"Saint-Pierre",
-    6800:"Sainte-Marie-Chevigny",
-    6810:"Chiny",
-    6810:"Izel",
-    6810:"Jamoigne",
-    6811:"Les Bulles",
-    6812:"Suxy",
-    6813:"Termes",
-    6820:"Florenville",
-    6820:"Fontenoille",
-    6820:"Muno",
-    6820:"Sainte-CÃ©cile",
-    6821:"Lacuisine",
-    6823:"Villers-Devant-Orval",
-    6824:"Chassepierre",
-    6830:"Bouillon",
-    6830:"Les Hayons",
-    6830:"Poupehan",
-    6830:"Rochehaut",
-    6831:"Noirfontaine",
-    6832:"Sensenruth",
-    6833:"Ucimont",
-    6833:"Vivy",
-    6834:"Bellevaux",
-    6836:"Dohan",
-    6838:"Corbion",
-    6840:"Grandvoir",
-    6840:"Grapfontaine",
-    6840:"HamiprÃ©",
-    6840:"Longlier",
-    6840:"NeufchÃ¢teau",
-    6840:"Tournay",
-    6850:"Carlsbourg",
-    6850:"Offagne",
-    6850:"Paliseul",
-    6851:"Nollevaux",
-    6852:"Maissin",
-    6852:"Opont",
-    6853:"Framont",
-    6856:"Fays-Les-Veneurs",
-    6860:"Assenois",
-    6860:"Ebly",
-    6860:"LÃ©glise",
-    6860:"Mellier",
-    6860:"Witry",
-    6870:"Arville",
-    6870:"Awenne",
-    6870:"Hatrival",
-    6870:"Mirwart",
-    6870:"Saint-Hubert",
-    6870:"Vesqueville",
-    6880:"Auby-Sur-Semois",
-    6880:"Bertrix",
-    6880:"Cugnon",
-    6880:"Jehonville",
-    6880:"Orgeo",
-    6887:"Herbeumont",
-    6887:"Saint-MÃ©dard",
-    6887:"Straimont",
-    6890:"Anloy",
-    6890:"Libin",
-    6890:"Ochamps",
-    6890:"Redu",
-    6890:"Smuid",
-    6890:"Transinne",
-    6890:"Villance",
-    6900:"Aye",
-    6900:"Hargimont",
-    6900:"Humain",
-    6900:"Marche-En-Famenne",
-    6900:"On",
-    6900:"Roy",
-    6900:"Waha",
-    6920:"Sohier",
-    6920:"Wellin",
-    6921:"Chanly",
-    6922:"Halma",
-    6924:"Lomprez",
-    6927:"Bure",
-    6927:"Grupont",
-    6927:"Resteigne",
-    6927:"Tellin",
-    6929:"Daverdisse",
-    6929:"Gembes",
-    6929:"Haut-Fays",
-    6929:"Porcheresse",
-    6940:"Durbuy",
-    6940:"Grandhan",
-    6940:"Septon",
-    6940:"WÃ©ris",
-    6941:"Bende",
-    6941:"Bomal-Sur-Ourthe",
-    6941:"Borlon",
-    6941:"Heyd",
-    6941:"Izier",
-    6941:"Tohogne",
-    6941:"Villers-Sainte-Gertrude",
-    6950:"Harsin",
-    6950:"Nassogne",
-    6951:"Bande",
-    6952:"Grune",
-    6953:"Ambly",
-    6953:"ForriÃ¨res",
-    6953:"Lesterny",
-    6953:"Masbourg",
-    6960:"Dochamps",
-    6960:"Grandmenil",
-    6960:"Harre",
-    6960:"MalemprÃ©",
-    6960:"Manhay",
-    6960:"Odeigne",
-    6960:"Vaux-Chavanne",
-    6970:"Tenneville",
-    6971:"Champlon",
-    6972:"Erneuville",
-    6980:"Beausaint",
-    6980:"La Roche-En-Ardenne",
-    6982:"SamrÃ©e",
-    6983:"Ortho",
-    6984:"Hives",
-    6986:"Halleux",
-    6987:"Beffe",
-    6987:"Hodister",
-    6987:"Marcourt",
-    6987:"Rendeux",
-    6990:"Fronville",
-    6990:"Hampteau",
-    6990:"Hotton",
-    6990:"Marenne",
-    6997:"Amonines",
-    6997:"ErezÃ©e",
-    6997:"Mormont",
-    6997:"Soy",
-    7000:"Mons",
-    7011:"Ghlin",
-    7012:"FlÃ©nu",
-    7012:"Jemappes",
-    7020:"MaisiÃ¨res",
-    7020:"Nimy",
-    7021:"Havre",
-    7022:"Harmignies",
-    7022:"Harveng",
-    7022:"Hyon",
-    7022:"Mesvin",
-    7022:"Nouvelles",
-    7024:"Ciply",
-    7030:"Saint-Symphorien",
-    7031:"Villers-Saint-Ghislain",
-    7032:"Spiennes",
-    7033:"Cuesmes",
-    7034:"Obourg",
-    7034:"Saint-Denis",
-    7040:"Asquillies",
-    7040:"Aulnois",
-    7040:"Blaregnies",
-    7040:"Bougnies",
-    7040:"Genly",
-    7040:"Goegnies-ChaussÃ©e",
-    7040:"QuÃ©vy",
-    7040:"QuÃ©vy-Le-Grand",
-    7040:"QuÃ©vy-Le-Petit",
-    7041:"Givry",
-    7041:"Havay",
-    7050:"Erbaut",
-    7050:"Erbisoeul",
-    7050:"Herchies",
-    7050:"Jurbise",
-    7050:"Masnuy-Saint-Jean",
-    7050:"Masnuy-Saint-Pierre",
-    7060:"Horrues",
-    7060:"Soignies",
-    7061:"Casteau",
-    7061:"Thieusies",
-    7062:"Naast",
-    7063:"ChaussÃ©e-Notre-Dame-Louvignies",
-    7063:"Neufvilles",
-    7070:"Gottignies",
-    7070:"Le Roeulx",
-    7070:"Mignault",
-    7070:"Thieu",
-    7070:"Ville-Sur-Haine",
-    7080:"Eugies",
-    7080:"Frameries",
-    7080:"La Bouverie",
-    7080:"Noirchain",
-    7080:"Sars-La-BruyÃ¨re",
-    7090:"Braine-Le-Comte",
-    7090:"HennuyÃ¨res",
-    7090:"Henripont",
-    7090:"Petit-Roeulx-Lez-Braine",
-    7090:"RonquiÃ¨res",
-    7090:"Steenkerque",
-    7100:"Haine-Saint-Paul",
-    7100:"Haine-Saint-Pierre",
-    7100:"La LouviÃ¨re",
-    7100:"Saint-Vaast",
-    7100:"TriviÃ¨res",
-    7110:"Boussoit",
-    7110:"Houdeng-Aimeries",
-    7110:"Houdeng-Goegnies",
-    7110:"Maurage",
-    7110:"StrÃ©py-Bracquegnies",
-    7120:"Croix-Lez-Rouveroy",
-    7120:"Estinnes",
-    7120:"Estinnes-Au-Mont",
-    7120:"Estinnes-Au-Val",
-    7120:"Fauroeulx",
-    7120:"Haulchin",
-    7120:"Peissant",
-    7120:"Rouveroy",
-    7120:"Vellereille-Le-Sec",
-    7120:"Vellereille-Les-Brayeux",
-    7130:"Battignies",
-    7130:"Binche",
-    7130:"Bray",
-    7131:"Waudrez",
-    7133:"Buvrinnes",
-    7134:"Epinois",
-    7134:"Leval-Trahegnies",
-    7134:"PÃ©ronnes-Lez-Binche",
-    7134:"Ressaix",
-    7140:"Morlanwelz",
-    7140:"Morlanwelz-Mariemont",
-    7141:"CarniÃ¨res",
-    7141:"Mont-Sainte-Aldegonde",
-    7160:"Chapelle-Lez-Herlaimont",
-    7160:"Godarville",
-    7160:"PiÃ©ton",
-    7170:"Bellecourt",
-    7170:"Bois-D'haine",
-    7170:"Fayt-Lez-Manage",
-    7170:"La Hestre",
-    7170:"Manage",
-    7180:"Seneffe",
-    7181:"Arquennes",
-    7181:"Familleureux",
-    7181:"Feluy",
-    7181:"Petit-Roeulx-Lez-Nivelles",
-    7190:"Ecaussinnes",
-    7190:"Ecaussinnes-D'enghien",
-    7190:"Marche-Lez-Ecaussinnes",
-    7191:"Ecaussinnes-Lalaing",
-    7300:"Boussu",
-    7301:"Hornu",
-    7320:"Bernissart",
-    7321:"Blaton",
-    7321:"Harchies",
-    7322:"Pommeroeul",
-    7322:"Ville-Pommeroeul",
-    7330:"Saint-Ghislain",
-    7331:"Baudour",
-    7332:"Neufmaison",
-    7332:"Sirault",
-    7333:"Tertre",
-    7334:"Hautrage",
-    7334:"Villerot",
-    7340:"Colfontaine",
-    7340:"Paturages",
-    7340:"Warquignies",
-    7340:"Wasmes",
-    7350:"Hainin",
-    7350:"Hensies",
-    7350:"Montroeul-Sur-Haine",
-    7350:"Thulin",
-    7370:"Blaugies",
-    7370:"Dour",
-    7370:"Elouges",
-    7370:"WihÃ©ries",
-    7380:"Baisieux",
-    7380:"QuiÃ©vrain",
-    7382:"Audregnies",
-    7387:"Angre",
-    7387:"Angreau",
-    7387:"Athis",
-    7387:"Autreppe",
-    7387:"Erquennes",
-    7387:"Fayt-Le-Franc",
-    7387:"Honnelles",
-    7387:"Marchipont",
-    7387:"Montignies-Sur-Roc",
-    7387:"Onnezies",
-    7387:"Roisin",
-    7390:"Quaregnon",
-    7390:"Wasmuel",
-    7500:"Ere",
-    7500:"Saint-Maur",
-    7500:"Tournai",
-    7501:"Orcq",
-    7502:"Esplechin",
-    7503:"Froyennes",
-    7504:"Froidmont",
-    7506:"Willemeau",
-    7520:"Ramegnies-Chin",
-    7520:"Templeuve",
-    7521:"Chercq",
-    7522:"Blandain",
-    7522:"Hertain",
-    7522:"Lamain",
-    7522:"Marquain",
-    7530:"Gaurain-Ramecroix",
-    7531:"Havinnes",
-    7532:"Beclers",
-    7533:"Thimougies",
-    7534:"Barry",
-    7534:"Maulde",
-    7536:"Vaulx",
-    7538:"Vezon",
-    7540:"Kain",
-    7540:"Melles",
-    7540:"Quartes",
-    7540:"Rumillies",
-    7542:"Mont-Saint-Aubert",
-    7543:"Mourcourt",
-    7548:"Warchin",
-    7600:"PÃ©ruwelz",
-    7601:"Roucourt",
-    7602:"Bury",
-    7603:"Bon-Secours",
-    7604:"Baugnies",
-    7604:"Braffe",
-    7604:"Brasmenil",
-    7604:"Callenelle",
-    7604:"Wasmes-Audemez-Briffoeil",
-    7608:"Wiers",
-    7610:"Rumes",
-    7611:"La Glanerie",
-    7618:"Taintignies",
-    7620:"BlÃ©haries",
-    7620:"Brunehaut",
-    7620:"Guignies",
-    7620:"Hollain",
-    7620:"Jollain-Merlin",
-    7620:"Wez-Velvain",
-    7621:"Lesdain",
-    7622:"Laplaigne",
-    7623:"Rongy",
-    7624:"Howardries",
-    7640:"Antoing",
-    7640:"Maubray",
-    7640:"PÃ©ronnes-Lez-Antoing",
-    7641:"Bruyelle",
-    7642:"Calonne",
-    7643:"Fontenoy",
-    7700:"Luingne",
-    7700:"Mouscron",
-    7711:"Dottignies",
-    7712:"Herseaux",
-    7730:"Bailleul",
-    7730:"Estaimbourg",
-    7730:"Estaimpuis",
-    7730:"Evregnies",
-    7730:"Leers-Nord",
-    7730:"NÃ©chin",
-    7730:"Saint-LÃ©ger",
-    7740:"Pecq",
-    7740:"Warcoing",
-    7742:"HÃ©rinnes-Lez-Pecq",
-    7743:"Esquelmes",
-    7743:"Obigies",
-    7750:"Amougies",
-    7750:"Anseroeul",
-    7750:"Mont-De-L'enclus",
-    7750:"Orroir",
-    7750:"Russeignies",
-    7760:"Celles",
-    7760:"Escanaffles",
-    7760:"Molenbaix",
-    7760:"Popuelles",
-    7760:"Pottes",
-    7760:"Velaines",
-    7780:"Comines",
-    7780:"Comines-Warneton",
-    7781:"Houthem",
-    7782:"Ploegsteert",
-    7783:"Bizet",
-    7784:"Bas-Warneton",
-    7784:"Warneton",
-    7800:"Ath",
-    7800:"Lanquesaint",
-    7801:"Irchonwelz",
-    7802:"Ormeignies",
-    7803:"Bouvignies",
-    7804:"Ostiches",
-    7804:"Rebaix",
-    7810:"Maffle",
-    7811:"Arbre",
-    7812:"Houtaing",
-    7812:"Ligne",
-    7812:"Mainvault",
-    7812:"Moulbaix",
-    7812:"Villers-Notre-Dame",
-    7812:"Villers-Saint-Amand",
-    7822:"Ghislenghien",
-    7822:"IsiÃ¨res",
-    7822:"Meslin-L'evÃªque",
-    7823:"Gibecq",
-    7830:"Bassilly",
-    7830:"Fouleng",
-    7830:"Gondregnies",
-    7830:"Graty",
-    7830:"Hellebecq",
-    7830:"Hoves",
-    7830:"Silly",
-    7830:"Thoricourt",
-    7850:"Enghien",
-    7850:"Marcq",
-    7850:"Petit-Enghien",
-    7860:"Lessines",
-    7861:"Papignies",
-    7861:"Wannebecq",
-    7862:"Ogy",
-    7863:"Ghoy",
-    7864:"Deux-Acren",
-    7866:"Bois-De-Lessines",
-    7866:"Ollignies",
-    7870:"Bauffe",
-    7870:"Cambron-Saint-Vincent",
-    7870:"Lens",
-    7870:"Lombise",
-    7870:"Montignies-Lez-Lens",
-    7880:"Flobecq",
-    7890:"Ellezelles",
-    7890:"Lahamaide",
-    7890:"Wodecq",
-    7900:"Grandmetz",
-    7900:"Leuze-En-Hainaut",
-    7901:"Thieulain",
-    7903:"Blicquy",
-    7903:"Chapelle-Ã€-Oie",
-    7903:"Chapelle-Ã€-Wattines",
-    7904:"Pipaix",
-    7904:"Tourpes",
-    7904:"Willaupuis",
-    7906:"Gallaix",
-    7910:"Anvaing",
-    7910:"Arc-Wattripont",
-    7910:"Cordes",
-    7910:"Ellignies-Lez-Frasnes",
-    7910:"Forest",
-    7910:"Frasnes-Lez-Anvaing",
-    7910:"Wattripont",
-    7911:"Buissenal",
-    7911:"Frasnes-Lez-Buissenal",
-    7911:"Hacquegnies",
-    7911:"Herquegies",
-    7911:"Montroeul-Au-Bois",
-    7911:"Moustier",
-    7911:"Oeudeghien",
-    7912:"Dergneau",
-    7912:"Saint-Sauveur",
-    7940:"Brugelette",
-    7940:"Cambron-Casteau",
-    7941:"Attre",
-    7942:"MÃ©vergnies-Lez-Lens",
-    7943:"Gages",
-    7950:"ChiÃ¨vres",
-    7950:"Grosage",
-    7950:"Huissignies",
-    7950:"Ladeuze",
-    7950:"Tongre-Saint-Martin",
-    7951:"Tongre-Notre-Dame",
-    7970:"Beloeil",
-    7971:"BasÃ¨cles",
-    7971:"Ramegnies",
-    7971:"Thumaide",
-    7971:"Wadelincourt",
-    7972:"Aubechies",
-    7972:"Quevaucamps",
-    7973:"Grandglise",
-    7973:"Stambruges",
-    8000:"Brugge",
-    8000:"Koolkerke",
-    8020:"Hertsberge",
-    8020:"Oostkamp",
-    8020:"Ruddervoorde",
-    8020:"Waardamme",
-    8200:"Sint-Andries",
-    8200:"Sint-Michiels",
-    8210:"Loppem",
-    8210:"Veldegem",
-    8210:"Zedelgem",
-    8211:"Aartrijke",
-    8300:"Knokke",
-    8300:"Knokke-Heist",
-    8300:"Westkapelle",
-    8301:"Ramskapelle",
-    8310:"Assebroek",
-    8310:"Sint-Kruis",
-    8340:"Damme",
-    8340:"Hoeke",
-    8340:"Lapscheure",
-    8340:"Moerkerke",
-    8340:"Oostkerke",
-    8340:"Sijsele",
-    8370:"Blankenberge",
-    8370:"Uitkerke",
-    8377:"Houtave",
-    8377:"Meetkerke",
-    8377:"Nieuwmunster",
-    8377:"Zuienkerke",
-    8380:"Dudzele",
-    8380:"Lissewege",
-    8380:"Zeebrugge",
-    8400:"Oostende",
-    8400:"Stene",
-    8400:"Zandvoorde",
-    8420:"De Haan",
-    8420:"Klemskerke",
-    8420:"Wenduine",
-    8421:"Vlissegem",
-    8430:"Middelkerke",
-    8431:"Wilskerke",
-    8432:"Leffinge",
-    8433:"Mannekensvere",
-    8433:"Schore",
-    8433:"Sint-Pieters-Kapelle",
-    8433:"Slijpe",
-    8434:"Lombardsijde",
-    8434:"Westende",
-    8450:"Bredene",
-    8460:"Ettelgem",
-    8460:"Oudenburg",
-    8460:"Roksem",
-    8460:"Westkerke",
-    8470:"Gistel",
-    8470:"Moere",
-    8470:"Snaaskerke",
-    8470:"Zevekote",
-    8480:"Bekegem",
-    8480:"Eernegem",
-    8480:"Ichtegem",
-    8490:"Jabbeke",
-    8490:"Snellegem",
-    8490:"Stalhille",
-    8490:"Varsenare",
-    8490:"Zerkegem",
-    8500:"Kortrijk",
-    8501:"Bissegem",
-    8501:"Heule",
-    8510:"Bellegem",
-    8510:"Kooigem",
-    8510:"Marke",
-    8510:"Rollegem",
-    8511:"Aalbeke",
-    8520:"Kuurne",
-    8530:"Harelbeke",
-    8531:"Bavikhove",
-    8531:"Hulste",
-    8540:"Deerlijk",
-    8550:"Zwevegem",
-    8551:"Heestert",
-    8552:"Moen",
-    8553:"Otegem",
-    8554:"Sint-Denijs",
-    8560:"Gullegem",
-    8560:"Moorsele",
-    8560:"Wevelgem",
-    8570:"Anzegem",
-    8570:"Gijzelbrechtegem",
-    8570:"Ingooigem",
-    8570:"Vichte",
-    8572:"Kaster",
-    8573:"Tiegem",
-    8580:"Avelgem",
-    8581:"Kerkhove",
-    8581:"Waarmaarde",
-    8582:"Outrijve",
-    8583:"Bossuit",
-    8587:"Espierres",
-    8587:"Espierres-Helchin",
-    8587:"Helchin",
-    8600:"Beerst",
-    8600:"Diksmuide",
-    8600:"Driekapellen",
-    8600:"Esen",
-    8600:"Kaaskerke",
-    8600:"Keiem",
-    8600:"Lampernisse",
-    8600:"Leke",
-    8600:"Nieuwkapelle",
-    8600:"Oostkerke",
-    8600:"Oudekapelle",
-    8600:"Pervijze",
-    8600:"Stuivekenskerke",
-    8600:"Vladslo",
-    8600:"Woumen",
-    8610:"Handzame",
-    8610:"Kortemark",
-    8610:"Werken",
-    8610:"Zarren",
-    8620:"Nieuwpoort",
-    8620:"Ramskapelle",
-    8620:"Sint-Joris",
-    8630:"Avekapelle",
-    8630:"Booitshoeke",
-    8630:"Bulskamp",
-    8630:"De Moeren",
-    8630:"Eggewaartskapelle",
-    8630:"Houtem",
-    8630:"Steenkerke",
-    8630:"Veurne",
-    8630:"Vinkem",
-    8630:"Wulveringem",
-    8630:"Zoutenaaie",
-    8640:"Oostvleteren",
-    8640:"Vleteren",
-    8640:"Westvleteren",
-    8640:"Woesten",
-    8647:"Lo",
-    8647:"Lo-Reninge",
-    8647:"Noordschote",
-    8647:"Pollinkhove",
-    8647:"Reninge",
-    8650:"Houthulst",
-    8650:"Klerken",
-    8650:"Merkem",
-    8660:"Adinkerke",
-    8660:"De Panne",
-    8670:"Koksijde",
-    8670:"Oostduinkerke",
-    8670:"Wulpen",
-    8680:"Bovekerke",
-    8680:"Koekelare",
-    8680:"Zande",
-    8690:"Alveringem",
-    8690:"Hoogstade",
-    8690:"Oeren",
-    8690:"Sint-Rijkers",
-    8691:"Gijverinkhove",
-    8691:"Izenberge",
-    8691:"Leisele",
-    8691:"Stavele",
-    8700:"Aarsele",
-    8700:"Kanegem",
-    8700:"Schuiferskapelle",
-    8700:"Tielt",
-    8710:"Ooigem",
-    8710:"Sint-Baafs-Vijve",
-    8710:"Wielsbeke",
-    8720:"Dentergem",
-    8720:"Markegem",
-    8720:"Oeselgem",
-    8720:"Wakken",
-    8730:"Beernem",
-    8730:"Oedelem",
-    8730:"Sint-Joris",
-    8740:"Egem",
-    8740:"Pittem",
-    8750:"Wingene",
-    8750:"Zwevezele",
-    8755:"Ruiselede",
-    8760:"Meulebeke",
-    8770:"Ingelmunster",
-    8780:"Oostrozebeke",
-    8790:"Waregem",
-    8791:"Beveren",
-    8792:"Desselgem",
-    8793:"Sint-Eloois-Vijve",
-    8800:"Beveren",
-    8800:"Oekene",
-    8800:"Roeselare",
-    8800:"Rumbeke",
-    8810:"Lichtervelde",
-    8820:"Torhout",
-    8830:"Gits",
-    8830:"Hooglede",
-    8840:"Oostnieuwkerke",
-    8840:"Staden",
-    8840:"Westrozebeke",
-    8850:"Ardooie",
-    8851:"Koolskamp",
-    8860:"Lendelede",
-    8870:"Emelgem",
-    8870:"Izegem",
-    8870:"Kachtem",
-    8880:"Ledegem",
-    8880:"Rollegem-Kapelle",
-    8880:"Sint-Eloois-Winkel",
-    8890:"Dadizele",
-    8890:"Moorslede",
-    8900:"Brielen",
-    8900:"Dikkebus",
-    8900:"Ieper",
-    8900:"Sint-Jan",
-    8902:"Hollebeke",
-    8902:"Voormezele",
-    8902:"Zillebeke",
-    8904:"Boezinge",
-    8904:"Zuidschote",
-    8906:"Elverdinge",
-    8908:"Vlamertinge",
-    8920:"Bikschote",
-    8920:"Langemark",
-    8920:"Langemark-Poelkapelle",
-    8920:"Poelkapelle",
-    8930:"Lauwe",
-    8930:"Menen",
-    8930:"Rekkem",
-    8940:"Geluwe",
-    8940:"Wervik",
-    8950:"Heuvelland",
-    8950:"Nieuwkerke",
-    8951:"Dranouter",
-    8952:"Wulvergem",
-    8953:"Wijtschate",
-    8954:"Westouter",
-    8956:"Kemmel",
-    8957:"Messines",
-    8958:"Loker",
-    8970:"Poperinge",
-    8970:"Reningelst",
-    8972:"Krombeke",
-    8972:"Proven",
-    8972:"Roesbrugge-Haringe",
-    8978:"Watou",
-    8980:"Beselare",
-    8980:"Geluveld",
-    8980:"Passendale",
-    8980:"Zandvoorde",
-    8980:"Zonnebeke",
-    9000:"Gent",
-    9030:"Mariakerke",
-    9031:"Drongen",
-    9032:"Wondelgem",
-    9040:"Sint-Amandsberg",
-    9041:"Oostakker",
-    9042:"Desteldonk",
-    9042:"Mendonk",
-    9042:"Sint-Kruis-Winkel",
-    9050:"Gentbrugge",
-    9050:"Ledeberg",
-    9051:"Afsnee",
-    9051:"Sint-Denijs-Westrem",
-    9052:"Zwijnaarde",
-    9060:"Zelzate",
-    9070:"Destelbergen",
-    9070:"Heusden",
-    9080:"Beervelde",
-    9080:"Lochristi",
-    9080:"Zaffelare",
-    9080:"Zeveneken",
-    9090:"Gontrode",
-    9090:"Melle",
-    9100:"Nieuwkerken-Waas",
-    9100:"Sint-Niklaas",
-    9111:"Belsele",
-    9112:"Sinaai-Waas",
-    9120:"Haasdonk",
-    9120:"Kallo",
-    9120:"Melsele",
-    9120:"Vrasene",
-    9130:"Doel",
-    9130:"Kallo",
-    9130:"Kieldrecht",
-    9130:"Verrebroek",
-    9140:"Elversele",
-    9140:"Steendorp",
-    9140:"Temse",
-    9140:"Tielrode",
-    9150:"Bazel",
-    9150:"Kruibeke",
-    9150:"Rupelmonde",
-    9160:"Daknam",
-    9160:"Eksaarde",
-    9160:"Lokeren",
-    9170:"De Klinge",
-    9170:"Meerdonk",
-    9170:"Sint-Gillis-Waas",
-    9170:"Sint-Pauwels",
-    9180:"Moerbeke-Waas",
-    9185:"Wachtebeke",
-    9190:"Kemzeke",
-    9190:"Stekene",
-    9200:"Appels",
-    9200:"Baasrode",
-    9200:"Dendermonde",
-    9200:"Grembergen",
-    9200:"Mespelare",
-    9200:"Oudegem",
-    9200:"Schoonaarde",
-    9200:"Sint-Gillis-Dendermonde",
-    9220:"Hamme",
-    9220:"Moerzeke",
-    9230:"Massemen",
-    9230:"Westrem",
-    9230:"Wetteren",
-    9240:"Zele",
-    9250:"Waasmunster",
-    9255:"Buggenhout",
-    9255:"Opdorp",
-    9260:"Schellebelle",
-    9260:"Serskamp",
-    9260:"Wichelen",
-    9270:"Kalken",
-    9270:"Laarne",
-    9280:"Denderbelle",
-    9280:"Lebbeke",
-    9280:"Wieze",
-    9290:"Berlare",
-    9290:"Overmere",
-    9290:"Uitbergen",
-    9300:"Aalst",
-    9308:"Gijzegem",
-    9308:"Hofstade",
-    9310:"Baardegem",
-    9310:"Herdersem",
-    9310:"Meldert",
-    9310:"Moorsel",
-    9320:"Erembodegem",
-    9320:"Nieuwerkerken",
-    9340:"Impe",
-    9340:"Lede",
-    9340:"Oordegem",
-    9340:"Smetlede",
-    9340:"Wanzele",
-    9400:"Appelterre-Eichem",
-    9400:"Denderwindeke",
-    9400:"Lieferinge",
-    9400:"Nederhasselt",
-    9400:"Ninove",
-    9400:"Okegem",
-    9400:"Voorde",
-    9401:"Pollare",
-    9402:"Meerbeke",
-    9403:"Neigem",
-    9404:"Aspelare",
-    9406:"Outer",
-    9420:"Aaigem",
-    9420:"Bambrugge",
-    9420:"Burst",
-    9420:"Erondegem",
-    9420:"Erpe",
-    9420:"Erpe-Mere",
-    9420:"Mere",
-    9420:"Ottergem",
-    9450:"Denderhoutem",
-    9450:"Haaltert",
-    9450:"Heldergem",
-    9451:"Kerksken",
-    9470:"Denderleeuw",
-    9472:"Iddergem",
-    9473:"Welle",
-    9500:"Geraardsbergen",
-    9500:"Goeferdinge",
-    9500:"Moerbeke",
-    9500:"Nederboelare",
-    9500:"Onkerzele",
-    9500:"Ophasselt",
-    9500:"Overboelare",
-    9500:"Viane",
-    9500:"Zarlardinge",
-    9506:"Grimminge",
-    9506:"Idegem",
-    9506:"Nieuwenhove",
-    9506:"Schendelbeke",
-    9506:"Smeerebbe-Vloerzegem",
-    9506:"Waarbeke",
-    9506:"Zandbergen",
-    9520:"Bavegem",
-    9520:"Oombergen",
-    9520:"Sint-Lievens-Houtem",
-    9520:"Vlierzele",
-    9520:"Zonnegem",
-    9521:"Letterhoutem",
-    9550:"Herzele",
-    9550:"Hillegem",
-    9550:"Sint-Antelinks",
-    9550:"Sint-Lievens-Esse",
-    9550:"Steenhuize-Wijnhuize",
-    9550:"Woubrechtegem",
-    9551:"Ressegem",
-    9552:"Borsbeke",
-    9570:"Deftinge",
-    9570:"Lierde",
-    9570:"Sint-Maria-Lierde",
-    9571:"Hemelveerdegem",
-    9572:"Sint-Martens-Lierde",
-    9600:"Renaix",
-    9620:"Elene",
-    9620:"Erwetegem",
-    9620:"Godveerdegem",
-    9620:"Grotenberge",
-    9620:"Leeuwergem",
-    9620:"Oombergen",
-    9620:"Sint-Goriks-Oudenhove",
-    9620:"Sint-Maria-Oudenhove",
-    9620:"Strijpen",
-    9620:"Velzeke-Ruddershove",
-    9620:"Zottegem",
-    9630:"Beerlegem",
-    9630:"Dikkele",
-    9630:"Hundelgem",
-    9630:"Meilegem",
-    9630:"Munkzwalm",
-    9630:"Paulatem",
-    9630:"Roborst",
-    9630:"Rozebeke",
-    9630:"Sint-Blasius-Boekel",
-    9630:"Sint-Denijs-Boekel",
-    9630:"Sint-Maria-Latem",
-    9630:"Zwalm",
-    9636:"Nederzwalm-Hermelgem",
-    9660:"Brakel",
-    9660:"Elst",
-    9660:"Everbeek",
-    9660:"Michelbeke",
-    9660:"Nederbrakel",
-    9660:"Opbrakel",
-    9660:"Sint-Maria-Oudenhove",
-    9660:"Zegelsem",
-    9661:"Parike",
-    9667:"Horebeke",
-    9667:"Sint-Kornelis-Horebeke",
-    9667:"Sint-Maria-Horebeke",
-    9680:"Etikhove",
-    9680:"Maarke-Kerkem",
-    9680:"Maarkedal",
-    9681:"Nukerke",
-    9688:"Schorisse",
-    9690:"Berchem",
-    9690:"Kluisbergen",
-    9690:"Kwaremont",
-    9690:"Ruien",
-    9690:"Zulzeke",
-    9700:"Bevere",
-    9700:"Edelare",
-    9700:"Eine",
-    9700:"Ename",
-    9700:"Heurne",
-    9700:"Leupegem",
-    9700:"Mater",
-    9700:"Melden",
-    9700:"Mullem",
-    9700:"Nederename",
-    9700:"Ooike",
-    9700:"Oudenaarde",
-    9700:"Volkegem",
-    9700:"Welden",
-    9750:"Huise",
-    9750:"Ouwegem",
-    9750:"Zingem",
-    9770:"Kruishoutem",
-    9771:"Nokere",
-    9772:"Wannegem-Lede",
-    9790:"Elsegem",
-    9790:"Moregem",
-    9790:"Ooike",
-    9790:"Petegem-Aan-De-Schelde",
-    9790:"Wortegem",
-    9790:"Wortegem-Petegem",
-    9800:"Astene",
-    9800:"Bachte-Maria-Leerne",
-    9800:"Deinze",
-    9800:"Gottem",
-    9800:"Grammene",
-    9800:"Meigem",
-    9800:"Petegem-Aan-De-Leie",
-    9800:"Sint-Martens-Leerne",
-    9800:"Vinkt",
-    9800:"Wontergem",
-    9800:"Zeveren",
-    9810:"Eke",
-    9810:"Nazareth",
-    9820:"Bottelare",
-    9820:"Lemberge",
-    9820:"Melsen",
-    9820:"Merelbeke",
-    9820:"Munte",
-    9820:"Schelderode",
-    9830:"Sint-Martens-Latem",
-    9831:"Deurle",
-    9840:"De Pinte",
-    9840:"Zevergem",
-    9850:"Hansbeke",
-    9850:"Landegem",
-    9850:"Merendree",
-    9850:"Nevele",
-    9850:"Poesele",
-    9850:"Vosselare",
-    9860:"Balegem",
-    9860:"Gijzenzele",
-    9860:"Landskouter",
-    9860:"Moortsele",
-    9860:"Oosterzele",
-    9860:"Scheldewindeke",
-    9870:"Machelen",
-    9870:"Olsene",
-    9870:"Zulte",
-    9880:"Aalter",
-    9880:"Lotenhulle",
-    9880:"Poeke",
-    9881:"Bellem",
-    9890:"Baaigem",
-    9890:"Dikkelvenne",
-    9890:"Gavere",
-    9890:"Vurste",
-    9900:"Eeklo",
-    9910:"Knesselare",
-    9910:"Ursel",
-    9920:"Lovendegem",
-    9921:"Vinderhoute",
-    9930:"Zomergem",
-    9931:"Oostwinkel",
-    9932:"Ronsele",
-    9940:"Ertvelde",
-    9940:"Evergem",
-    9940:"Kluizen",
-    9940:"Sleidinge",
-    9950:"Waarschoot",
-    9960:"Assenede",
-    9961:"Boekhoute",
-    9968:"Bassevelde",
-    9968:"Oosteeklo",
-    9970:"Kaprijke",
-    9971:"Lembeke",
-    9980:"Sint-Laureins",
-    9981:"Sint-Margriete",
-    9982:"Sint-Jan-In-Eremo",
-    9988:"Waterland-Oudeman",
-    9988:"Watervliet",
-    9990:"Maldegem",
-    9991:"Adegem",
-    9992:"Middelburg"
+import os
+import re
+import sys
+from .text import display_name, fold
+from .TrigramIndex import TrigramIndex
+
+# Every postcode followed by its name, one per line in postcode order
+POSTCODE_DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "zipcodes.txt")
+
+# Belgian postcodes run from 1000 to 9999, so a table of this size covers all of them
+POSTCODE_TABLE_SIZE = 10000
+
+# Punctuation members put in town names, "St.-Niklaas" is the same town as "Sint Niklaas"
+GEMEENTE_PUNCTUATION_PATTERN = re.compile(r"[-.,'/()\u2019]+")
+# Abbreviated and French spellings of saints, all written the same way in the keys
+GEMEENTE_WORD_ALIASES = {
+    "st": "sint",
+    "saint": "sint",
+    "ste": "sainte",
+}
+# Lowest trigram similarity for a typed name to be taken as a known town
+GEMEENTE_MATCH_SCORE = 0.8
+
+
+def build_postcode_index(pairs):
+    """
+    Builds a lookup table indexed directly by postcode, keeping every town of a postcode.
+
+    :param pairs: iterable: (postcode, name) pairs.
+    :return: tuple: A tuple of town names for every postcode, empty where there is none.
+    """
+    index = [()] * POSTCODE_TABLE_SIZE
+    for postcode, name in pairs:
+        # Intern the names so a town name only exists once in memory
+        index[postcode] += (sys.intern(name),)
+    return tuple(index)
+
+
+def parse_postcode_data(data):
+    """
+    Parses lines of a postcode followed by its name.
+
+    The names are made ready to be shown here, once: the data has names like 'PiÃ¨trebais'
+    that were decoded with the wrong encoding, so lookups return names that need no more changes.
+
+    :param data: str: The postcode data.
+    :return: list: (postcode, name) pairs, in the order of the data.
+    """
+    pairs = []
+    for line in data.splitlines():
+        postcode, name = line.split(" ", 1)
+        pairs.append((int(postcode), display_name(name)))
+    return pairs
+
+
+def read_postcode_data(path=POSTCODE_DATA_PATH):
+    """
+    Reads the postcode data file.
+
+    :param path: str: The path of the data file.
+    :return: list: (postcode, name) pairs, in the order of the file.
+    """
+    with open(path, encoding="utf-8") as data_file:
+        return parse_postcode_data(data_file.read())
+
+
+def gemeente_key(name):
+    """
+    Normalizes a town name to the key of the reverse index.
+
+    "sint-niklaas", "St.-Niklaas" and "SINT NIKLAAS" all give "sint niklaas".
+
+    :param name: str: The town name as typed.
+    :return: str: The normalized key.
+    """
+    words = GEMEENTE_PUNCTUATION_PATTERN.sub(" ", fold(name)).split()
+    return " ".join(GEMEENTE_WORD_ALIASES.get(word, word) for word in words)
+
+
+def build_gemeente_index(pairs):
+    """
+    Builds the reverse index from normalized town names to the town and its postcodes.
+
+    :param pairs: iterable: (postcode, name) pairs.
+    :return: dict: gemeente_key -> (name, tuple of postcodes).
+    """
+    index = {}
+    for postcode, name in pairs:
+        key = gemeente_key(name)
+        # The first spelling of a town is kept, further postcodes are added to it
+        town, town_postcodes = index.get(key, (name, ()))
+        if postcode not in town_postcodes:
+            town_postcodes += (postcode,)
+        index[key] = (town, town_postcodes)
+    return index
+
+
+# How to build each lookup table, from the data file or from the other tables
+TABLE_BUILDERS = {
+    # Every (postcode, name) pair of the data file
+    "postcodes": read_postcode_data,
+    # Every town (deelgemeente) per postcode, like ("Limal", "Wavre") for 1300
+    "postcodeIndex": lambda: build_postcode_index(get_table("postcodes")),
+    # The name used for a postcode when nothing tells its towns apart, the last one listed
+    "postcodeTable": lambda: tuple(towns[-1] if towns else None for towns in get_table("postcodeIndex")),
+    # Postcode to name mapping, kept for code that uses the dictionary directly
+    "postcodeDict": lambda: dict(get_table("postcodes")),
+    # Normalized town name to (town, postcodes), like "sint niklaas" -> ("Sint-Niklaas", (9100,))
+    "gemeenteIndex": lambda: build_gemeente_index(get_table("postcodes")),
+    # Trigram index over the keys of gemeenteIndex, for names that need fuzzy matching
+    "gemeenteTrigrams": lambda: TrigramIndex(get_table("gemeenteIndex")),
 }
 
-def lookup_postcode(postcode):
+# The tables built so far, nothing is read or built at import
+postcodeTables = {}
+
+
+def get_table(name):
+    """
+    Returns one of the lookup tables, building it the first time it is used.
+
+    :param name: str: The name of the table, a key of TABLE_BUILDERS.
+    :return: The table.
+    """
+    table = postcodeTables.get(name)
+    if table is None:
+        table = postcodeTables[name] = TABLE_BUILDERS[name]()
+    return table
+
+
+def __getattr__(name):
+    """Gives access to the tables as module attributes, like zipcodes.postcodeDict, building them when first used."""
+    if name in TABLE_BUILDERS:
+        return get_table(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def lookup_towns(postcode):
+    """
+    Look up all towns sharing a postcode.
+
+    :param postcode: str: The postcode to look up.
+    :return: tuple: The names of the towns, empty if the postcode is not found.
+    """
+    try:
+        code = int(postcode)
+    except (TypeError, ValueError):
+        return ()
+    if 0 <= code < POSTCODE_TABLE_SIZE:
+        return get_table("postcodeIndex")[code]
+    return ()
+
+
+def lookup_postcode(postcode, street=None):
     """
     Look up the location by postcode.
     
     :param postcode: str: The postcode to look up.
+    :param street: str: Optional street of the address, used to pick the town when several share the postcode.
     :return: str: The name associated with the postcode or a message if not found.
     """
-    return postcodeDict.get(int(postcode), "Postcode not found")
\ No newline at end of file
+    towns = lookup_towns(postcode)
+    if not towns:
+        return "Postcode not found"
+
+    # Only postcodes with several towns need the street, a single town named in it is the one meant
+    if len(towns) > 1:
+        named = towns_in_street(towns, street)
+        if len(named) == 1:
+            return named[0]
+    return towns[-1]
+
+
+def towns_in_street(towns, street):
+    """
+    Finds the towns named in a street, as whole words: 'Beekstraat' doesn't name Beek, 'Beek-Dorp' does.
+
+    :param towns: iterable: The candidate town names.
+    :param street: str: The street of the address.
+    :return: list: The towns whose words appear in the street as consecutive whole words.
+    """
+    if not isinstance(street, str):
+        return []
+    # Pad with spaces, so only whole words of the normalized street match
+    street_key = f" {gemeente_key(street)} "
+    return [town for town in towns if f" {gemeente_key(town)} " in street_key]
+
+
+def lookup_postcodes(postcodes, streets=None):
+    """
+    Look up the locations of many postcodes at once.
+
+    :param postcodes: iterable: The postcodes to look up.
+    :param streets: iterable: Optional streets of the addresses, in the same order.
+    :return: list: The name for every postcode, in the same order.
+    """
+    postcodes = list(postcodes)
+    # Each distinct postcode is only converted and looked up once
+    names = {postcode: lookup_postcode(postcode) for postcode in set(postcodes)}
+    result = [names[postcode] for postcode in postcodes]
+
+    # Go over the streets only for the postcodes shared by several towns
+    if streets is not None:
+        for index, (postcode, street) in enumerate(zip(postcodes, streets)):
+            if street and len(lookup_towns(postcode)) > 1:
+                result[index] = lookup_postcode(postcode, street)
+    return result
+
+
+def lookup_gemeente(name):
+    """
+    Look up a town by name, ignoring case, accents, punctuation and "St."/"Sint" spelling.
+
+    :param name: str: The town name as typed.
+    :return: tuple: (town, postcodes) or None if the town is not found.
+    """
+    if not isinstance(name, str):
+        return None
+    return get_table("gemeenteIndex").get(gemeente_key(name))
+
+
+def match_gemeente(name, min_score=GEMEENTE_MATCH_SCORE):
+    """
+    Look up a town by name, tolerating typos like "Gentt" or "Sint-Niklass".
+
+    Exact matches of lookup_gemeente score 1.0, other names are compared to the towns
+    sharing the most trigrams with them.
+
+    :param name: str: The town name as typed.
+    :param min_score: float: The lowest similarity (0 to 1) accepted as a match.
+    :return: tuple: ((town, postcodes), score) or None if no town is similar enough.
+    """
+    if not isinstance(name, str):
+        return None
+    key = gemeente_key(name)
+    if not key:
+        return None
+    gemeente_index = get_table("gemeenteIndex")
+    if key in gemeente_index:
+        return gemeente_index[key], 1.0
+
+    match = get_table("gemeenteTrigrams").best_match(key, min_score)
+    if match is None:
+        return None
+    matched_key, score = match
+    return gemeente_index[matched_key], score